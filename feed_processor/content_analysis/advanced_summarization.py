@@ -145,9 +145,15 @@ class AdvancedSummarizer:
         Returns:
             List of common themes
         """
-        # Get average TF-IDF scores across documents
-        avg_scores = np.mean(tfidf_matrix.toarray(), axis=0)
-        top_indices = np.argsort(avg_scores)[-num_themes:]
+        # Get average TF-IDF scores across documents, without densifying
+        avg_scores = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
+        # Select the top terms in linear time, then order only those
+        k = min(num_themes, avg_scores.size)
+        if k <= 0:
+            # argpartition(...)[-0:] would select every term
+            return []
+        top_indices = np.argpartition(avg_scores, -k)[-k:]
+        top_indices = top_indices[np.argsort(avg_scores[top_indices])]
         return feature_names[top_indices].tolist()
 
     def _generate_cross_references(
@@ -155,6 +161,9 @@ class AdvancedSummarizer:
     ) -> List[Dict[str, str]]:
         """Generate cross-references between documents.
 
+        All pairwise summary similarities come from one TF-IDF fit and a
+        single product of the L2-normalized matrix with its transpose.
+
         Args:
             documents: Original document texts
             summaries: Generated summaries for each document
@@ -162,22 +171,25 @@ class AdvancedSummarizer:
         Returns:
             List of cross-reference information
         """
+        n_docs = len(summaries)
+        if n_docs < 2:
+            return []
+
+        similarities = self._similarity_matrix([s.abstractive_summary for s in summaries])
+        related = (similarities > self.similarity_threshold) & ~np.eye(n_docs, dtype=bool)
+
         cross_refs = []
-        for i, (doc1, sum1) in enumerate(zip(documents, summaries)):
-            for j, (doc2, sum2) in enumerate(zip(documents, summaries)):
-                if i != j:
-                    similarity = self._calculate_similarity(
-                        sum1.abstractive_summary, sum2.abstractive_summary
-                    )
-                    if similarity > self.similarity_threshold:
-                        cross_refs.append(
-                            {
-                                "source_idx": i,
-                                "target_idx": j,
-                                "similarity": similarity,
-                                "shared_topics": list(set(sum1.key_points) & set(sum2.key_points)),
-                            }
-                        )
+        for i, j in zip(*np.nonzero(related)):
+            cross_refs.append(
+                {
+                    "source_idx": int(i),
+                    "target_idx": int(j),
+                    "similarity": float(similarities[i, j]),
+                    "shared_topics": list(
+                        set(summaries[i].key_points) & set(summaries[j].key_points)
+                    ),
+                }
+            )
         return cross_refs
 
     def _create_timeline(
@@ -224,6 +236,24 @@ class AdvancedSummarizer:
         seen = set()
         return [x for x in all_points if not (x in seen or seen.add(x))]
 
+    def _similarity_matrix(self, texts: List[str]) -> np.ndarray:
+        """Calculate pairwise similarities between texts using TF-IDF.
+
+        Args:
+            texts: Texts to compare
+
+        Returns:
+            Square matrix of similarity scores between 0 and 1
+        """
+        vectorizer = TfidfVectorizer(stop_words="english")
+        try:
+            tfidf = vectorizer.fit_transform(texts)
+        except ValueError:
+            # Empty vocabulary (e.g. only stop words)
+            return np.zeros((len(texts), len(texts)))
+        # Rows are L2-normalized by the vectorizer, so X @ X.T is cosine
+        return np.clip((tfidf @ tfidf.T).toarray(), 0.0, 1.0)
+
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts using TF-IDF.
 
@@ -234,9 +264,4 @@ class AdvancedSummarizer:
         Returns:
             Similarity score between 0 and 1
         """
-        # Create a new vectorizer for each comparison to ensure consistent vocabulary
-        vectorizer = TfidfVectorizer(stop_words="english")
-        tfidf = vectorizer.fit_transform([text1, text2])
-        # Normalize the similarity score to be between 0 and 1
-        similarity = (tfidf * tfidf.T).toarray()[0, 1]
-        return min(1.0, max(0.0, similarity))
+        return float(self._similarity_matrix([text1, text2])[0, 1])
@@ -2,8 +2,10 @@
 
 from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
+import numpy as np
 from prometheus_client import Counter, Histogram
 
 from .nlp_pipeline import NLPPipeline
@@ -19,6 +21,9 @@ categorization_errors = Counter(
     ["error_type"],
 )
 
+# Fixed category order; index i of a score vector belongs to CATEGORIES[i]
+CATEGORIES: Tuple[ContentCategory, ...] = tuple(ContentCategory)
+
 
 @dataclass
 class CategorizationResult:
@@ -26,23 +31,32 @@ class CategorizationResult:
 
     primary_category: ContentCategory
     secondary_categories: List[ContentCategory]
-    confidence_scores: Dict[ContentCategory, float]
+    scores: np.ndarray  # float32, aligned with CATEGORIES
     keywords: List[str]
     language: str
     readability_score: float
 
+    @property
+    def confidence_scores(self) -> Mapping[ContentCategory, float]:
+        """Read-only category -> score mapping built from ``scores``."""
+        return MappingProxyType(dict(zip(CATEGORIES, self.scores.tolist())))
+
 
 class ContentCategorizer:
     """Content categorizer using NLP and taxonomy."""
 
-    def __init__(self, nlp_model: str = "en_core_web_sm"):
+    def __init__(self, nlp_model: Optional[str] = None):
         """Initialize content categorizer.
 
         Args:
-            nlp_model: spaCy model to use
+            nlp_model: spaCy model to use (see NLPPipeline for the default)
         """
         self.nlp = NLPPipeline(nlp_model)
         self.taxonomy = CategoryTaxonomy()
+        # Keyword sets aligned with CATEGORIES, resolved once instead of per term
+        self._category_keywords = tuple(
+            self.taxonomy.get_category_keywords(category.value) for category in CATEGORIES
+        )
 
     @categorization_time.labels(operation="categorize").time()
     def categorize(self, text: str, title: str = "") -> CategorizationResult:
@@ -55,6 +69,10 @@ class ContentCategorizer:
         Returns:
             CategorizationResult with categories and confidence scores
         """
+        # Blank input carries no signal, so skip the NLP pipeline entirely
+        if not text.strip() and not title.strip():
+            return self._empty_result()
+
         try:
             # Process text through NLP pipeline
             nlp_result = self.nlp.process_text(text)
@@ -73,11 +91,10 @@ class ContentCategorizer:
                 noun_phrases=nlp_result.noun_phrases,
             )
 
-            # Get top categories
-            sorted_categories = sorted(category_scores.items(), key=lambda x: x[1], reverse=True)
-
-            primary_category = ContentCategory(sorted_categories[0][0])
-            secondary_categories = [ContentCategory(cat) for cat, _ in sorted_categories[1:3]]
+            # Rank categories; stable sort keeps enum order among ties
+            ranking = np.argsort(-category_scores, kind="stable")
+            primary_category = CATEGORIES[ranking[0]]
+            secondary_categories = [CATEGORIES[i] for i in ranking[1:3]]
 
             # Calculate readability score
             readability_score = self.nlp.get_readability_score(text)
@@ -85,9 +102,7 @@ class ContentCategorizer:
             return CategorizationResult(
                 primary_category=primary_category,
                 secondary_categories=secondary_categories,
-                confidence_scores={
-                    ContentCategory(cat): score for cat, score in category_scores.items()
-                },
+                scores=category_scores,
                 keywords=keywords[:10],  # Top 10 keywords
                 language=nlp_result.language,
                 readability_score=readability_score,
@@ -97,9 +112,26 @@ class ContentCategorizer:
             categorization_errors.labels(error_type=type(e).__name__).inc()
             raise
 
+    def _empty_result(self) -> CategorizationResult:
+        """Build the default result for blank input.
+
+        Mirrors what the full path yields when every category scores zero.
+
+        Returns:
+            CategorizationResult with zeroed confidence scores
+        """
+        return CategorizationResult(
+            primary_category=CATEGORIES[0],
+            secondary_categories=list(CATEGORIES[1:3]),
+            scores=np.zeros(len(CATEGORIES), dtype=np.float32),
+            keywords=[],
+            language="en",
+            readability_score=0.0,
+        )
+
     def _calculate_category_scores(
         self, keywords: List[str], entities: List[Dict[str, str]], noun_phrases: List[str]
-    ) -> Dict[str, float]:
+    ) -> np.ndarray:
         """Calculate confidence scores for each category.
 
         Args:
@@ -108,40 +140,29 @@ class ContentCategorizer:
             noun_phrases: Noun phrases
 
         Returns:
-            Dictionary of category scores
+            float32 array of scores aligned with CATEGORIES
         """
-        # Initialize scores
-        scores: Dict[str, float] = {cat.value: 0.0 for cat in ContentCategory}
-
         # Weight factors
         KEYWORD_WEIGHT = 1.0
         ENTITY_WEIGHT = 0.8
         NOUN_PHRASE_WEIGHT = 0.6
 
-        # Process keywords
-        for keyword in keywords:
-            for category in ContentCategory:
-                if keyword.lower() in self.taxonomy.get_category_keywords(category.value):
-                    scores[category.value] += KEYWORD_WEIGHT
-
-        # Process entities
-        for entity in entities:
-            entity_text = entity["text"].lower()
-            for category in ContentCategory:
-                if entity_text in self.taxonomy.get_category_keywords(category.value):
-                    scores[category.value] += ENTITY_WEIGHT
-
-        # Process noun phrases
-        for phrase in noun_phrases:
-            phrase_lower = phrase.lower()
-            for category in ContentCategory:
-                if phrase_lower in self.taxonomy.get_category_keywords(category.value):
-                    scores[category.value] += NOUN_PHRASE_WEIGHT
+        weighted_terms = (
+            [(keyword.lower(), KEYWORD_WEIGHT) for keyword in keywords]
+            + [(entity["text"].lower(), ENTITY_WEIGHT) for entity in entities]
+            + [(phrase.lower(), NOUN_PHRASE_WEIGHT) for phrase in noun_phrases]
+        )
+
+        scores = np.zeros(len(CATEGORIES), dtype=np.float32)
+        for index, category_keywords in enumerate(self._category_keywords):
+            scores[index] = sum(
+                weight for term, weight in weighted_terms if term in category_keywords
+            )
 
         # Normalize scores
-        max_score = max(scores.values()) if scores.values() else 1.0
+        max_score = scores.max()
         if max_score > 0:
-            scores = {cat: score / max_score for cat, score in scores.items()}
+            scores /= max_score
 
         return scores
 
@@ -1,11 +1,16 @@
 """NLP pipeline for content analysis."""
 
+import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import spacy
 from prometheus_client import Counter, Histogram
 
+# spaCy model used when none is passed explicitly; overridable via environment
+DEFAULT_NLP_MODEL = "en_core_web_sm"
+NLP_MODEL_ENV_VAR = "FEEDPROC_NLP_MODEL"
+
 # Metrics
 nlp_processing_time = Histogram(
     "content_nlp_processing_seconds",
@@ -32,12 +37,15 @@ class NLPResult:
 class NLPPipeline:
     """NLP pipeline for content processing."""
 
-    def __init__(self, model: str = "en_core_web_sm"):
+    def __init__(self, model: Optional[str] = None):
         """Initialize NLP pipeline.
 
         Args:
-            model: spaCy model to use
+            model: spaCy model to use. Defaults to ``$FEEDPROC_NLP_MODEL`` or
+                ``en_core_web_sm``.
         """
+        if model is None:
+            model = os.environ.get(NLP_MODEL_ENV_VAR, DEFAULT_NLP_MODEL)
         try:
             self.nlp = spacy.load(model)
         except OSError:
@@ -127,14 +135,10 @@ class NLPPipeline:
 
             # Basic implementation of Flesch Reading Ease
             total_sentences = len(list(doc.sents))
-            total_words = len([token for token in doc if not token.is_punct])
-            total_syllables = sum(
-                [
-                    len([char for char in token.text if char.lower() in "aeiou"])
-                    for token in doc
-                    if not token.is_punct
-                ]
-            )
+            total_words = sum(1 for token in doc if not token.is_punct)
+            # Vowels approximate syllables; str.count scans in C instead of per char
+            lowered = text.lower()
+            total_syllables = sum(lowered.count(vowel) for vowel in "aeiou")
 
             if total_sentences == 0 or total_words == 0:
                 return 0.0
@@ -193,9 +197,9 @@ class NLPPipeline:
                         score = word_freq[token.text.lower()]
 
                         # Boost score based on POS tag
-                        if token.pos_ in ["PROPN", "NOUN"]:
+                        if token.pos_ in {"PROPN", "NOUN"}:
                             score *= 1.5
-                        elif token.pos_ in ["VERB"]:
+                        elif token.pos_ == "VERB":
                             score *= 1.2
 
                         # Boost score if part of named entity
@@ -235,7 +239,7 @@ class NLPPipeline:
                     if token.is_alpha and not token.is_stop:
                         total_words += 1
                         # Use lexical attributes for basic sentiment
-                        if token.pos_ in ["ADJ", "VERB", "ADV"]:
+                        if token.pos_ in {"ADJ", "VERB", "ADV"}:
                             # This is a simplified approach - in production you'd want
                             # to use a proper sentiment lexicon
                             if token._.polarity > 0:
@@ -1,9 +1,12 @@
 """Content quality scoring system for feed content analysis."""
+import hashlib
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter as PrometheusCounter
+from prometheus_client import Histogram
 
 from .nlp_pipeline import NLPPipeline
 from .sentiment import SentimentAnalyzer
@@ -14,10 +17,13 @@ QUALITY_SCORE_HISTOGRAM = Histogram(
     "Distribution of content quality scores",
     buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
 )
-QUALITY_CHECK_ERRORS = Counter(
+QUALITY_CHECK_ERRORS = PrometheusCounter(
     "content_quality_check_errors", "Number of errors during quality checks", ["check_type"]
 )
 
+# Entity labels that mark checkable facts
+_FACT_ENTITY_LABELS = frozenset({"DATE", "GPE", "ORG", "MONEY", "PERCENT"})
+
 
 @dataclass
 class QualityMetrics:
@@ -35,7 +41,14 @@ class QualityMetrics:
 
 
 class ContentQualityScorer:
-    """Analyzes and scores content quality based on multiple dimensions."""
+    """Analyzes and scores content quality based on multiple dimensions.
+
+    Parsed documents are kept in a bounded LRU cache keyed by a hash of the
+    text, so re-scoring identical content skips the NLP pipeline.
+    """
+
+    # Maximum number of cached parsed documents
+    DOC_CACHE_SIZE = 1024
 
     def __init__(self, nlp_pipeline: NLPPipeline, sentiment_analyzer: SentimentAnalyzer):
         """Initialize the content quality scorer.
@@ -46,6 +59,25 @@ class ContentQualityScorer:
         """
         self.nlp = nlp_pipeline
         self.sentiment = sentiment_analyzer
+        self._doc_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop all cached parsed documents."""
+        self._doc_cache.clear()
+
+    def _parse(self, text: str):
+        """Parse text with the NLP pipeline, reusing the result for repeated text."""
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        doc = self._doc_cache.get(key)
+        if doc is not None:
+            self._doc_cache.move_to_end(key)
+            return doc
+
+        doc = self.nlp.process(text)
+        self._doc_cache[key] = doc
+        if len(self._doc_cache) > self.DOC_CACHE_SIZE:
+            self._doc_cache.popitem(last=False)
+        return doc
 
     def score_content(self, text: str) -> QualityMetrics:
         """Calculate comprehensive quality metrics for the given content.
@@ -58,7 +90,7 @@ class ContentQualityScorer:
         """
         try:
             # Basic text metrics
-            doc = self.nlp.process(text)
+            doc = self._parse(text)
             readability = self.nlp.calculate_readability(text)
 
             # Sentiment and emotional tone
@@ -78,7 +110,7 @@ class ContentQualityScorer:
             fact_density = self._calculate_fact_density(doc)
 
             # Quality flags for specific issues
-            quality_flags = self._identify_quality_issues(doc)
+            quality_flags = self._identify_quality_issues(doc, readability, sentiment_results)
 
             # Detailed metrics for transparency
             detailed_metrics = {
@@ -207,26 +239,20 @@ class ContentQualityScorer:
     def _calculate_fact_density(self, doc) -> float:
         """Calculate the density of factual information in the content."""
         try:
-            # Count named entities
-            named_entities = len(doc.ents)
-
-            # Count numerical information
-            numbers = len([token for token in doc if token.like_num])
-
-            # Count fact indicators (dates, locations, organizations)
-            fact_indicators = len(
-                [
-                    ent
-                    for ent in doc.ents
-                    if ent.label_ in ["DATE", "GPE", "ORG", "MONEY", "PERCENT"]
-                ]
-            )
-
             # Calculate density relative to content length
             total_tokens = len(doc)
             if total_tokens == 0:
                 return 0.0
 
+            # Count named entities and fact indicators (dates, locations,
+            # organizations); doc.ents builds a new tuple on every access
+            entities = doc.ents
+            named_entities = len(entities)
+            fact_indicators = sum(1 for ent in entities if ent.label_ in _FACT_ENTITY_LABELS)
+
+            # Count numerical information
+            numbers = sum(1 for token in doc if token.like_num)
+
             fact_score = (named_entities + numbers + fact_indicators) / total_tokens
             normalized_score = min(fact_score * 3, 1.0)  # Scale up but cap at 1.0
 
@@ -236,18 +262,28 @@ class ContentQualityScorer:
             QUALITY_CHECK_ERRORS.labels(check_type="fact_density").inc()
             return 0.5
 
-    def _identify_quality_issues(self, doc) -> List[str]:
-        """Identify potential quality issues in the content."""
+    def _identify_quality_issues(
+        self, doc, readability: Optional[float] = None, sentiment_results=None
+    ) -> List[str]:
+        """Identify potential quality issues in the content.
+
+        Args:
+            doc: Parsed document
+            readability: Readability score of the text, computed if not given
+            sentiment_results: Sentiment analysis of the text, computed if not given
+
+        Returns:
+            List of quality issue flags
+        """
         issues = []
 
         try:
             # Check for excessive repetition
-            word_freq = {}
-            for token in doc:
-                if token.is_alpha and not token.is_stop:
-                    word_freq[token.lower_] = word_freq.get(token.lower_, 0) + 1
-
-            max_freq = max(word_freq.values()) if word_freq else 0
+            word_freq = Counter(
+                token.lower_ for token in doc if token.is_alpha and not token.is_stop
+            )
+            most_common = word_freq.most_common(1)
+            max_freq = most_common[0][1] if most_common else 0
             if max_freq > len(doc) * 0.1:  # More than 10% repetition
                 issues.append("excessive_repetition")
 
@@ -265,11 +301,14 @@ class ContentQualityScorer:
                 issues.append("insufficient_length")
 
             # Check readability issues
-            if self.nlp.calculate_readability(doc.text) < 0.3:
+            if readability is None:
+                readability = self.nlp.calculate_readability(doc.text)
+            if readability < 0.3:
                 issues.append("low_readability")
 
             # Check sentiment extremes
-            sentiment_results = self.sentiment.analyze_text(doc.text)
+            if sentiment_results is None:
+                sentiment_results = self.sentiment.analyze_text(doc.text)
             if abs(sentiment_results.compound_score) > 0.8:
                 issues.append("extreme_sentiment")
 
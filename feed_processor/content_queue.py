@@ -1,9 +1,10 @@
 """Content queue module for managing feed items."""
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional
 
 import structlog
 
@@ -12,7 +13,7 @@ from .metrics.metrics import ITEMS_ADDED, ITEMS_REMOVED, QUEUE_OVERFLOWS, QUEUE_
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueItem:
     """Represents an item in the content queue."""
 
@@ -22,7 +23,11 @@ class QueueItem:
 
 
 class ContentQueue:
-    """A queue for managing feed content items."""
+    """A queue for managing feed content items.
+
+    Items are held in a deque guarded by a single asyncio lock so that
+    batches can be added and drained with one lock acquisition each.
+    """
 
     def __init__(self, max_size: int = 1000):
         """Initialize the content queue.
@@ -31,8 +36,9 @@ class ContentQueue:
             max_size: Maximum number of items allowed in the queue
         """
         self.max_size = max_size
-        self._queue = asyncio.Queue(maxsize=max_size)
-        self._size = 0
+        self._items: Deque[QueueItem] = deque()
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Event()
 
     async def add(self, item: QueueItem) -> bool:
         """Add an item to the queue.
@@ -44,58 +50,91 @@ class ContentQueue:
             bool: True if item was added successfully
         """
         try:
-            if self._size >= self.max_size:
-                QUEUE_OVERFLOWS.inc()
-                logger.warning(
-                    "Queue overflow",
-                    queue_size=self._size,
-                    max_size=self.max_size,
-                    item_id=item.id,
-                )
-                return False
-
-            await self._queue.put(item)
-            self._size += 1
-            ITEMS_ADDED.inc()
-            QUEUE_SIZE.set(self._size)
-            logger.debug("Item added to queue", item_id=item.id, queue_size=self._size)
-            return True
-
+            return await self.put_many([item]) == 1
         except Exception as e:
             logger.error("Error adding item to queue", error=str(e), item_id=item.id)
             return False
 
+    async def put_many(self, items: Iterable[QueueItem]) -> int:
+        """Add several items to the queue under a single lock acquisition.
+
+        Items that do not fit in the remaining capacity are dropped and
+        counted as overflows.
+
+        Args:
+            items: Items to add to the queue
+
+        Returns:
+            int: Number of items added
+        """
+        items = list(items)
+        async with self._lock:
+            accepted = items[: max(self.max_size - len(self._items), 0)]
+            self._items.extend(accepted)
+            if self._items:
+                self._not_empty.set()
+            size = len(self._items)
+
+        dropped = len(items) - len(accepted)
+        if dropped:
+            QUEUE_OVERFLOWS.inc(dropped)
+            logger.warning(
+                "Queue overflow",
+                queue_size=size,
+                max_size=self.max_size,
+                dropped=dropped,
+                item_id=items[len(accepted)].id,
+            )
+        if accepted:
+            ITEMS_ADDED.inc(len(accepted))
+            QUEUE_SIZE.set(size)
+            logger.debug("Items added to queue", count=len(accepted), queue_size=size)
+        return len(accepted)
+
     async def get(self) -> Optional[QueueItem]:
-        """Get the next item from the queue.
+        """Get the next item from the queue, waiting until one is available.
 
         Returns:
-            Optional[QueueItem]: Next item from the queue or None if queue is empty
+            Optional[QueueItem]: Next item from the queue or None on error
         """
         try:
-            item = await self._queue.get()
-            self._size -= 1
-            ITEMS_REMOVED.inc()
-            QUEUE_SIZE.set(self._size)
-            logger.debug("Item removed from queue", item_id=item.id, queue_size=self._size)
-            return item
-
-        except asyncio.QueueEmpty:
-            return None
+            while True:
+                batch = await self.get_batch(1)
+                if batch:
+                    return batch[0]
+                await self._not_empty.wait()
         except Exception as e:
             logger.error("Error getting item from queue", error=str(e))
             return None
 
+    async def get_batch(self, max_n: int) -> List[QueueItem]:
+        """Remove up to ``max_n`` items under a single lock acquisition.
+
+        Does not wait for items to arrive.
+
+        Args:
+            max_n: Maximum number of items to return
+
+        Returns:
+            List[QueueItem]: Items in FIFO order; empty if the queue is empty
+        """
+        async with self._lock:
+            batch = [self._items.popleft() for _ in range(min(max_n, len(self._items)))]
+            if not self._items:
+                self._not_empty.clear()
+            size = len(self._items)
+
+        if batch:
+            ITEMS_REMOVED.inc(len(batch))
+            QUEUE_SIZE.set(size)
+            logger.debug("Items removed from queue", count=len(batch), queue_size=size)
+        return batch
+
     def clear(self):
         """Clear all items from the queue."""
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-                self._size -= 1
-                ITEMS_REMOVED.inc()
-            except asyncio.QueueEmpty:
-                break
-
-        self._size = 0
+        ITEMS_REMOVED.inc(len(self._items))
+        self._items.clear()
+        self._not_empty.clear()
         QUEUE_SIZE.set(0)
         logger.info("Queue cleared")
 
@@ -105,7 +144,7 @@ class ContentQueue:
         Returns:
             bool: True if the queue is empty
         """
-        return self._queue.empty()
+        return not self._items
 
     def qsize(self) -> int:
         """Get the current size of the queue.
@@ -113,7 +152,7 @@ class ContentQueue:
         Returns:
             int: Current size of the queue
         """
-        return self._size
+        return len(self._items)
 
     @property
     def size(self) -> int:
@@ -122,7 +161,7 @@ class ContentQueue:
         Returns:
             int: Current queue size
         """
-        return self._size
+        return len(self._items)
 
     def __len__(self) -> int:
         """Get the current size of the queue.
@@ -130,4 +169,4 @@ class ContentQueue:
         Returns:
             int: Current queue size
         """
-        return self._size
+        return len(self._items)
@@ -82,12 +82,26 @@ class FeedCollector:
         finally:
             self.running = False
             self.collector_running.set(0)
+            # The client keeps one pooled session for the whole run
+            await self.client.close()
+            await asyncio.to_thread(self.storage.close)
 
     def stop(self):
         """Stop the feed collection process."""
         logger.info("Stopping feed collector")
         self.running = False
 
+    async def __aenter__(self) -> "FeedCollector":
+        """Enter a collection context; the client session is opened on first use."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Stop collecting and close the client session and the storage."""
+        self.stop()
+        await self.client.close()
+        # Closing commits buffered errors and optimizes the database; keep it off the loop
+        await asyncio.to_thread(self.storage.close)
+
     async def collect_feeds(self, continuation: Optional[str] = None):
         """Collect feeds from Inoreader.
 
@@ -96,6 +110,7 @@ class FeedCollector:
         """
         items = await self.client.get_stream_contents(continuation)
 
+        content_items = []
         for raw_item in items:
             try:
                 # Extract URL and detect content type
@@ -115,19 +130,40 @@ class FeedCollector:
                         tags=[tag["label"] for tag in raw_item.get("tags", [])],
                     ),
                 )
-
-                if not self.storage.is_duplicate(str(item.sourceMetadata.originalUrl)):
-                    if self.storage.store_item(item):
-                        self.items_total.labels(status="success").inc()
-                        logger.debug("Stored item", url=url)
-                    else:
-                        self.items_total.labels(status="error").inc()
-                        logger.error("Failed to store item", url=url)
-                else:
-                    self.items_total.labels(status="duplicate").inc()
-                    logger.debug("Skipped duplicate item", url=url)
+                content_items.append(item)
             except Exception as e:
                 logger.error(
                     "Error processing item", error=str(e), item_id=raw_item.get("id", "unknown")
                 )
                 self.storage.log_error("item_processing_error", str(e))
+
+        if not content_items:
+            return
+
+        try:
+            # One duplicate lookup and one bulk insert per page, off the event loop
+            existing = await asyncio.to_thread(
+                self.storage.filter_duplicates,
+                [str(item.sourceMetadata.originalUrl) for item in content_items],
+            )
+            new_items = [
+                item
+                for item in content_items
+                if str(item.sourceMetadata.originalUrl) not in existing
+            ]
+            if new_items:
+                stored = await asyncio.to_thread(self.storage.store_items, new_items)
+                self.items_total.labels(status="success").inc(stored)
+                logger.debug("Stored items", count=stored)
+            else:
+                stored = 0
+
+            # store_items skips URLs another writer stored after the lookup, so
+            # they are duplicates too; storage failures raise instead
+            duplicates = len(content_items) - stored
+            if duplicates:
+                self.items_total.labels(status="duplicate").inc(duplicates)
+                logger.debug("Skipped duplicate items", count=duplicates)
+        except Exception as e:
+            logger.error("Error storing items", error=str(e), count=len(content_items))
+            self.storage.log_error("item_processing_error", str(e))
@@ -3,14 +3,15 @@
 import multiprocessing
 import os
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional, Tuple
 
 import numpy as np
 import psutil
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """System performance metrics."""
 
@@ -20,7 +21,7 @@ class SystemMetrics:
     io_wait: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingMetrics:
     """Processing performance metrics."""
 
@@ -40,6 +41,7 @@ class PerformanceOptimizer:
         max_batch_size: int = 500,
         target_cpu_usage: float = 70.0,
         history_window: int = 10,
+        metrics_ttl: float = 0.5,
     ):
         """Initialize the performance optimizer.
 
@@ -49,24 +51,43 @@ class PerformanceOptimizer:
             max_batch_size: Maximum allowed batch size
             target_cpu_usage: Target CPU usage percentage
             history_window: Number of metrics to keep for trending
+            metrics_ttl: Seconds a system metrics sample is reused for
         """
         self.base_batch_size = base_batch_size
         self.min_batch_size = min_batch_size
         self.max_batch_size = max_batch_size
         self.target_cpu_usage = target_cpu_usage
         self.history_window = history_window
-        self.processing_history: List[ProcessingMetrics] = []
+        self.processing_history: Deque[ProcessingMetrics] = deque(maxlen=history_window)
+        self.cpu_count = multiprocessing.cpu_count()
+        self.metrics_ttl = metrics_ttl
+        self._metrics_cache: Optional[Tuple[float, SystemMetrics]] = None
+
+        # CPU percentages are measured since the previous call; prime them so
+        # the first non-blocking sample is meaningful
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_times_percent(interval=None)
 
     def get_system_metrics(self) -> SystemMetrics:
-        """Get current system performance metrics."""
-        cpu_usage = psutil.cpu_percent(interval=1)
+        """Get current system performance metrics.
+
+        Samples are non-blocking and reused for ``metrics_ttl`` seconds, so
+        frequent parameter adjustments do not repeat the system calls.
+        """
+        now = time.monotonic()
+        if self._metrics_cache is not None and now - self._metrics_cache[0] < self.metrics_ttl:
+            return self._metrics_cache[1]
+
+        cpu_usage = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         load_avg = os.getloadavg()[0]
-        io_wait = psutil.cpu_times_percent().iowait
+        io_wait = psutil.cpu_times_percent(interval=None).iowait
 
-        return SystemMetrics(
+        metrics = SystemMetrics(
             cpu_usage=cpu_usage, memory_usage=memory.percent, load_average=load_avg, io_wait=io_wait
         )
+        self._metrics_cache = (now, metrics)
+        return metrics
 
     def calculate_optimal_batch_size(
         self, system_metrics: SystemMetrics, processing_metrics: ProcessingMetrics
@@ -80,10 +101,8 @@ class PerformanceOptimizer:
         Returns:
             Optimal batch size
         """
-        # Store metrics history
+        # Store metrics history; the bounded deque drops the oldest entry
         self.processing_history.append(processing_metrics)
-        if len(self.processing_history) > self.history_window:
-            self.processing_history.pop(0)
 
         # Calculate adjustment factors
         cpu_factor = 1.0 + (self.target_cpu_usage - system_metrics.cpu_usage) / 100
@@ -113,7 +132,7 @@ class PerformanceOptimizer:
         Returns:
             Optimal thread count
         """
-        cpu_count = multiprocessing.cpu_count()
+        cpu_count = self.cpu_count
 
         # Base thread count on CPU cores and load
         if system_metrics.cpu_usage > 90:
@@ -16,7 +16,7 @@ from feed_processor.queues.content import ContentQueue, QueuedContent
 from feed_processor.webhook.manager import WebhookManager, WebhookResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingMetrics:
     """Represents processing metrics for the feed processor."""
 
@@ -58,15 +58,25 @@ class RateLimiter:
         self.max_retries = max_retries
         self.last_request = 0.0
         self._lock = threading.Lock()
+        # Monotonic-clock slot of the most recent request, in nanoseconds
+        self._last_ns = time.monotonic_ns() - int(min_interval * 1_000_000_000)
 
     def wait(self):
-        """Wait for the minimum interval before making the next request."""
+        """Wait for the minimum interval before making the next request.
+
+        Each caller reserves the next free slot with integer arithmetic on
+        the monotonic clock while holding the lock, then sleeps without it,
+        so concurrent callers are spaced ``min_interval`` apart and wall-clock
+        adjustments cannot shorten or stretch the wait.
+        """
+        interval_ns = int(self.min_interval * 1_000_000_000)
         with self._lock:
-            now = time.time()
-            elapsed = now - self.last_request
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-            self.last_request = time.time()
+            now = time.monotonic_ns()
+            target = max(now, self._last_ns + interval_ns)
+            self._last_ns = target
+        if target > now:
+            time.sleep((target - now) / 1_000_000_000)
+        self.last_request = time.time()
 
     def exponential_backoff(self, attempt: int):
         """Perform exponential backoff with jitter.
@@ -19,21 +19,25 @@ class RateLimiter:
         self.max_retries = max_retries
         self.last_request: float = 0
         self._lock = threading.Lock()
+        # Monotonic-clock slot of the most recent request, in nanoseconds
+        self._last_ns = time.monotonic_ns() - int(min_interval * 1_000_000_000)
 
     def wait(self) -> None:
         """
         Blocks until enough time has passed since the last request.
-        Thread-safe implementation using a lock.
+        Thread-safe: each caller reserves the next free slot on the monotonic
+        clock under the lock, then sleeps without holding it.
         """
+        interval_ns = int(self.min_interval * 1_000_000_000)
         with self._lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request
+            now = time.monotonic_ns()
+            target = max(now, self._last_ns + interval_ns)
+            self._last_ns = target
 
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                time.sleep(sleep_time)
+        if target > now:
+            time.sleep((target - now) / 1_000_000_000)
 
-            self.last_request = time.time()
+        self.last_request = time.time()
 
     def exponential_backoff(self, attempt: int) -> None:
         """
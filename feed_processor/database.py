@@ -2,14 +2,35 @@
 
 import os
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
+class Transaction:
+    """Handle for a savepoint opened by Database.transaction."""
+
+    def __init__(self, conn: sqlite3.Connection, name: str):
+        """Initialize the transaction handle.
+
+        Args:
+            conn: Connection the savepoint was opened on
+            name: Savepoint name
+        """
+        self._conn = conn
+        self.name = name
+        self.rolled_back = False
+
+    def rollback(self):
+        """Undo every change made since the savepoint was opened."""
+        self._conn.execute(f"ROLLBACK TO SAVEPOINT {self.name}")
+        self.rolled_back = True
+
+
 class Database:
     """SQLite database for storing feed items."""
 
@@ -17,14 +38,71 @@ class Database:
         """Initialize database connection.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or ":memory:" for a private
+                in-memory database held on a single connection
         """
         self.db_path = db_path
+        # An in-memory database only lives as long as its connection
+        self._conn: Optional[sqlite3.Connection] = (
+            sqlite3.connect(db_path) if db_path == ":memory:" else None
+        )
+        self._savepoint_depth = 0
         self._ensure_tables()
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Get the shared connection, or open one for the database file.
+
+        Work on the shared connection runs under its own savepoint, so a
+        call that fails part way leaves no changes behind for a later commit.
+        """
+        if self._conn is not None:
+            with self.transaction():
+                yield self._conn
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            yield conn
+
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit unless the work belongs to an open transaction."""
+        if self._savepoint_depth == 0:
+            conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """Group database calls under a savepoint.
+
+        All calls made inside the block share one connection. Changes are
+        kept when the block exits unless Transaction.rollback was called or
+        an exception escaped. Transactions may be nested.
+
+        Yields:
+            Transaction: Handle that can roll the savepoint back
+        """
+        opened = self._conn is None
+        if opened:
+            self._conn = sqlite3.connect(self.db_path)
+        conn = self._conn
+        tx = Transaction(conn, f"sp_{self._savepoint_depth}")
+        conn.execute(f"SAVEPOINT {tx.name}")
+        self._savepoint_depth += 1
+        try:
+            yield tx
+        except BaseException:
+            tx.rollback()
+            raise
+        finally:
+            self._savepoint_depth -= 1
+            conn.execute(f"RELEASE SAVEPOINT {tx.name}")
+            if self._savepoint_depth == 0:
+                conn.commit()
+            if opened:
+                self._conn = None
+                conn.close()
+
     def _ensure_tables(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Create feeds table
@@ -65,7 +143,7 @@ class Database:
             """
             )
 
-            conn.commit()
+            self._commit(conn)
 
     def add_feed(self, feed_data: Dict) -> bool:
         """Add a feed item to the database.
@@ -77,7 +155,7 @@ class Database:
             bool: True if feed was added successfully
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Insert feed
@@ -119,7 +197,7 @@ class Database:
                         (feed_data["id"], tag_id),
                     )
 
-                conn.commit()
+                self._commit(conn)
                 return True
 
         except Exception as e:
@@ -137,7 +215,7 @@ class Database:
             List[Dict]: List of feed items
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -182,7 +260,7 @@ class Database:
             Optional[Dict]: Feed item if found, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
@@ -25,6 +25,8 @@ class InoreaderConfig(BaseModel):
     base_url: HttpUrl = "https://www.inoreader.com/reader/api/0"
     max_retries: int = 3
     rate_limit: int = 50  # requests per minute
+    max_connections: int = 32
+    keepalive_timeout: float = 60.0  # seconds
 
 
 class InoreaderClient:
@@ -62,7 +64,12 @@ class InoreaderClient:
                 "Accept": "application/json",
             }
             logger.debug("Request headers", headers=headers)
-            self.session = aiohttp.ClientSession(headers=headers)
+            # Pooled keep-alive connections are reused across polls
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                keepalive_timeout=self.config.keepalive_timeout,
+            )
+            self.session = aiohttp.ClientSession(headers=headers, connector=connector)
 
     async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None):
         """Make a request to the Inoreader API."""
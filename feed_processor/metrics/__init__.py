@@ -4,10 +4,19 @@ This module provides metrics tracking functionality using Prometheus client,
 with support for various metric types like counters, gauges, and histograms.
 """
 
+import collections
 import os
+import random
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
 
 from .performance import track_performance
@@ -61,12 +70,180 @@ QUEUE_OVERFLOWS = Metric(
 )
 
 
+# Series key: metric name plus its sorted label pairs
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# Labels applied to every series written in the current context
+_LABELS: ContextVar[Mapping[str, str]] = ContextVar("metric_labels", default=MappingProxyType({}))
+
+
+@dataclass
+class MetricValue:
+    """Point-in-time value of a counter or gauge series."""
+
+    value: float
+    last_updated: Optional[datetime]
+
+
+@dataclass
+class HistogramValue:
+    """Point-in-time summary of a histogram series."""
+
+    count: int
+    sum: float
+    min: Optional[float]
+    max: Optional[float]
+    last_updated: Optional[datetime]
+    sum_sq: float = 0.0
+
+    @property
+    def average(self) -> float:
+        """Mean of the recorded values, or 0.0 if none were recorded."""
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Population standard deviation of the recorded values."""
+        if not self.count:
+            return 0.0
+        mean = self.sum / self.count
+        return max(self.sum_sq / self.count - mean * mean, 0.0) ** 0.5
+
+
+class _HistogramSeries:
+    """Running statistics for one histogram series.
+
+    ``stats`` holds ``[count, sum, min, max, sum_sq]`` so memory per series
+    is constant regardless of how many values are recorded. A fixed-size
+    reservoir sample of the values backs quantile estimates.
+    """
+
+    RESERVOIR_SIZE = 1024
+
+    __slots__ = ("stats", "reservoir", "last_updated")
+
+    def __init__(self):
+        self.stats = np.array([0.0, 0.0, np.inf, -np.inf, 0.0])
+        self.reservoir: Optional[np.ndarray] = None
+        self.last_updated: Optional[datetime] = None
+
+    def add(self, value: float, now: datetime) -> None:
+        """Record a value."""
+        stats = self.stats
+        count = int(stats[0])
+        if self.reservoir is None:
+            self.reservoir = np.empty(self.RESERVOIR_SIZE)
+        if count < self.RESERVOIR_SIZE:
+            self.reservoir[count] = value
+        else:
+            slot = random.randrange(count + 1)
+            if slot < self.RESERVOIR_SIZE:
+                self.reservoir[slot] = value
+        stats[0] = count + 1
+        stats[1] += value
+        stats[2] = min(stats[2], value)
+        stats[3] = max(stats[3], value)
+        stats[4] += value * value
+        self.last_updated = now
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile from the reservoir, or None if empty."""
+        filled = min(int(self.stats[0]), self.RESERVOIR_SIZE)
+        if not filled:
+            return None
+        return float(np.quantile(self.reservoir[:filled], q))
+
+    def view(self) -> HistogramValue:
+        """Get a point-in-time summary of the series."""
+        count, total, low, high, sum_sq = self.stats.tolist()
+        if not count:
+            return HistogramValue(0, 0.0, None, None, self.last_updated)
+        return HistogramValue(int(count), total, low, high, self.last_updated, sum_sq)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the snapshot entry for the series."""
+        count, total, low, high, _ = self.stats.tolist()
+        if not count:
+            return {
+                "count": 0,
+                "average": 0.0,
+                "min": None,
+                "max": None,
+                "last_updated": self.last_updated,
+            }
+        return {
+            "count": int(count),
+            "average": total / count,
+            "min": low,
+            "max": high,
+            "last_updated": self.last_updated,
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        self.stats[:] = [0.0, 0.0, np.inf, -np.inf, 0.0]
+        self.last_updated = None
+
+
+class _ThreadTally:
+    """Counter increments made by one thread, not yet folded into the collector.
+
+    Only the owning thread writes ``counts`` and ``stamps``; ``merged`` is
+    only touched by the collector while holding its lock.
+    """
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.counts: collections.Counter = collections.Counter()
+        self.stamps: Dict[SeriesKey, datetime] = {}
+        self.merged: Dict[SeriesKey, float] = {}
+
+
 class MetricsCollector:
-    """Collects and manages metrics for feed processing system."""
+    """Collects and manages metrics for feed processing system.
+
+    Series are stored in three flat dicts (counters, gauges, histograms)
+    keyed by ``(name, sorted label pairs)``. Counter and gauge series hold
+    ``[value, last_updated]``; histogram series are _HistogramSeries with
+    constant-size running statistics.
+
+    Counter increments are lock-free: each thread accumulates into its own
+    tally, and tallies are folded into the shared series whenever metrics
+    are read.
+    """
+
+    # Metric names used across the pipeline, typed up front so misuse
+    # (e.g. incrementing a gauge) is rejected on first write
+    WELL_KNOWN_METRICS = {
+        "items_processed": MetricType.COUNTER,
+        "errors": MetricType.COUNTER,
+        "webhook_retries": MetricType.COUNTER,
+        "rate_limit_hits": MetricType.COUNTER,
+        "queue_overflow": MetricType.COUNTER,
+        "queue_size": MetricType.GAUGE,
+        "queue_items": MetricType.GAUGE,
+        "rate_limit_delay": MetricType.GAUGE,
+        "processing_time": MetricType.HISTOGRAM,
+        "webhook_duration": MetricType.HISTOGRAM,
+        "webhook_payload_size": MetricType.HISTOGRAM,
+    }
 
     def __init__(self):
         """Initialize metrics collector with default values."""
         self.metrics = {}
+        self._types: Dict[str, MetricType] = dict(self.WELL_KNOWN_METRICS)
+        self._counters: Dict[SeriesKey, list] = {}
+        self._gauges: Dict[SeriesKey, list] = {}
+        self._histograms: Dict[SeriesKey, _HistogramSeries] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tallies: List[_ThreadTally] = []
+        # batch_update operation name -> bound update method
+        self._dispatch: Dict[str, Callable[[str, float], None]] = {
+            "increment": self.increment,
+            "gauge": self.set_gauge,
+            "record": self.record,
+        }
 
     def register_metric(
         self, name: str, type: MetricType, description: str, labels: Optional[List[str]] = None
@@ -74,8 +251,265 @@ class MetricsCollector:
         """Register a new metric."""
         metric = Metric(name, type, description, labels)
         self.metrics[name] = metric
+        self._types[name] = type
         return metric
 
+    @contextmanager
+    def labels(self, **labels: str) -> Iterator[None]:
+        """Apply labels to every series used in the block.
+
+        Labels are held in a context variable, so they follow the current
+        thread or asyncio task and nest, inner values winning. Labels passed
+        explicitly to a call take precedence over contextual ones.
+
+        Args:
+            **labels: Label values to apply
+        """
+        token = _LABELS.set({**_LABELS.get(), **labels})
+        try:
+            yield
+        finally:
+            _LABELS.reset(token)
+
+    @staticmethod
+    def _key(name: str, labels: Optional[Dict[str, str]]) -> SeriesKey:
+        """Build the series key for a metric name, contextual labels and label set."""
+        context = _LABELS.get()
+        if context:
+            labels = {**context, **labels} if labels else context
+        return (name, tuple(sorted(labels.items())) if labels else ())
+
+    def _check_type(self, name: str, type: MetricType) -> None:
+        """Bind a metric name to a type, rejecting use as a different type.
+
+        Raises:
+            ValueError: If the name is already bound to another type
+        """
+        existing = self._types.setdefault(name, type)
+        if existing is not type:
+            raise ValueError(
+                f"Metric {name} is a {existing.name.lower()}, not a {type.name.lower()}"
+            )
+
+    def increment(
+        self, name: str, value: float = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+            labels: Optional label values identifying the series
+
+        Raises:
+            ValueError: If the name belongs to a non-counter metric
+        """
+        self._check_type(name, MetricType.COUNTER)
+        key = self._key(name, labels)
+        tally = getattr(self._local, "tally", None)
+        if tally is None:
+            tally = self._local.tally = _ThreadTally()
+            with self._lock:
+                self._tallies.append(tally)
+        tally.counts[key] += value
+        tally.stamps[key] = datetime.now(timezone.utc)
+
+    def _flush_locals(self) -> None:
+        """Fold per-thread counter tallies into the shared counter series.
+
+        Tallies are cumulative and never modified here; the portion already
+        folded in is tracked in ``merged`` so each increment counts once.
+        Tallies of finished threads are dropped once folded. Must be called
+        with ``self._lock`` held.
+        """
+        live = []
+        for tally in self._tallies:
+            alive = tally.thread.is_alive()
+            counts = dict.copy(tally.counts)
+            stamps = dict.copy(tally.stamps)
+            for key, total in counts.items():
+                delta = total - tally.merged.get(key, 0)
+                series = self._counters.get(key)
+                if series is None:
+                    self._counters[key] = [delta, stamps.get(key)]
+                elif delta:
+                    series[0] += delta
+                    series[1] = stamps.get(key, series[1])
+            tally.merged = counts
+            if alive:
+                live.append(tally)
+        self._tallies = live
+
+    def decrement(
+        self, name: str, value: float = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Decrement a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to subtract
+            labels: Optional label values identifying the series
+        """
+        self.increment(name, -value, labels)
+
+    def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """Set a gauge to a value.
+
+        Args:
+            name: Gauge name
+            value: New value
+            labels: Optional label values identifying the series
+
+        Raises:
+            ValueError: If the name belongs to a non-gauge metric
+        """
+        self._check_type(name, MetricType.GAUGE)
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = [value, datetime.now(timezone.utc)]
+
+    def record(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """Record an observation in a histogram.
+
+        Args:
+            name: Histogram name
+            value: Observed value
+            labels: Optional label values identifying the series
+
+        Raises:
+            ValueError: If the name belongs to a non-histogram metric
+        """
+        self._check_type(name, MetricType.HISTOGRAM)
+        key = self._key(name, labels)
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = _HistogramSeries()
+            series.add(value, now)
+
+    def batch_update(
+        self,
+        updates: Union[
+            Mapping[str, Tuple[str, float]],
+            Iterable[Tuple[Callable[[str, float], None], str, float]],
+        ],
+    ) -> None:
+        """Apply several metric updates.
+
+        Args:
+            updates: Mapping of metric name to ``(operation, value)`` where
+                operation is ``"increment"``, ``"gauge"`` or ``"record"``; or
+                an iterable of pre-resolved ``(method, name, value)`` tuples,
+                e.g. ``(collector.increment, "errors", 1)``
+
+        Raises:
+            ValueError: If an operation is unknown
+        """
+        if not isinstance(updates, Mapping):
+            for update, name, value in updates:
+                update(name, value)
+            return
+
+        dispatch = self._dispatch
+        for name, (op, value) in updates.items():
+            update = dispatch.get(op)
+            if update is None:
+                raise ValueError(f"Unknown metric operation: {op}")
+            update(name, value)
+
+    def get_metric(
+        self, name: str, labels: Optional[Dict[str, str]] = None
+    ) -> Union[MetricValue, HistogramValue]:
+        """Get the current value of a metric series.
+
+        Args:
+            name: Metric name
+            labels: Optional label values identifying the series
+
+        Returns:
+            MetricValue for counters and gauges, HistogramValue for histograms
+
+        Raises:
+            KeyError: If the series has never been written
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._flush_locals()
+            if key in self._counters:
+                return MetricValue(*self._counters[key])
+            if key in self._gauges:
+                return MetricValue(*self._gauges[key])
+            if key in self._histograms:
+                return self._histograms[key].view()
+        raise KeyError(f"Metric {name} with labels {labels or {}} not found")
+
+    def get_quantile(
+        self, name: str, q: float, labels: Optional[Dict[str, str]] = None
+    ) -> Optional[float]:
+        """Estimate a quantile of a histogram series.
+
+        Estimates come from a reservoir sample of up to
+        _HistogramSeries.RESERVOIR_SIZE values.
+
+        Args:
+            name: Histogram name
+            q: Quantile in [0, 1]
+            labels: Optional label values identifying the series
+
+        Returns:
+            Estimated quantile, or None if no values were recorded
+
+        Raises:
+            KeyError: If the series has never been written
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            if key not in self._histograms:
+                raise KeyError(f"Histogram {name} with labels {labels or {}} not found")
+            return self._histograms[key].quantile(q)
+
+    def get_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Capture the current state of all series.
+
+        Unlabeled series are keyed by metric name, labeled series by
+        ``name{label=value,...}``.
+
+        Returns:
+            Mapping of series name to its values
+        """
+        name = self._series_name
+        with self._lock:
+            self._flush_locals()
+            snapshot = {
+                name(key): {"value": value, "last_updated": last_updated}
+                for series in (self._counters, self._gauges)
+                for key, (value, last_updated) in series.items()
+            }
+            snapshot.update(
+                {name(key): series.as_dict() for key, series in self._histograms.items()}
+            )
+        return snapshot
+
+    @staticmethod
+    def _series_name(key: SeriesKey) -> str:
+        """Render a series key as ``name`` or ``name{label=value,...}``."""
+        name, labels = key
+        if not labels:
+            return name
+        return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+    def reset(self) -> None:
+        """Reset every series to its initial value, keeping the series."""
+        with self._lock:
+            self._flush_locals()
+            for series in self._counters.values():
+                series[:] = [0, None]
+            for series in self._gauges.values():
+                series[:] = [0, None]
+            for series in self._histograms.values():
+                series.reset()
+
 
 class CacheMetrics:
     """Metrics for content cache performance and behavior.
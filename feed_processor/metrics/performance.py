@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import wraps
 from time import perf_counter
@@ -27,7 +27,7 @@ def track_performance(func):
     return wrapper
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingMetrics:
     """Metrics for tracking feed processing performance."""
 
@@ -36,6 +36,9 @@ class ProcessingMetrics:
     queue_length: int = 0
     start_time: datetime = datetime.now(timezone.utc)
     last_process_time: float = 0.0
+    # (processed_count, error_count) the memoized success rate was computed for
+    _rate_key: tuple = field(default=(0, 0), init=False, repr=False, compare=False)
+    _rate: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def increment_processed(self) -> None:
         """Increment the count of successfully processed items."""
@@ -55,11 +58,17 @@ class ProcessingMetrics:
 
     @property
     def success_rate(self) -> float:
-        """Calculate the success rate of processing."""
-        total = self.processed_count + self.error_count
-        if total == 0:
-            return 0.0
-        return (self.processed_count / total) * 100
+        """Calculate the success rate of processing.
+
+        The rate is memoized against the counters it was computed from, so
+        repeated reads between increments skip the division.
+        """
+        key = (self.processed_count, self.error_count)
+        if key != self._rate_key:
+            total = key[0] + key[1]
+            self._rate = 0.0 if total == 0 else 100.0 * key[0] / total
+            self._rate_key = key
+        return self._rate
 
     @property
     def processing_duration(self) -> float:
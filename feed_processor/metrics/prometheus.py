@@ -50,8 +50,8 @@ class MetricsRegistry:
         self._metrics[name] = histogram
         return histogram
 
-    def increment_counter(self, name: str, labels: Dict[str, str] = None):
-        """Increment a counter metric."""
+    def increment_counter(self, name: str, labels: Dict[str, str] = None, value: float = 1):
+        """Increment a counter metric by ``value``."""
         if name not in self._metrics:
             raise ValueError(f"Metric {name} not registered")
 
@@ -60,9 +60,9 @@ class MetricsRegistry:
             raise ValueError(f"Metric {name} is not a counter")
 
         if labels:
-            metric.labels(**labels).inc()
+            metric.labels(**labels).inc(value)
         else:
-            metric.inc()
+            metric.inc(value)
 
     def observe_histogram(self, name: str, value: float, labels: Dict[str, str] = None):
         """Observe a value for a histogram metric."""
@@ -78,6 +78,20 @@ class MetricsRegistry:
         else:
             metric.observe(value)
 
+    def set_gauge(self, name: str, value: float, labels: Dict[str, str] = None):
+        """Set the value of a gauge metric."""
+        if name not in self._metrics:
+            raise ValueError(f"Metric {name} not registered")
+
+        metric = self._metrics[name]
+        if not isinstance(metric, Gauge):
+            raise ValueError(f"Metric {name} is not a gauge")
+
+        if labels:
+            metric.labels(**labels).set(value)
+        else:
+            metric.set(value)
+
     def get_metric(self, name: str) -> Any:
         """Get a registered metric by name."""
         return self._metrics.get(name)
@@ -19,6 +19,9 @@ from ..notifications import NotificationConfig, NotificationEvent, NotificationL
 
 logger = structlog.get_logger(__name__)
 
+# Airtable accepts at most this many records per create request
+AIRTABLE_MAX_RECORDS_PER_REQUEST = 10
+
 
 class InoreaderToAirtablePipeline:
     """Pipeline to fetch from Inoreader and store in Airtable with monitoring."""
@@ -30,6 +33,7 @@ class InoreaderToAirtablePipeline:
         content_queue: Optional[ContentQueue] = None,
         batch_size: int = 50,
         notifier: Optional[Notifier] = None,
+        store_concurrency: int = 5,
     ):
         """Initialize the pipeline.
 
@@ -39,11 +43,13 @@ class InoreaderToAirtablePipeline:
             content_queue: Optional custom content queue
             batch_size: Number of items to process in each batch
             notifier: Optional notifier for error alerts
+            store_concurrency: Maximum concurrent Airtable create requests
         """
         self.inoreader_client = inoreader_client
         self.airtable_client = airtable_client
         self.content_queue = content_queue or ContentQueue()
         self.batch_size = batch_size
+        self.store_concurrency = store_concurrency
         self.notifier = notifier or Notifier()
         self.running = False
 
@@ -104,7 +110,7 @@ class InoreaderToAirtablePipeline:
                     {"status": "queued"},
                     len(items),
                 )
-                metrics.set_gauge("pipeline_queue_size", self.content_queue.size)
+                metrics.set_gauge("pipeline_queue_size", self.content_queue.size())
 
                 # Check if there are more items to fetch
                 if len(items) < self.batch_size:
@@ -138,64 +144,97 @@ class InoreaderToAirtablePipeline:
     async def process_and_store_batch(self) -> int:
         """Process a batch of items from the queue and store in Airtable.
 
+        The batch is written in chunks of at most
+        AIRTABLE_MAX_RECORDS_PER_REQUEST records, with up to
+        ``store_concurrency`` create requests in flight. Items of chunks that
+        fail are requeued; stored chunks are not retried.
+
         Returns:
             Number of items successfully processed and stored
         """
-        processed_count = 0
-        items_to_store: List[Dict] = []
-
         try:
-            # Process items from queue
-            for _ in range(self.batch_size):
-                if self.content_queue.is_empty():
-                    break
+            # Drain up to a batch in one locked queue call
+            queued_items = self.content_queue.get(self.batch_size)
+        except Exception as e:
+            await self._handle_store_failure([], e)
+            queued_items = []
 
-                queued_item = self.content_queue.dequeue()
-                if not queued_item:
-                    continue
+        items_to_store: List[Dict] = [queued_item.content for queued_item in queued_items]
+        processed_count = len(items_to_store)
 
-                items_to_store.append(queued_item.content)
-                processed_count += 1
+        if items_to_store:
+            chunks = [
+                items_to_store[i : i + AIRTABLE_MAX_RECORDS_PER_REQUEST]
+                for i in range(0, len(items_to_store), AIRTABLE_MAX_RECORDS_PER_REQUEST)
+            ]
+            semaphore = asyncio.Semaphore(self.store_concurrency)
 
-            if items_to_store:
-                start_time = time.time()
-                # Store items in Airtable
-                await self.airtable_client.create_records(items_to_store)
-                metrics.observe_histogram(
-                    "pipeline_processing_duration_seconds",
-                    time.time() - start_time,
-                    {"operation": "store"},
-                )
+            async def store_chunk(chunk: List[Dict]) -> None:
+                async with semaphore:
+                    await self.airtable_client.create_records(chunk)
 
+            start_time = time.time()
+            # Store items in Airtable
+            results = await asyncio.gather(
+                *(store_chunk(chunk) for chunk in chunks), return_exceptions=True
+            )
+            metrics.observe_histogram(
+                "pipeline_processing_duration_seconds",
+                time.time() - start_time,
+                {"operation": "store"},
+            )
+
+            failed = [
+                (chunk, result)
+                for chunk, result in zip(chunks, results)
+                if isinstance(result, Exception)
+            ]
+            stored_count = len(items_to_store) - sum(len(chunk) for chunk, _ in failed)
+            if stored_count:
                 metrics.increment_counter(
                     "pipeline_items_processed_total",
                     {"status": "stored"},
-                    len(items_to_store),
+                    stored_count,
+                )
+            if failed:
+                await self._handle_store_failure(
+                    [item for chunk, _ in failed for item in chunk], failed[0][1]
                 )
 
-        except Exception as e:
-            logger.error(
-                "error_processing_batch",
-                error=str(e),
-                batch_size=len(items_to_store),
-            )
-            metrics.increment_counter(
-                "pipeline_items_processed_total",
-                {"status": "store_error"},
-            )
+        metrics.set_gauge("pipeline_queue_size", self.content_queue.size())
+        return processed_count
+
+    async def _handle_store_failure(self, failed_items: List[Dict], error: Exception) -> None:
+        """Report a failed store and requeue its items.
+
+        Args:
+            failed_items: Items that could not be stored
+            error: First error raised while storing them
+        """
+        logger.error(
+            "error_processing_batch",
+            error=str(error),
+            batch_size=len(failed_items),
+        )
+        metrics.increment_counter(
+            "pipeline_items_processed_total",
+            {"status": "store_error"},
+        )
+        try:
             await self.notifier.notify(
                 NotificationEvent(
                     level=NotificationLevel.ERROR,
                     title="Batch Processing Error",
-                    message=f"Error processing and storing batch: {str(e)}",
+                    message=f"Error processing and storing batch: {str(error)}",
                     metadata={
-                        "batch_size": len(items_to_store),
-                        "queue_size": self.content_queue.size,
+                        "batch_size": len(failed_items),
+                        "queue_size": self.content_queue.size(),
                     },
                 )
             )
+        finally:
             # Requeue failed items with increased retry count
-            for item in items_to_store:
+            for item in failed_items:
                 queued_content = QueuedContent(
                     content_id=item["source_id"],
                     content=item,
@@ -204,9 +243,6 @@ class InoreaderToAirtablePipeline:
                 )
                 self.content_queue.enqueue(queued_content)
 
-        metrics.set_gauge("pipeline_queue_size", self.content_queue.size)
-        return processed_count
-
     async def cleanup(self) -> None:
         """Perform cleanup operations.
 
@@ -284,7 +320,7 @@ class InoreaderToAirtablePipeline:
                     logger.info(
                         "batch_processed",
                         count=processed_count,
-                        remaining=self.content_queue.size,
+                        remaining=self.content_queue.size(),
                     )
 
                 if self.running:
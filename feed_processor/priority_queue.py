@@ -1,5 +1,7 @@
 """Priority queue implementation for feed processing."""
 
+import heapq
+import itertools
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
@@ -18,7 +20,23 @@ class Priority(Enum):
     URGENT = auto()
 
 
-@dataclass
+# Heap keys pack an item's ordering into one integer so heap comparisons
+# are a single int compare:
+#
+#     key = (priority value << _SEQ_BITS) - sequence
+#
+# The high bits order by ascending priority value; subtracting the
+# insertion sequence (below 2**_SEQ_BITS) orders newer items first within
+# a priority.
+_SEQ_BITS = 64
+
+
+def _pack_key(priority: Priority, seq: int) -> int:
+    """Pack a priority and insertion sequence into a heap sort key."""
+    return (priority.value << _SEQ_BITS) - seq
+
+
+@dataclass(slots=True)
 class QueueItem:
     """Represents an item in the priority queue."""
 
@@ -31,7 +49,15 @@ class QueueItem:
 
 
 class PriorityQueue:
-    """Priority queue implementation with metrics tracking."""
+    """Priority queue implementation with metrics tracking.
+
+    Items come out in ascending priority value, newest first among items of
+    equal priority. They are held in a binary heap of
+    ``[packed key, item]`` entries (see _pack_key), so adding and taking the
+    next item are O(log n). Removing by ID blanks the entry in place (lazy
+    deletion) and the heap skips blanked entries as they surface; the heap
+    is rebuilt once blanked entries outnumber live ones.
+    """
 
     def __init__(self, max_size: Optional[int] = None):
         """Initialize the priority queue.
@@ -39,7 +65,11 @@ class PriorityQueue:
         Args:
             max_size: Optional maximum queue size
         """
-        self.items: List[QueueItem] = []
+        self._heap: List[list] = []
+        self._by_id: Dict[str, List[list]] = {}
+        self._counter = itertools.count()
+        self._size = 0
+        self._counts: Dict[Priority, int] = {p: 0 for p in Priority}
         self.max_size = max_size
 
         # Initialize metrics using predefined metrics
@@ -63,6 +93,23 @@ class PriorityQueue:
             ["priority"],
         )
 
+        # Resolve labelled children once; labels() takes the metric's lock on
+        # every call, so per-item updates only touch the child they change
+        self._priority_gauges = {
+            p: self.items_by_priority.labels(priority=p.name.lower()) for p in Priority
+        }
+        self._added_counters = {
+            p: self.items_added.labels(priority=p.name.lower()) for p in Priority
+        }
+        self._removed_counters = {
+            p: self.items_removed.labels(priority=p.name.lower()) for p in Priority
+        }
+
+    @property
+    def items(self) -> List[QueueItem]:
+        """Items currently queued, in the order they will be returned."""
+        return [entry[1] for entry in sorted(e for e in self._heap if e[1] is not None)]
+
     def add(self, item: QueueItem) -> bool:
         """Add an item to the queue.
 
@@ -72,22 +119,19 @@ class PriorityQueue:
         Returns:
             bool: True if item was added successfully
         """
-        if self.max_size and len(self.items) >= self.max_size:
+        if self.max_size and self._size >= self.max_size:
             self.queue_overflows.inc()
             return False
 
-        # Insert item in priority order
-        index = 0
-        for i, existing in enumerate(self.items):
-            if item.priority.value <= existing.priority.value:
-                index = i
-                break
-            index = i + 1
+        entry = [_pack_key(item.priority, next(self._counter)), item]
+        heapq.heappush(self._heap, entry)
+        self._by_id.setdefault(item.id, []).append(entry)
+        self._size += 1
+        self._counts[item.priority] += 1
 
-        self.items.insert(index, item)
-        self.queue_size.set(len(self.items))
-        self.items_added.labels(priority=item.priority.name.lower()).inc()
-        self._update_priority_metrics()
+        self.queue_size.set(self._size)
+        self._added_counters[item.priority].inc()
+        self._priority_gauges[item.priority].set(self._counts[item.priority])
         return True
 
     def remove(self, item_id: str) -> Optional[QueueItem]:
@@ -99,14 +143,22 @@ class PriorityQueue:
         Returns:
             Optional[QueueItem]: Removed item or None if not found
         """
-        for i, item in enumerate(self.items):
-            if item.id == item_id:
-                removed = self.items.pop(i)
-                self.queue_size.set(len(self.items))
-                self.items_removed.labels(priority=removed.priority.name.lower()).inc()
-                self._update_priority_metrics()
-                return removed
-        return None
+        entries = self._by_id.get(item_id)
+        if not entries:
+            return None
+
+        # Of several items sharing an ID, remove the one due out first
+        entry = min(entries)
+        removed = self._forget(entry)
+        entry[1] = None
+        if len(self._heap) > 2 * self._size + 32:
+            self._heap = [e for e in self._heap if e[1] is not None]
+            heapq.heapify(self._heap)
+
+        self.queue_size.set(self._size)
+        self._removed_counters[removed.priority].inc()
+        self._priority_gauges[removed.priority].set(self._counts[removed.priority])
+        return removed
 
     def get_next(self) -> Optional[QueueItem]:
         """Get the next item from the queue based on priority.
@@ -114,37 +166,51 @@ class PriorityQueue:
         Returns:
             Optional[QueueItem]: Next item or None if queue is empty
         """
-        if not self.items:
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[1] is not None:
+                break
+        else:
             return None
 
-        item = self.items[0]
-        self.items = self.items[1:]
-        self.queue_size.set(len(self.items))
-        self.items_removed.labels(priority=item.priority.name.lower()).inc()
-        self._update_priority_metrics()
+        item = self._forget(entry)
+        self.queue_size.set(self._size)
+        self._removed_counters[item.priority].inc()
+        self._priority_gauges[item.priority].set(self._counts[item.priority])
+        return item
+
+    def _forget(self, entry: list) -> QueueItem:
+        """Drop a live entry from the ID index and counts, returning its item."""
+        item = entry[1]
+        entries = self._by_id[item.id]
+        entries.remove(entry)
+        if not entries:
+            del self._by_id[item.id]
+        self._size -= 1
+        self._counts[item.priority] -= 1
         return item
 
     def _update_priority_metrics(self):
         """Update metrics for items by priority."""
-        priority_counts = {p: 0 for p in Priority}
-        for item in self.items:
-            priority_counts[item.priority] += 1
-
-        for priority, count in priority_counts.items():
-            self.items_by_priority.labels(priority=priority.name.lower()).set(count)
+        for priority, count in self._counts.items():
+            self._priority_gauges[priority].set(count)
 
     def clear(self):
         """Clear all items from the queue."""
-        for item in self.items:
-            self.items_removed.labels(priority=item.priority.name.lower()).inc()
-        self.items = []
+        for priority, count in self._counts.items():
+            if count:
+                self._removed_counters[priority].inc(count)
+        self._heap = []
+        self._by_id = {}
+        self._size = 0
+        self._counts = {p: 0 for p in Priority}
         self.queue_size.set(0)
         self._update_priority_metrics()
 
     def __len__(self) -> int:
         """Return the number of items in the queue."""
-        return len(self.items)
+        return self._size
 
     def __bool__(self) -> bool:
         """Return True if queue has items."""
-        return bool(self.items)
+        return self._size > 0
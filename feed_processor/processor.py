@@ -117,14 +117,8 @@ class FeedProcessor:
             List of queue items to process
         """
         try:
-            items = []
-            for _ in range(self.batch_size):
-                item = await self.content_queue.get()
-                if item is None:
-                    break
-                items.append(item)
-
-            QUEUE_SIZE.set(self.content_queue.size())
+            items = await self.content_queue.get_batch(self.batch_size)
+            QUEUE_SIZE.set(len(self.content_queue))
             return items
         except Exception as e:
             logger.error(f"Error getting batch from queue: {str(e)}")
@@ -24,7 +24,7 @@ class Priority(Enum):
     HIGH = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueItem:
     """Represents an item in the priority queue.
 
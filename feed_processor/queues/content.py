@@ -8,7 +8,7 @@ from typing import Any, Dict, Optional, Set
 from feed_processor.queues.base import BaseQueue, Priority
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedContent:
     """Represents a content item with processing metadata."""
 
@@ -1,17 +1,30 @@
 """
 Google Drive storage handler for feed processing system.
 """
+import io
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseUpload
 
 logger = logging.getLogger(__name__)
 
+_MIME_TYPES = {
+    ".json": "application/json",
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".pdf": "application/pdf",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
 
 class GoogleDriveStorage:
     """Handles Google Drive storage operations."""
@@ -26,19 +39,12 @@ class GoogleDriveStorage:
         """
         self.service = build("drive", "v3", credentials=credentials)
         self.root_folder_id = root_folder_id
+        # Per-instance cache so repeated writes to a folder skip the Drive lookup
+        self._resolve_folder_id = lru_cache(maxsize=1024)(self._find_or_create_folder)
 
     def _get_mime_type(self, file_path: str) -> str:
         """Get MIME type based on file extension."""
-        extension = Path(file_path).suffix.lower()
-        mime_types = {
-            ".json": "application/json",
-            ".txt": "text/plain",
-            ".md": "text/markdown",
-            ".pdf": "application/pdf",
-            ".doc": "application/msword",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        }
-        return mime_types.get(extension, "application/octet-stream")
+        return _MIME_TYPES.get(Path(file_path).suffix.lower(), "application/octet-stream")
 
     def create_folder(self, folder_path: str) -> str:
         """
@@ -53,25 +59,38 @@ class GoogleDriveStorage:
         current_parent = self.root_folder_id
 
         for folder_name in Path(folder_path).parts:
-            # Check if folder exists
-            query = f"name = '{folder_name}' and '{current_parent}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-            results = self.service.files().list(q=query).execute()
-            items = results.get("files", [])
-
-            if items:
-                current_parent = items[0]["id"]
-            else:
-                # Create new folder
-                folder_metadata = {
-                    "name": folder_name,
-                    "mimeType": "application/vnd.google-apps.folder",
-                    "parents": [current_parent],
-                }
-                folder = self.service.files().create(body=folder_metadata, fields="id").execute()
-                current_parent = folder.get("id")
+            current_parent = self._resolve_folder_id(folder_name, current_parent)
 
         return current_parent
 
+    def _find_or_create_folder(self, folder_name: str, parent_id: str) -> str:
+        """
+        Get the ID of a folder under a parent, creating the folder if missing.
+
+        Args:
+            folder_name: Name of the folder
+            parent_id: ID of the parent folder
+
+        Returns:
+            str: ID of the folder
+        """
+        # Check if folder exists
+        query = f"name = '{folder_name}' and '{parent_id}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+        results = self.service.files().list(q=query).execute()
+        items = results.get("files", [])
+
+        if items:
+            return items[0]["id"]
+
+        # Create new folder
+        folder_metadata = {
+            "name": folder_name,
+            "mimeType": "application/vnd.google-apps.folder",
+            "parents": [parent_id],
+        }
+        folder = self.service.files().create(body=folder_metadata, fields="id").execute()
+        return folder.get("id")
+
     def write_json(self, file_path: str, data: Dict[str, Any]) -> str:
         """
         Write JSON data to a file in Google Drive.
@@ -80,29 +99,43 @@ class GoogleDriveStorage:
             file_path: Path relative to root folder
             data: Dictionary to write as JSON
 
+        Returns:
+            str: ID of the created file
+        """
+        payload = json.dumps(data, separators=(",", ":")).encode()
+        try:
+            return self._upload_json(file_path, payload)
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            # A cached folder was deleted or trashed in Drive; resolve the path again
+            logger.warning(f"Folder for {file_path} no longer exists, resolving it again")
+            self._resolve_folder_id.cache_clear()
+            return self._upload_json(file_path, payload)
+
+    def _upload_json(self, file_path: str, payload: bytes) -> str:
+        """
+        Upload encoded JSON to a file in Google Drive.
+
+        Args:
+            file_path: Path relative to root folder
+            payload: Encoded JSON document
+
         Returns:
             str: ID of the created file
         """
         # Create parent folders if needed
         parent_folder_id = self.create_folder(str(Path(file_path).parent))
 
-        # Write data to temporary file
-        temp_path = "/tmp/temp.json"
-        with open(temp_path, "w") as f:
-            json.dump(data, f, indent=2)
-
-        # Upload file
+        # Upload compact JSON straight from memory instead of via a temporary file
         file_metadata = {"name": Path(file_path).name, "parents": [parent_folder_id]}
 
-        media = MediaFileUpload(temp_path, mimetype="application/json", resumable=True)
+        media = MediaIoBaseUpload(io.BytesIO(payload), mimetype="application/json", resumable=False)
 
         file = (
             self.service.files().create(body=file_metadata, media_body=media, fields="id").execute()
         )
 
-        # Clean up temporary file
-        Path(temp_path).unlink()
-
         return file.get("id")
 
     def read_json(self, file_path: str) -> Optional[Dict[str, Any]]:
@@ -128,19 +161,8 @@ class GoogleDriveStorage:
             file_id = items[0]["id"]
             request = self.service.files().get_media(fileId=file_id)
 
-            # Write to temporary file
-            temp_path = "/tmp/temp.json"
-            with open(temp_path, "wb") as f:
-                f.write(request.execute())
-
-            # Read JSON data
-            with open(temp_path, "r") as f:
-                data = json.load(f)
-
-            # Clean up
-            Path(temp_path).unlink()
-
-            return data
+            # Parse the downloaded bytes directly, without a temporary file or str copy
+            return orjson.loads(request.execute())
 
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {str(e)}")
@@ -0,0 +1,66 @@
+"""Bloom filter for fast negative membership checks."""
+
+import hashlib
+import math
+import threading
+from typing import Iterable, List
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives, so a miss proves a key was
+    never added; a hit only means the key was probably added. Bit indexes
+    are derived by double hashing (Kirsch-Mitzenmacher) from the two halves
+    of one BLAKE2b digest, over a bit array rounded up to a power of two.
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float = 0.01):
+        """Initialize an empty filter sized for the expected load.
+
+        Args:
+            expected_items: Number of keys the filter is sized for
+            false_positive_rate: Target false positive rate at that load
+
+        Raises:
+            ValueError: If expected_items is not positive or the rate is not in (0, 1)
+        """
+        if expected_items <= 0:
+            raise ValueError("expected_items must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        optimal_size = math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+        # A power-of-two size keeps every odd double-hashing step coprime with it
+        self.size = max(8, 1 << (optimal_size - 1).bit_length())
+        self._mask = self.size - 1
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _indexes(self, key: str) -> List[int]:
+        """Get the bit positions for a key."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        # An odd step is coprime with the power-of-two size, so the indexes
+        # only repeat once hash_count exceeds the number of bits
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * step) & self._mask for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        indexes = self._indexes(key)
+        # Bit updates are read-modify-write, so concurrent adds must not interleave
+        with self._lock:
+            for index in indexes:
+                self._bits[index >> 3] |= 1 << (index & 7)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add several keys to the filter."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key may have been added."""
+        bits = self._bits
+        return all(bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key))
@@ -10,6 +10,22 @@ from pydantic import BaseModel, Field, HttpUrl
 
 logger = logging.getLogger(__name__)
 
+# Airtable field names, in the column order built by ContentItem.to_airtable_records
+AIRTABLE_FIELDS = (
+    "Title",
+    "Content Type",
+    "Description",
+    "FeedID",
+    "Link",
+    "PublishDate",
+    "Author",
+)
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# Longest brief stored or sent downstream
+BRIEF_MAX_LENGTH = 2000
+
 
 class ContentType(str, Enum):
     """Types of content that can be stored."""
@@ -42,7 +58,7 @@ class ContentItem(BaseModel):
 
     title: str = Field(..., description="Content title")
     contentType: ContentType = Field(..., alias="content_type")
-    brief: Optional[str] = Field(None, max_length=2000)
+    brief: Optional[str] = Field(None, max_length=BRIEF_MAX_LENGTH)
     sourceMetadata: SourceMetadata
 
     def to_db_record(self) -> dict:
@@ -50,7 +66,8 @@ class ContentItem(BaseModel):
         return {
             "title": self.title,
             "content_type": self.contentType.value,
-            "brief": self.brief,
+            # Assignment skips validation, so cap the brief here before it reaches SQLite
+            "brief": self.brief[:BRIEF_MAX_LENGTH] if self.brief else self.brief,
             "feed_id": self.sourceMetadata.feedId,
             "original_url": str(self.sourceMetadata.originalUrl),
             "publish_date": self.sourceMetadata.publishDate.isoformat(),
@@ -60,31 +77,44 @@ class ContentItem(BaseModel):
 
     def to_airtable_record(self) -> dict:
         """Convert the model to Airtable record format."""
-        # Strip HTML tags from description
-        description = re.sub(r"<[^>]+>", "", self.brief) if self.brief else ""
-
-        # Ensure date is in Airtable-compatible format (YYYY-MM-DD)
-        try:
-            # Convert to UTC timezone if not already
-            if self.sourceMetadata.publishDate.tzinfo is None:
-                publish_date = self.sourceMetadata.publishDate.replace(tzinfo=timezone.utc)
-            else:
-                publish_date = self.sourceMetadata.publishDate.astimezone(timezone.utc)
-
-            # Format as YYYY-MM-DD which Airtable accepts
-            publish_date = publish_date.strftime("%Y-%m-%d")
-        except Exception as e:
-            logger.error(f"Failed to format date: {e}")
-            publish_date = None
-
-        return {
-            "fields": {
-                "Title": self.title[:99] if self.title else "",  # Truncate if too long
-                "Content Type": self.contentType.value,
-                "Description": description[:500],  # Truncate if too long
-                "FeedID": self.sourceMetadata.feedId,
-                "Link": str(self.sourceMetadata.originalUrl),
-                "PublishDate": publish_date,
-                "Author": (self.sourceMetadata.author or "")[:99],  # Truncate if too long
-            }
-        }
+        return self.to_airtable_records([self])[0]
+
+    @classmethod
+    def to_airtable_records(cls, items: List["ContentItem"]) -> List[dict]:
+        """Convert several models to Airtable record format.
+
+        Each Airtable field is built as one column across the batch and the
+        records are assembled by zipping the columns together.
+
+        Args:
+            items: Content items to convert
+
+        Returns:
+            List of Airtable records, in the order of ``items``
+        """
+        metadata = [item.sourceMetadata for item in items]
+        columns = (
+            [item.title[:99] if item.title else "" for item in items],  # Truncate if too long
+            [item.contentType.value for item in items],
+            # Strip HTML tags from description and truncate if too long
+            [_HTML_TAG.sub("", item.brief)[:500] if item.brief else "" for item in items],
+            [meta.feedId for meta in metadata],
+            [str(meta.originalUrl) for meta in metadata],
+            [_airtable_date(meta.publishDate) for meta in metadata],
+            [(meta.author or "")[:99] for meta in metadata],  # Truncate if too long
+        )
+        return [{"fields": dict(zip(AIRTABLE_FIELDS, row))} for row in zip(*columns)]
+
+
+def _airtable_date(value: datetime) -> Optional[str]:
+    """Format a datetime as the UTC YYYY-MM-DD date Airtable accepts."""
+    try:
+        # Convert to UTC timezone if not already
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        else:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%d")
+    except Exception as e:
+        logger.error(f"Failed to format date: {e}")
+        return None
@@ -4,13 +4,19 @@ CREATE TABLE IF NOT EXISTS feed_items (
     content_type TEXT NOT NULL,
     brief TEXT,
     feed_id TEXT,
-    original_url TEXT UNIQUE,
+    original_url TEXT,
     publish_date TEXT,
     author TEXT,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    processed_status TEXT DEFAULT 'new'
+    processed_status TEXT DEFAULT 'new',
+    url_hash INTEGER
 );
 
+-- Duplicate URLs are detected through a 64-bit hash of original_url, which
+-- keeps the unique index far smaller than one over the URL text
+CREATE UNIQUE INDEX IF NOT EXISTS idx_feed_items_url_hash ON feed_items(url_hash);
+CREATE INDEX IF NOT EXISTS idx_feed_items_status ON feed_items(processed_status);
+
 CREATE TABLE IF NOT EXISTS error_log (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     error_type TEXT NOT NULL,
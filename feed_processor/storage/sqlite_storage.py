@@ -1,16 +1,123 @@
 """SQLite storage implementation for feed items."""
+import hashlib
+import io
+import json
 import sqlite3
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Deque, Iterable, List, Optional, Set, Tuple
 
 import structlog
 from pydantic import BaseModel
 
+from feed_processor.storage.bloom import BloomFilter
 from feed_processor.storage.models import ContentItem, ContentStatus
 
 logger = structlog.get_logger(__name__)
 
+_FEED_ITEM_COLUMNS = (
+    "title",
+    "content_type",
+    "brief",
+    "feed_id",
+    "original_url",
+    "publish_date",
+    "author",
+    "processed_status",
+)
+
+# Pulls a DB record's values out in column order with a single C-level call
+_record_values = itemgetter(*_FEED_ITEM_COLUMNS)
+_URL_INDEX = _FEED_ITEM_COLUMNS.index("original_url")
+
+# Statement text is fixed so each connection's statement cache reuses the
+# prepared statement instead of re-parsing the SQL on every call
+_INSERT_COLUMNS = (
+    f"INTO feed_items ({', '.join(_FEED_ITEM_COLUMNS)}, url_hash) "
+    f"VALUES ({', '.join('?' * (len(_FEED_ITEM_COLUMNS) + 1))})"
+)
+_INSERT_ITEM_SQL = f"INSERT {_INSERT_COLUMNS}"
+_INSERT_NEW_ITEMS_SQL = f"INSERT OR IGNORE {_INSERT_COLUMNS}"
+_SELECT_DUP_SQL = "SELECT 1 FROM feed_items WHERE url_hash = ? LIMIT 1"
+# A negative LIMIT means no limit, so one statement serves both cases
+_SELECT_BY_STATUS_SQL = (
+    "SELECT title, content_type, brief, feed_id, original_url, publish_date, author "
+    "FROM feed_items WHERE processed_status = ? LIMIT ?"
+)
+_INSERT_ERROR_SQL = "INSERT INTO error_log (error_type, error_message, timestamp) VALUES (?, ?, ?)"
+
+_STATEMENT_CACHE_SIZE = 256
+
+# Smallest number of URLs the seen-URL Bloom filter is sized for
+_BLOOM_MIN_CAPACITY = 100_000
+
+# Logged errors are committed in batches by a background thread, every
+# _ERROR_FLUSH_INTERVAL seconds or as soon as _ERROR_FLUSH_SIZE are waiting
+_ERROR_BUFFER_SIZE = 1024
+_ERROR_FLUSH_SIZE = 100
+_ERROR_FLUSH_INTERVAL = 0.5
+
+# Stay well under SQLite's bound-parameter limit in IN (...) lookups
+_MAX_QUERY_PARAMS = 500
+
+# Applied once per connection: WAL lets readers run alongside the writer and
+# synchronous=NORMAL fsyncs at checkpoints instead of on every commit
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _url_hash(url: str) -> int:
+    """Hash a URL to the signed 64-bit integer stored in ``url_hash``."""
+    return int.from_bytes(
+        hashlib.blake2b(url.encode(), digest_size=8).digest(), "little", signed=True
+    )
+
+
+def _row_tuple(record: dict) -> tuple:
+    """Get the insert parameters for a DB record, in column order."""
+    return (*_record_values(record), _url_hash(record["original_url"]))
+
+
+def _add_url_hash_column(conn: sqlite3.Connection) -> None:
+    """Add and backfill ``url_hash`` in a database created before it existed."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(feed_items)")}
+    if not columns or "url_hash" in columns:
+        return
+
+    conn.execute("ALTER TABLE feed_items ADD COLUMN url_hash INTEGER")
+    rows = conn.execute("SELECT id, original_url FROM feed_items").fetchall()
+    conn.executemany(
+        "UPDATE feed_items SET url_hash = ? WHERE id = ?",
+        [(_url_hash(url), row_id) for row_id, url in rows if url is not None],
+    )
+
+
+class _SharedConnection(sqlite3.Connection):
+    """Connection used by every thread, running one ``with`` block at a time."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        return super().__enter__()
+
+    def __exit__(self, *exc_info):
+        try:
+            return super().__exit__(*exc_info)
+        finally:
+            self._lock.release()
+
 
 class SQLiteConfig(BaseModel):
     """Configuration for SQLite storage."""
@@ -19,7 +126,11 @@ class SQLiteConfig(BaseModel):
 
 
 class SQLiteStorage:
-    """SQLite storage implementation for feed items."""
+    """SQLite storage implementation for feed items.
+
+    Each storage starts a background thread that commits logged errors.
+    Callers must close() the storage to stop it and commit the remainder.
+    """
 
     def __init__(self, config: SQLiteConfig):
         """Initialize SQLite storage.
@@ -29,18 +140,102 @@ class SQLiteStorage:
         """
         self.db_path = Path(config.db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Each connection to ":memory:" opens its own empty database, so
+        # every thread shares the first one instead
+        self._in_memory = str(self.db_path) == ":memory:"
+        self._shared_conn: Optional[sqlite3.Connection] = None
 
         # Initialize database
         with self._get_connection() as conn:
+            _add_url_hash_column(conn)
             with open(Path(__file__).parent / "schema.sql") as f:
                 conn.executescript(f.read())
 
+            # Seed the seen-URL filter so most new URLs skip the duplicate query.
+            # URLs stored later by another writer are missed by the filter; the
+            # unique url_hash index makes store_items skip them as duplicates
+            (stored,) = conn.execute("SELECT COUNT(*) FROM feed_items").fetchone()
+            self._seen_urls = BloomFilter(max(_BLOOM_MIN_CAPACITY, 2 * stored))
+            self._seen_urls.update(
+                row[0] for row in conn.execute("SELECT original_url FROM feed_items")
+            )
+
+        # Errors also go to an append-only journal until their batch is
+        # committed, so a process that dies before flushing loses none of them
+        self._error_buffer: Deque[Tuple[str, str, str]] = deque(maxlen=_ERROR_BUFFER_SIZE)
+        self._error_lock = threading.Lock()
+        if self._in_memory:
+            # Nothing survives a crash of an in-memory database, so neither need its errors
+            self._error_journal: IO[str] = io.StringIO()
+        else:
+            self._error_journal_path = Path(f"{self.db_path}-errors")
+            self._replay_error_journal()
+            self._error_journal = open(self._error_journal_path, "a", encoding="utf-8")
+
+        self._closed = False
+        self._flush_requested = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_errors_loop, name="sqlite-error-flush", daemon=True
+        )
+        self._flush_thread.start()
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get SQLite connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's SQLite connection, opening it on first use.
+
+        Connections are kept open for the lifetime of the storage. Using the
+        connection as a context manager still commits or rolls back the
+        enclosed statements. An in-memory database has a single connection
+        shared by all threads, which runs their ``with`` blocks one at a time.
+        """
+        if self._shared_conn is not None:
+            return self._shared_conn
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+                factory=_SharedConnection if self._in_memory else sqlite3.Connection,
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            if self._in_memory:
+                self._shared_conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Flush buffered errors and close every connection opened by this storage.
+
+        Each connection refreshes the query planner statistics it found
+        stale before closing. Errors logged afterwards are written directly.
+        Closing again only closes connections opened since.
+        """
+        with self._error_lock:
+            already_closed, self._closed = self._closed, True
+        if not already_closed:
+            self._flush_requested.set()
+            self._flush_thread.join()
+            with self._error_lock:
+                self._flush_errors_locked()
+                self._error_journal.close()
+
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.execute("PRAGMA analysis_limit=1000")
+            conn.execute("PRAGMA optimize")
+            conn.close()
+        self._local = threading.local()
+        self._shared_conn = None
+
     def store_item(self, item: ContentItem) -> bool:
         """Store a content item in the database.
 
@@ -54,25 +249,9 @@ class SQLiteStorage:
             record = item.to_db_record()
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO feed_items (
-                        title, content_type, brief, feed_id, original_url,
-                        publish_date, author, processed_status
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record["title"],
-                        record["content_type"],
-                        record["brief"],
-                        record["feed_id"],
-                        record["original_url"],
-                        record["publish_date"],
-                        record["author"],
-                        record["processed_status"],
-                    ),
-                )
-                return True
+                cursor.execute(_INSERT_ITEM_SQL, _row_tuple(record))
+            self._seen_urls.add(record["original_url"])
+            return True
         except sqlite3.IntegrityError:
             # URL already exists
             logger.debug("Duplicate item", url=record["original_url"])
@@ -81,6 +260,60 @@ class SQLiteStorage:
             logger.error("Error storing item", error=str(e), url=record["original_url"])
             return False
 
+    def store_items(self, items: List[ContentItem]) -> int:
+        """Store several content items in a single transaction.
+
+        Items whose URL is already stored are skipped.
+
+        Args:
+            items: Content items to store
+
+        Returns:
+            Number of items stored
+
+        Raises:
+            sqlite3.Error: If the batch could not be written
+        """
+        if not items:
+            return 0
+
+        rows = [_row_tuple(item.to_db_record()) for item in items]
+        try:
+            # One transaction for the whole batch: a single commit instead of one per row
+            with self._get_connection() as conn:
+                cursor = conn.executemany(_INSERT_NEW_ITEMS_SQL, rows)
+            # Ignored rows were already stored, so every URL in the batch is now present
+            self._seen_urls.update(record[_URL_INDEX] for record in rows)
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("Error storing items", error=str(e), count=len(items))
+            raise
+
+    def filter_duplicates(self, urls: Iterable[str]) -> Set[str]:
+        """Find which URLs already exist in the database.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            Subset of the URLs that are already stored
+        """
+        # Only URLs the Bloom filter may have seen need a database lookup
+        hashes = {_url_hash(url): url for url in urls if url in self._seen_urls}
+        keys = list(hashes)
+        existing = set()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(keys), _MAX_QUERY_PARAMS):
+                chunk = keys[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT url_hash FROM feed_items WHERE url_hash IN ({placeholders})",
+                    chunk,
+                )
+                existing.update(hashes[row[0]] for row in cursor.fetchall())
+        return existing
+
     def is_duplicate(self, url: str) -> bool:
         """Check if URL already exists in database.
 
@@ -90,24 +323,86 @@ class SQLiteStorage:
         Returns:
             True if URL exists
         """
+        if url not in self._seen_urls:
+            return False
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM feed_items WHERE original_url = ?", (url,))
+            cursor.execute(_SELECT_DUP_SQL, (_url_hash(url),))
             return cursor.fetchone() is not None
 
     def log_error(self, error_type: str, error_message: str):
         """Log an error to the database.
 
+        The error is buffered and committed with others by the background
+        flush; call flush() to commit it immediately.
+
         Args:
             error_type: Type of error
             error_message: Error message
         """
+        entry = (error_type, error_message, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()))
+        with self._error_lock:
+            if not self._closed:
+                # Never let the bounded buffer drop its oldest entry
+                if len(self._error_buffer) == _ERROR_BUFFER_SIZE:
+                    self._flush_errors_locked()
+                self._error_journal.write(json.dumps(entry) + "\n")
+                self._error_journal.flush()
+                self._error_buffer.append(entry)
+                if len(self._error_buffer) >= _ERROR_FLUSH_SIZE:
+                    self._flush_requested.set()
+                return
+
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO error_log (error_type, error_message) VALUES (?, ?)",
-                (error_type, error_message),
-            )
+            conn.execute(_INSERT_ERROR_SQL, entry)
+
+    def flush(self) -> None:
+        """Commit all buffered errors in one transaction."""
+        with self._error_lock:
+            self._flush_errors_locked()
+
+    def _flush_errors_locked(self) -> None:
+        """Commit buffered errors and empty the journal; the error lock must be held."""
+        if not self._error_buffer:
+            return
+
+        with self._get_connection() as conn:
+            conn.executemany(_INSERT_ERROR_SQL, list(self._error_buffer))
+        self._error_buffer.clear()
+        self._error_journal.truncate(0)
+
+    def _flush_errors_loop(self) -> None:
+        """Flush buffered errors periodically until the storage is closed."""
+        while not self._closed:
+            self._flush_requested.wait(_ERROR_FLUSH_INTERVAL)
+            self._flush_requested.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                # The errors stay buffered and journaled for the next attempt
+                logger.error("Error flushing error log", error=str(e))
+
+    def _replay_error_journal(self) -> None:
+        """Commit errors journaled by a previous process that never flushed them."""
+        try:
+            lines = self._error_journal_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+
+        rows = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Line cut short by the crash
+            if isinstance(entry, list) and len(entry) == 3:
+                rows.append(tuple(entry))
+
+        if rows:
+            with self._get_connection() as conn:
+                conn.executemany(_INSERT_ERROR_SQL, rows)
+        self._error_journal_path.write_text("", encoding="utf-8")
 
     def get_items_by_status(
         self, status: ContentStatus, limit: Optional[int] = None
@@ -123,25 +418,24 @@ class SQLiteStorage:
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            query = "SELECT * FROM feed_items WHERE processed_status = ?"
-            if limit:
-                query += f" LIMIT {limit}"
-
-            cursor.execute(query, (status.value,))
+            # Plain tuples unpack positionally, avoiding a name lookup per column per row
+            cursor.row_factory = None
+            cursor.execute(_SELECT_BY_STATUS_SQL, (status.value, limit or -1))
             rows = cursor.fetchall()
 
-            return [
-                ContentItem(
-                    title=row["title"],
-                    contentType=row["content_type"],
-                    brief=row["brief"],
-                    sourceMetadata={
-                        "feedId": row["feed_id"],
-                        "originalUrl": row["original_url"],
-                        "publishDate": datetime.fromisoformat(row["publish_date"]),
-                        "author": row["author"],
-                        "tags": [],  # Tags not stored in basic implementation
-                    },
-                )
-                for row in rows
-            ]
+        parse_date = datetime.fromisoformat
+        return [
+            ContentItem(
+                title=title,
+                content_type=content_type,
+                brief=brief,
+                sourceMetadata={
+                    "feedId": feed_id,
+                    "originalUrl": original_url,
+                    "publishDate": parse_date(publish_date),
+                    "author": author,
+                    "tags": [],  # Tags not stored in basic implementation
+                },
+            )
+            for title, content_type, brief, feed_id, original_url, publish_date, author in rows
+        ]
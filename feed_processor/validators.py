@@ -1,8 +1,12 @@
 """Feed content validation."""
 
+import io
 import json
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from xml.etree import ElementTree as ET
 
 import structlog
@@ -10,6 +14,31 @@ from dateutil.parser import parse as parse_date
 
 logger = structlog.get_logger(__name__)
 
+# First non-whitespace character, which tells JSON ("{") from XML ("<")
+_FIRST_CHAR = re.compile(r"\s*(\S)")
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+# Feed-level Atom fields, taken from the first match anywhere in the document
+_ATOM_FEED_FIELDS = frozenset(_ATOM + tag for tag in ("title", "link", "updated"))
+
+
+def _parse_rfc822_date(value: str) -> datetime:
+    """Parse an RSS date, falling back to dateutil for non-RFC 822 values."""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return parse_date(value)
+    # A "-0000" offset comes back naive; keep it aware at UTC, as dateutil did
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _parse_iso_date(value: str) -> datetime:
+    """Parse an Atom date, falling back to dateutil for non-ISO 8601 values."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse_date(value)
+
 
 @dataclass
 class FeedValidationResult:
@@ -35,8 +64,15 @@ class FeedValidator:
             FeedValidationResult containing validation status and parsed feed
         """
         try:
-            # Try parsing as JSON first
-            try:
+            # A byte order mark left by decoding is not whitespace, so drop it first
+            if feed_content.startswith("\ufeff"):
+                feed_content = feed_content[1:]
+
+            # Dispatch on the first non-whitespace character instead of trial parsing
+            match = _FIRST_CHAR.match(feed_content)
+            first_char = match.group(1) if match else ""
+
+            if first_char == "{":
                 data = json.loads(feed_content)
                 if "version" in data and "jsonfeed" in data["version"].lower():
                     parsed = {
@@ -58,74 +94,146 @@ class FeedValidator:
                         ],
                     }
                     return FeedValidationResult(True, "json", parsed)
-            except json.JSONDecodeError:
-                pass
+                return FeedValidationResult(False, None, None, "Unknown feed format")
 
-            # Try parsing as XML (RSS or Atom)
-            root = ET.fromstring(feed_content)
+            if first_char != "<":
+                return FeedValidationResult(False, None, None, "Unrecognized feed format")
+
+            # Stream the XML (RSS or Atom), dispatching on the root element
+            events = ET.iterparse(io.StringIO(feed_content), events=("start", "end"))
+            _, root = next(events)
 
             # Check for Atom feed
             if root.tag.endswith("feed"):
-                parsed = {
-                    "title": root.find(".//{http://www.w3.org/2005/Atom}title").text,
-                    "link": root.find(".//{http://www.w3.org/2005/Atom}link").get("href"),
-                    "updated": parse_date(
-                        root.find(".//{http://www.w3.org/2005/Atom}updated").text
-                    ),
-                    "entries": [
-                        {
-                            "title": entry.find("{http://www.w3.org/2005/Atom}title").text,
-                            "link": entry.find("{http://www.w3.org/2005/Atom}link").get("href"),
-                            "summary": entry.find("{http://www.w3.org/2005/Atom}summary").text
-                            if entry.find("{http://www.w3.org/2005/Atom}summary") is not None
-                            else None,
-                            "updated": parse_date(
-                                entry.find("{http://www.w3.org/2005/Atom}updated").text
-                            ),
-                        }
-                        for entry in root.findall(".//{http://www.w3.org/2005/Atom}entry")
-                    ],
-                }
-                return FeedValidationResult(True, "atom", parsed)
+                return FeedValidator._parse_atom_stream(events)
 
             # Check for RSS feed
             if root.tag == "rss":
-                channel = root.find("channel")
-                if channel is None:
-                    return FeedValidationResult(
-                        False, "rss", None, "Missing required channel element"
-                    )
+                return FeedValidator._parse_rss_stream(events)
+
+            return FeedValidationResult(False, None, None, "Unknown feed format")
+
+        except Exception as e:
+            return FeedValidationResult(False, None, None, str(e))
+
+    @staticmethod
+    def _parse_rss_stream(events: Iterator[Tuple[str, ET.Element]]) -> FeedValidationResult:
+        """Parse the rest of an RSS document from iterparse events.
 
+        Each item is converted and dropped from the tree as soon as it
+        closes, and parsing stops once the first channel is complete.
+
+        Args:
+            events: iterparse ``start``/``end`` events after the root element
+
+        Returns:
+            FeedValidationResult for the feed
+        """
+        path: List[ET.Element] = []  # open elements below the root
+        channel = None
+        entries = []
+        entry_error = None
+
+        for event, elem in events:
+            if event == "start":
+                if channel is None and not path and elem.tag == "channel":
+                    channel = elem
+                path.append(elem)
+                continue
+            if not path:
+                break  # root closed
+            path.pop()
+
+            if elem.tag == "item" and len(path) == 1 and path[0] is channel:
+                if entry_error is None:
+                    try:
+                        entries.append(FeedValidator._rss_entry(elem))
+                    except Exception as e:
+                        # Reported after the channel's required fields are checked
+                        entry_error = e
+                channel.remove(elem)
+                elem.clear()
+            elif elem is channel:
                 required_fields = ["title", "link"]
                 missing_fields = [field for field in required_fields if channel.find(field) is None]
                 if missing_fields:
                     return FeedValidationResult(
                         False, "rss", None, f"Missing required fields: {', '.join(missing_fields)}"
                     )
+                if entry_error is not None:
+                    raise entry_error
 
+                pub_date = channel.find("pubDate")
                 parsed = {
                     "title": channel.find("title").text,
                     "link": channel.find("link").text,
-                    "updated": parse_date(channel.find("pubDate").text)
-                    if channel.find("pubDate") is not None
-                    else None,
-                    "entries": [
-                        {
-                            "title": item.find("title").text,
-                            "link": item.find("link").text,
-                            "summary": item.find("description").text
-                            if item.find("description") is not None
-                            else None,
-                            "updated": parse_date(item.find("pubDate").text)
-                            if item.find("pubDate") is not None
-                            else None,
-                        }
-                        for item in channel.findall("item")
-                    ],
+                    "updated": _parse_rfc822_date(pub_date.text) if pub_date is not None else None,
+                    "entries": entries,
                 }
                 return FeedValidationResult(True, "rss", parsed)
 
-            return FeedValidationResult(False, None, None, "Unknown feed format")
+        return FeedValidationResult(False, "rss", None, "Missing required channel element")
 
-        except Exception as e:
-            return FeedValidationResult(False, None, None, str(e))
+    @staticmethod
+    def _rss_entry(item: ET.Element) -> Dict[str, Any]:
+        """Convert a complete RSS item element."""
+        description = item.find("description")
+        pub_date = item.find("pubDate")
+        return {
+            "title": item.find("title").text,
+            "link": item.find("link").text,
+            "summary": description.text if description is not None else None,
+            "updated": _parse_rfc822_date(pub_date.text) if pub_date is not None else None,
+        }
+
+    @staticmethod
+    def _parse_atom_stream(events: Iterator[Tuple[str, ET.Element]]) -> FeedValidationResult:
+        """Parse the rest of an Atom document from iterparse events.
+
+        Feed fields are the first matching elements in document order, and
+        each entry is converted and dropped from the tree as soon as it closes.
+
+        Args:
+            events: iterparse ``start``/``end`` events after the root element
+
+        Returns:
+            FeedValidationResult for the feed
+        """
+        path: List[ET.Element] = []  # open elements below the root
+        first: Dict[str, ET.Element] = {}
+        entries = []
+
+        for event, elem in events:
+            if event == "start":
+                path.append(elem)
+                continue
+            if not path:
+                break  # root closed
+            path.pop()
+
+            if elem.tag in _ATOM_FEED_FIELDS:
+                first.setdefault(elem.tag, elem)
+            elif elem.tag == _ATOM + "entry":
+                entries.append(FeedValidator._atom_entry(elem))
+                if path:
+                    path[-1].remove(elem)
+                elem.clear()
+
+        parsed = {
+            "title": first.get(_ATOM + "title").text,
+            "link": first.get(_ATOM + "link").get("href"),
+            "updated": _parse_iso_date(first.get(_ATOM + "updated").text),
+            "entries": entries,
+        }
+        return FeedValidationResult(True, "atom", parsed)
+
+    @staticmethod
+    def _atom_entry(entry: ET.Element) -> Dict[str, Any]:
+        """Convert a complete Atom entry element."""
+        summary = entry.find(_ATOM + "summary")
+        return {
+            "title": entry.find(_ATOM + "title").text,
+            "link": entry.find(_ATOM + "link").get("href"),
+            "summary": summary.text if summary is not None else None,
+            "updated": _parse_iso_date(entry.find(_ATOM + "updated").text),
+        }
@@ -1,13 +1,18 @@
 """Webhook management module for handling outgoing webhook requests."""
 
+import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
 
+import orjson
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
 
 from feed_processor.error_handling import ErrorHandler
 from feed_processor.metrics.prometheus import metrics
@@ -18,6 +23,14 @@ logger = structlog.get_logger(__name__)
 
 __all__ = ["WebhookDeliveryManager", "WebhookResponse", "TracingManager", "TracingConfig"]
 
+# Upper bound on batches posted concurrently; also the per-host connection pool size
+_MAX_SEND_WORKERS = 32
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Naive datetimes are sent as UTC, and non-string keys are stringified as json does
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
 
 @dataclass
 class WebhookError(Exception):
@@ -43,6 +56,7 @@ class WebhookManager:
         max_retries: int = 3,
         retry_delay: float = 5.0,
         batch_size: int = 50,
+        max_retry_delay: float = 60.0,
     ):
         """Initialize the webhook manager.
 
@@ -52,14 +66,23 @@ class WebhookManager:
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries in seconds
             batch_size: Maximum items per webhook batch
+            max_retry_delay: Longest wait before a retry in seconds
         """
         self.webhook_url = webhook_url
         self.error_handler = error_handler
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
         self.batch_size = batch_size
         self.lock = threading.Lock()
 
+        # Keep-alive pool so concurrent batches reuse TCP/TLS connections.
+        # The adapter does not retry; send_batch owns the retry policy.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_MAX_SEND_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Initialize metrics
         self.webhook_counter = metrics.register_counter(
             "webhook_requests_total", "Total number of webhook requests", ["status"]
@@ -100,21 +123,56 @@ class WebhookManager:
 
         return True
 
+    def _backoff_delay(
+        self, retry_count: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """Get how long to wait before the next retry.
+
+        A Retry-After header on the response, in seconds or as an HTTP date,
+        is honored. Otherwise the delay grows exponentially from retry_delay
+        with +/-50% jitter so clients that failed together do not retry in
+        lockstep. Either way the delay is capped at max_retry_delay.
+
+        Args:
+            retry_count: Number of retries already made
+            response: Response that triggered the retry, if any
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if isinstance(retry_after, str):
+            try:
+                return min(self.max_retry_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    pass
+                else:
+                    wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                    return min(self.max_retry_delay, max(0.0, wait))
+
+        delay = min(self.max_retry_delay, self.retry_delay * (2**retry_count))
+        return delay * random.uniform(0.5, 1.5)
+
     def send_items(self, items: List[Dict]) -> List[WebhookResponse]:
         """Send items in batches.
 
+        Batches are posted concurrently so their network waits overlap.
+
         Args:
             items: List of items to send
 
         Returns:
-            List[WebhookResponse]: List of responses for each batch
+            List[WebhookResponse]: List of responses for each batch, in batch order
         """
-        responses = []
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i : i + self.batch_size]
-            response = self.send_batch(batch)
-            responses.append(response)
-        return responses
+        batches = [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        if len(batches) <= 1:
+            return [self.send_batch(batch) for batch in batches]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_SEND_WORKERS, len(batches))) as executor:
+            return list(executor.map(self.send_batch, batches))
 
     def send_batch(self, items: List[Dict], retry_count: int = 0) -> WebhookResponse:
         """Send a batch of items via webhook.
@@ -140,13 +198,35 @@ class WebhookManager:
                 )
 
         self.batch_size_gauge.set(len(items))
+        # Serialized once here, so retries below resend the same bytes
+        try:
+            body = orjson.dumps({"items": items}, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError as e:
+            return WebhookResponse(
+                success=False,
+                status_code=400,
+                error_type="invalid_payload",
+                error_message=f"Payload could not be serialized: {e}",
+            )
+        return self._post_batch(body, retry_count)
+
+    def _post_batch(self, body: bytes, retry_count: int) -> WebhookResponse:
+        """Post a serialized batch, retrying rate limits, server and connection errors.
+
+        Args:
+            body: JSON-encoded batch
+            retry_count: Current retry attempt number
+
+        Returns:
+            WebhookResponse with delivery status
+        """
         start_time = time.time()
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
-                json={"items": items},
-                headers={"Content-Type": "application/json"},
+                data=body,
+                headers=_JSON_HEADERS,
                 timeout=30,
             )
 
@@ -155,6 +235,10 @@ class WebhookManager:
 
             if response.status_code == 429:  # Rate limited
                 self.webhook_counter.labels(status="rate_limited").inc()
+                if retry_count < self.max_retries:
+                    # Wait as long as the server asked before trying again
+                    time.sleep(self._backoff_delay(retry_count, response))
+                    return self._post_batch(body, retry_count + 1)
                 return WebhookResponse(
                     success=False,
                     status_code=429,
@@ -164,8 +248,8 @@ class WebhookManager:
                 )
 
             if response.status_code >= 500 and retry_count < self.max_retries:
-                time.sleep(self.retry_delay * (2**retry_count))  # Exponential backoff
-                return self.send_batch(items, retry_count + 1)
+                time.sleep(self._backoff_delay(retry_count, response))
+                return self._post_batch(body, retry_count + 1)
 
             response.raise_for_status()
             self.webhook_counter.labels(status="success").inc()
@@ -181,8 +265,8 @@ class WebhookManager:
             self.webhook_counter.labels(status="failed").inc()
 
             if retry_count < self.max_retries:
-                time.sleep(self.retry_delay * (2**retry_count))  # Exponential backoff
-                return self.send_batch(items, retry_count + 1)
+                time.sleep(self._backoff_delay(retry_count, e.response))
+                return self._post_batch(body, retry_count + 1)
 
             error_type = "request_failed"
             error_message = str(e)
@@ -1,10 +1,10 @@
 """Webhook configuration and delivery for feed processor."""
 
-import json
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+import orjson
 import structlog
 
 from feed_processor.metrics.metrics import WEBHOOK_PAYLOAD_SIZE, WEBHOOK_RETRIES
@@ -54,17 +54,18 @@ async def deliver_webhook(
         close_session = True
 
     try:
-        # Track payload size
-        payload_size = len(json.dumps(payload).encode("utf-8"))
-        WEBHOOK_PAYLOAD_SIZE.observe(payload_size)
+        # Serialize once; the same body and headers are reused for every retry
+        body = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+        headers = config.get_headers()
+        WEBHOOK_PAYLOAD_SIZE.observe(len(body))
 
         retries = 0
         while retries <= config.max_retries:
             try:
                 async with session.post(
                     config.url,
-                    json=payload,
-                    headers=config.get_headers(),
+                    data=body,
+                    headers=headers,
                     timeout=config.timeout,
                 ) as response:
                     if response.status < 400:
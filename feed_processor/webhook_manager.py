@@ -4,10 +4,12 @@ import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import requests
 import structlog
+import zstandard
 
 from .error_handling import ErrorHandler
 from .metrics.prometheus import metrics
@@ -55,6 +57,8 @@ class WebhookManager:
         retry_backoff_factor: float = 2.0,
         batch_size: int = 50,
         rate_limit: Optional[float] = None,
+        compression: Optional[str] = None,
+        compression_min_bytes: int = 1024,
     ):
         """Initialize the webhook manager.
 
@@ -67,7 +71,15 @@ class WebhookManager:
             retry_backoff_factor: Factor to multiply delay by for each retry
             batch_size: Maximum items per webhook batch
             rate_limit: Minimum time between requests in seconds
+            compression: Request body encoding, ``"zstd"`` or None for identity
+            compression_min_bytes: Smallest body worth compressing
+
+        Raises:
+            ValueError: If compression is not a supported encoding
         """
+        if compression not in (None, "zstd"):
+            raise ValueError(f"Unsupported webhook compression: {compression}")
+
         self.webhook_url = webhook_url
         self.error_handler = error_handler
         self.max_retries = max_retries
@@ -76,6 +88,8 @@ class WebhookManager:
         self.retry_backoff_factor = retry_backoff_factor
         self.batch_size = batch_size
         self.rate_limit = rate_limit
+        self.compression = compression
+        self.compression_min_bytes = compression_min_bytes
         self.last_request_time = 0
         self.lock = threading.Lock()
 
@@ -92,6 +106,29 @@ class WebhookManager:
         self.batch_size_gauge = metrics.register_gauge(
             "webhook_batch_size_current", "Current webhook batch size"
         )
+        self.payload_size = metrics.register_histogram(
+            "webhook_payload_bytes", "Size of webhook request bodies in bytes", ["encoding"]
+        )
+
+    def _encode_batch(self, items: List[Dict]) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize a batch into a request body.
+
+        Args:
+            items: List of items to send
+
+        Returns:
+            Tuple of (body bytes, request headers)
+        """
+        # Same encoding as feed_processor.webhook: naive datetimes as UTC, keys stringified
+        body = orjson.dumps({"items": items}, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+        headers = {"Content-Type": "application/json"}
+        encoding = "identity"
+        if self.compression == "zstd" and len(body) >= self.compression_min_bytes:
+            # Compressor objects are not thread safe, so use one per request
+            body = zstandard.ZstdCompressor(level=3).compress(body)
+            headers["Content-Encoding"] = encoding = "zstd"
+        self.payload_size.labels(encoding=encoding).observe(len(body))
+        return body, headers
 
     def send_batch(self, items: List[Dict], retry_count: int = 0) -> WebhookResponse:
         """Send a batch of items via webhook.
@@ -117,19 +154,39 @@ class WebhookManager:
                     time.sleep(self.rate_limit - time_since_last)
                 self.last_request_time = time.time()
 
+        try:
+            body, headers = self._encode_batch(items)
+        except TypeError as e:  # orjson.JSONEncodeError included
+            self.webhook_counter.labels(status="failed").inc()
+            logger.error("Webhook batch could not be serialized", error=str(e))
+            return WebhookResponse(
+                success=False,
+                status_code=400,
+                error_type="invalid_payload",
+                retry_count=retry_count,
+            )
         start_time = time.time()
 
         try:
             response = requests.post(
                 self.webhook_url,
-                json={"items": items},
-                headers={"Content-Type": "application/json"},
+                data=body,
+                headers=headers,
                 timeout=30,
             )
 
             duration = time.time() - start_time
             self.webhook_latency.observe(duration)
 
+            if response.status_code == 415 and "Content-Encoding" in headers:
+                # Receiver rejects compressed bodies; send identity from now on
+                logger.warning(
+                    "Webhook receiver rejected compressed payload, disabling compression",
+                    encoding=headers["Content-Encoding"],
+                )
+                self.compression = None
+                return self.send_batch(items, retry_count)
+
             if response.status_code == 429:  # Rate limited
                 self.webhook_counter.labels(status="rate_limited").inc()
                 return WebhookResponse(
@@ -187,7 +244,9 @@ class WebhookManager:
         """
         response = self.send_batch(items, retry_count)
 
-        if not response.success and retry_count < self.max_retries:
+        # An unserializable batch fails the same way every time
+        retryable = response.error_type != "invalid_payload"
+        if not response.success and retryable and retry_count < self.max_retries:
             self.retry_counter.inc()
 
             # Calculate delay with exponential backoff
@@ -7,6 +7,8 @@ INSTALL_REQUIRES = [
     "chardet>=4.0.0",
     "aiohttp>=3.9.1",
     "cachetools>=5.3.2",
+    "orjson>=3.9.10",
+    "zstandard>=0.22.0",
     "spacy>=3.7.2",
     "textstat>=0.7.3",
     "rake-nltk>=1.0.6",
@@ -25,6 +27,7 @@ EXTRAS_REQUIRE = {
         "pytest-cov>=4.1.0",
         "pytest-mock>=3.12.0",
         "pytest-asyncio>=0.23.2",
+        "pytest-xdist>=3.6.1",
         "black>=23.11.0",
         "flake8>=6.1.0",
         "mypy>=1.7.1",
@@ -40,6 +43,7 @@ EXTRAS_REQUIRE = {
         "pytest-cov>=4.1.0",
         "pytest-mock>=3.12.0",
         "pytest-asyncio>=0.23.2",
+        "pytest-xdist>=3.6.1",
     ],
 }
 
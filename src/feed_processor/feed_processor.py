@@ -1,9 +1,14 @@
+import asyncio
+import functools
 import json
 import os
+import sys
 import time
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
+import aiohttp
 import requests
 import structlog
 
@@ -13,6 +18,17 @@ from .priority_queue import Priority, PriorityQueue, QueueItem
 from .webhook_manager import WebhookManager
 
 
+INOREADER_STREAM_URL = (
+    "https://www.inoreader.com/reader/api/0/stream/contents/user/-/state/com.google/reading-list"
+)
+
+
+# Feeds repeat publication timestamps across pages and polls
+_parse_iso = functools.lru_cache(maxsize=1024)(datetime.fromisoformat)
+
+_REQUIRED_FIELDS = itemgetter("id", "title", "summary")
+
+
 class FeedProcessor:
     """Main processor for handling feed items from Inoreader.
 
@@ -35,6 +51,9 @@ class FeedProcessor:
         metrics (MetricsCollector): Collects metrics for feed processing performance
     """
 
+    # Lower-cased category labels that make an item high priority
+    HIGH_PRIORITY_CATEGORIES = frozenset({"breaking news"})
+
     def __init__(
         self,
         inoreader_token: str,
@@ -102,15 +121,9 @@ class FeedProcessor:
             The response includes a 'continuation' token for pagination and
             an 'items' list containing the feed entries.
         """
-        url = "https://www.inoreader.com/reader/api/0/stream/contents/user/-/state/com.google/reading-list"
-        headers = {
-            "Authorization": f"Bearer {self.inoreader_token}",
-            "Content-Type": "application/json",
-        }
-        params = {"n": 100}  # Fetch 100 items at a time
-
-        if continuation:
-            params["c"] = continuation
+        url = INOREADER_STREAM_URL
+        headers = self._api_headers()
+        params = self._fetch_params(continuation)
 
         response = None
         try:
@@ -136,7 +149,62 @@ class FeedProcessor:
             )
             return {}
 
-    def _process_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    async def _fetch_feeds_async(
+        self, session: aiohttp.ClientSession, continuation: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch one page of feed items from Inoreader without blocking.
+
+        Async counterpart of _fetch_feeds with the same metrics and error handling.
+
+        Args:
+            session: HTTP session to issue the request on
+            continuation: Pagination token from previous API response
+
+        Returns:
+            Dict containing feed items and pagination info, or empty dict on error
+        """
+        url = INOREADER_STREAM_URL
+        params = self._fetch_params(continuation)
+
+        status = None
+        try:
+            start_time = time.time()
+            async with session.get(url, headers=self._api_headers(), params=params) as response:
+                status = response.status
+                response.raise_for_status()
+                data = await response.json()
+            self.metrics.record("api_latency", time.time() - start_time)
+            self.metrics.increment("api_requests", labels={"status": "success"})
+            return data
+        except Exception as e:
+            self.metrics.increment("api_requests", labels={"status": "failed"})
+            self.error_handler.handle_error(
+                error=e,
+                category=ErrorCategory.API_ERROR,
+                severity=ErrorSeverity.HIGH,
+                service="inoreader",
+                details={"url": url, "params": params, "response_status": status},
+            )
+            return {}
+
+    def _api_headers(self) -> Dict[str, str]:
+        """Build the Inoreader API request headers."""
+        return {
+            "Authorization": f"Bearer {self.inoreader_token}",
+            "Content-Type": "application/json",
+        }
+
+    @staticmethod
+    def _fetch_params(continuation: Optional[str]) -> Dict[str, Any]:
+        """Build the query parameters for one page of the reading list."""
+        params = {"n": 100}  # Fetch 100 items at a time
+        if continuation:
+            params["c"] = continuation
+        return params
+
+    def _process_item(
+        self, item: Dict[str, Any], processed_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Process and validate a single feed item.
 
         This method transforms raw feed items into a standardized format,
@@ -144,6 +212,8 @@ class FeedProcessor:
 
         Args:
             item: Raw feed item from Inoreader API
+            processed_at: Processing timestamp shared by the item's page;
+                defaults to the current time
 
         Returns:
             Processed item with standardized fields, or empty dict if validation fails
@@ -160,26 +230,32 @@ class FeedProcessor:
         """
         try:
             # Validate required fields
-            if not all(key in item for key in ["id", "title", "summary"]):
-                raise ValueError("Missing required fields")
+            try:
+                item_id, title, summary = _REQUIRED_FIELDS(item)
+            except KeyError:
+                raise ValueError("Missing required fields") from None
 
             # Validate nested fields
-            if not isinstance(item.get("summary"), dict):
+            if not isinstance(summary, dict):
                 raise ValueError("Invalid summary format")
-            if not isinstance(item.get("canonical"), list) or not item.get("canonical"):
+            canonical = item.get("canonical")
+            if not isinstance(canonical, list) or not canonical:
                 raise ValueError("Invalid canonical URL format")
 
             return {
-                "id": item["id"],
-                "title": item["title"],
+                "id": item_id,
+                "title": title,
                 "author": item.get("author", ""),
-                "content": item["summary"].get("content", ""),
-                "url": item["canonical"][0].get("href", ""),
+                "content": summary.get("content", ""),
+                "url": canonical[0].get("href", ""),
                 "published": datetime.fromtimestamp(
                     item.get("published", 0), tz=timezone.utc
                 ).isoformat(),
-                "categories": [cat.get("label", "") for cat in item.get("categories", [])],
-                "processed_at": datetime.now(timezone.utc).isoformat(),
+                # Category labels repeat across items; intern to share one copy each
+                "categories": [
+                    sys.intern(cat.get("label", "")) for cat in item.get("categories", [])
+                ],
+                "processed_at": processed_at or datetime.now(timezone.utc).isoformat(),
             }
         except Exception as e:
             self.error_handler.handle_error(
@@ -219,32 +295,7 @@ class FeedProcessor:
             if not items:
                 break
 
-            for item in items:
-                processed_item = self._process_item(item)
-                if not processed_item:
-                    continue
-
-                # Determine priority based on item attributes
-                priority = self._determine_priority(processed_item)
-
-                queue_item = QueueItem(
-                    id=processed_item["id"],
-                    priority=priority,
-                    content=processed_item,
-                    timestamp=datetime.now(timezone.utc),
-                )
-
-                try:
-                    if self.queue.enqueue(queue_item):
-                        items_queued += 1
-                except Exception as e:
-                    self.error_handler.handle_error(
-                        error=e,
-                        category=ErrorCategory.SYSTEM_ERROR,
-                        severity=ErrorSeverity.HIGH,
-                        service="feed_processor",
-                        details={"queue_item": queue_item},
-                    )
+            items_queued += self._queue_items(items)
 
             continuation = response.get("continuation")
             if not continuation:
@@ -254,7 +305,87 @@ class FeedProcessor:
         self.logger.info("items_queued", count=items_queued, queue_size=self.queue.size)
         return items_queued
 
-    def _determine_priority(self, item: Dict[str, Any]) -> Priority:
+    async def fetch_and_queue_items_async(self) -> int:
+        """Fetch items from Inoreader and queue them, prefetching the next page.
+
+        Same pipeline as fetch_and_queue_items, but when a page carries a
+        continuation token the request for the following page is started
+        before the current page is processed, overlapping network latency
+        with processing.
+
+        Returns:
+            Number of items successfully queued
+        """
+        items_queued = 0
+
+        async with aiohttp.ClientSession() as session:
+            next_page = asyncio.create_task(self._fetch_feeds_async(session))
+            while True:
+                response = await next_page
+                items = response.get("items", []) if response else []
+                if not items:
+                    break
+
+                continuation = response.get("continuation")
+                if continuation:
+                    next_page = asyncio.create_task(self._fetch_feeds_async(session, continuation))
+
+                # Queue in a worker thread so the prefetch runs meanwhile
+                items_queued += await asyncio.to_thread(self._queue_items, items)
+
+                if not continuation:
+                    break
+
+        self.metrics.set_gauge("queue_size", self.queue.size)
+        self.logger.info("items_queued", count=items_queued, queue_size=self.queue.size)
+        return items_queued
+
+    def _queue_items(self, items: List[Dict[str, Any]]) -> int:
+        """Process one page of raw feed items and add them to the priority queue.
+
+        Args:
+            items: Raw feed items from one API response
+
+        Returns:
+            Number of items successfully queued
+        """
+        # Computed once per page and passed down, since pages may be queued
+        # concurrently from worker threads
+        cutoff = self._start_of_today()
+        processed_at = datetime.now(timezone.utc).isoformat()
+
+        items_queued = 0
+        for item in items:
+            processed_item = self._process_item(item, processed_at)
+            if not processed_item:
+                continue
+
+            # Determine priority based on item attributes
+            priority = self._determine_priority(processed_item, cutoff)
+
+            queue_item = QueueItem(
+                id=processed_item["id"],
+                priority=priority,
+                content=processed_item,
+                timestamp=datetime.now(timezone.utc),
+            )
+
+            try:
+                if self.queue.enqueue(queue_item):
+                    items_queued += 1
+            except Exception as e:
+                self.error_handler.handle_error(
+                    error=e,
+                    category=ErrorCategory.SYSTEM_ERROR,
+                    severity=ErrorSeverity.HIGH,
+                    service="feed_processor",
+                    details={"queue_item": queue_item},
+                )
+        return items_queued
+
+    def _determine_priority(
+        self, item: Dict[str, Any], cutoff: Optional[datetime] = None
+    ) -> Priority:
         """Determine priority of a feed item based on its attributes.
 
         This method implements the priority determination logic:
@@ -264,6 +395,7 @@ class FeedProcessor:
 
         Args:
             item: Processed feed item with standardized fields
+            cutoff: Start of today, shared by the item's page; computed when omitted
 
         Returns:
             Priority level (HIGH, NORMAL, or LOW)
@@ -273,14 +405,17 @@ class FeedProcessor:
             and overriding this method.
         """
         # Example priority rules - customize based on requirements
-        if any(cat.lower() == "breaking news" for cat in item["categories"]):
+        if not self.HIGH_PRIORITY_CATEGORIES.isdisjoint(cat.lower() for cat in item["categories"]):
             return Priority.HIGH
-        elif datetime.fromisoformat(item["published"]) > datetime.now(timezone.utc).replace(
-            hour=0, minute=0
-        ):
+        elif _parse_iso(item["published"]) > (cutoff or self._start_of_today()):
             return Priority.NORMAL
         return Priority.LOW
 
+    @staticmethod
+    def _start_of_today() -> datetime:
+        """Get the cutoff after which an item counts as published today."""
+        return datetime.now(timezone.utc).replace(hour=0, minute=0)
+
     def process_queue(self, batch_size: int = 10) -> int:
         """Process items from the queue and deliver via webhook.
 
@@ -3,6 +3,9 @@ from unittest.mock import Mock
 
 import pytest
 
+# Pin the small spaCy model before any pipeline is constructed
+os.environ.setdefault("FEEDPROC_NLP_MODEL", "en_core_web_sm")
+
 
 @pytest.fixture(autouse=True)
 def mock_env_vars(monkeypatch):
@@ -26,3 +29,27 @@ def mock_webhook_manager():
     manager = Mock()
     manager.send_webhook.return_value = Mock(success=True, status_code=200)
     return manager
+
+
+@pytest.fixture
+def bulk_items():
+    """Build copies of a content item that differ only in their URL.
+
+    Copies share the base item's field values instead of re-validating
+    them, so large batches stay cheap to build.
+    """
+
+    def build(base, n):
+        url = str(base.sourceMetadata.originalUrl).rstrip("/")
+        return [
+            base.model_copy(
+                update={
+                    "sourceMetadata": base.sourceMetadata.model_copy(
+                        update={"originalUrl": f"{url}/{i}"}
+                    )
+                }
+            )
+            for i in range(n)
+        ]
+
+    return build
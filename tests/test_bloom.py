@@ -0,0 +1,41 @@
+"""Tests for the Bloom filter."""
+
+import pytest
+
+from feed_processor.storage.bloom import BloomFilter
+
+
+def test_added_keys_are_always_found():
+    """Test that the filter has no false negatives."""
+    bloom = BloomFilter(expected_items=1000)
+    keys = [f"https://example.com/{i}" for i in range(1000)]
+    bloom.update(keys)
+
+    assert all(key in bloom for key in keys)
+
+
+def test_false_positive_rate_is_near_target():
+    """Test unseen keys are rarely reported as present at the sized load."""
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+    bloom.update(f"https://example.com/{i}" for i in range(1000))
+
+    false_positives = sum(f"https://other.example.com/{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+@pytest.mark.parametrize("expected_items", [1, 100, 1000, 12_345])
+def test_indexes_are_distinct_in_power_of_two_filter(expected_items):
+    """Test the double-hashing indexes of a key never repeat."""
+    bloom = BloomFilter(expected_items)
+
+    assert bloom.size & (bloom.size - 1) == 0
+    for i in range(100):
+        indexes = bloom._indexes(f"https://example.com/{i}")
+        assert len(set(indexes)) == min(bloom.hash_count, bloom.size)
+
+
+@pytest.mark.parametrize("expected_items, rate", [(0, 0.01), (10, 0.0), (10, 1.0)])
+def test_invalid_sizing_is_rejected(expected_items, rate):
+    """Test that impossible filter sizes raise ValueError."""
+    with pytest.raises(ValueError):
+        BloomFilter(expected_items, rate)
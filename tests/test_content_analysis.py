@@ -1,5 +1,9 @@
 """Tests for content analysis package."""
 
+from typing import Final
+
+import pytest
+
 from feed_processor.content_analysis import (
     CategoryTaxonomy,
     ContentCategorizer,
@@ -8,13 +12,56 @@ from feed_processor.content_analysis import (
 )
 from feed_processor.content_analysis.nlp_pipeline import NLPPipeline
 
+# Categorizer corpora, shared so repeated runs hit identical strings
+TECH_TEXT: Final[str] = (
+    "Python is a popular programming language used in "
+    "artificial intelligence and machine learning."
+)
+MIXED_TEXT: Final[str] = (
+    "The new AI model shows promising results in medical diagnosis. "
+    "The startup secured $10M in funding for their healthcare technology."
+)
+TITLED_TEXT: Final[str] = "The model shows promising results in various applications."
+TITLED_TITLE: Final[str] = "New AI Technology Breakthrough"
+
+EMERGING_INITIAL_DOCS = (
+    "Traditional software development",
+    "Programming basics",
+)
+EMERGING_NEW_DOCS = (
+    "AI is transforming industries",
+    "Machine learning revolution",
+    "AI applications growing",
+)
+
+# Tests sharing a model are pinned to one xdist worker (``--dist=loadgroup``)
+# so the module-scoped fixtures below load each model once per worker.
+
+
+@pytest.fixture(scope="module")
+def nlp_pipeline():
+    """Shared NLP pipeline."""
+    return NLPPipeline()
 
-def test_nlp_pipeline_basic():
+
+@pytest.fixture(scope="module")
+def categorizer():
+    """Shared content categorizer."""
+    return ContentCategorizer()
+
+
+@pytest.fixture(scope="module")
+def sentiment_analyzer():
+    """Shared sentiment analyzer."""
+    return SentimentAnalyzer()
+
+
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_nlp_pipeline_basic(nlp_pipeline):
     """Test basic NLP pipeline functionality."""
-    pipeline = NLPPipeline()
     text = "This is a test sentence with some important keywords."
 
-    result = pipeline.process_text(text)
+    result = nlp_pipeline.process_text(text)
     assert result.sentences
     assert result.tokens
     assert result.lemmas
@@ -24,21 +71,21 @@ def test_nlp_pipeline_basic():
     assert result.entities
 
 
-def test_nlp_pipeline_keywords():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_nlp_pipeline_keywords(nlp_pipeline):
     """Test keyword extraction."""
-    pipeline = NLPPipeline()
     text = "Python is a great programming language. Developers love Python."
-    result = pipeline.process_text(text)
+    result = nlp_pipeline.process_text(text)
 
     assert "python" in [kw.lower() for kw in result.keywords]
     assert "programming" in [kw.lower() for kw in result.keywords]
 
 
-def test_nlp_pipeline_noun_phrases():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_nlp_pipeline_noun_phrases(nlp_pipeline):
     """Test noun phrase extraction."""
-    pipeline = NLPPipeline()
     text = "This is a simple test sentence. Another simple sentence."
-    result = pipeline.process_text(text)
+    result = nlp_pipeline.process_text(text)
 
     assert result.noun_phrases
     assert isinstance(result.noun_phrases, list)
@@ -65,110 +112,100 @@ def test_taxonomy_keywords():
     assert "technology" in tech_category.keywords
 
 
-def test_categorizer_basic():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_categorizer_basic(categorizer):
     """Test basic categorization."""
-    categorizer = ContentCategorizer()
-    text = (
-        "Python is a popular programming language used in "
-        "artificial intelligence and machine learning."
-    )
-    result = categorizer.categorize(text)
+    result = categorizer.categorize(TECH_TEXT)
 
     assert result.primary_category
     assert result.confidence_scores[result.primary_category.name] > 0.7
     assert len(result.categories) >= 1
 
 
-def test_categorizer_mixed_content():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_categorizer_mixed_content(categorizer):
     """Test categorization with mixed content."""
-    categorizer = ContentCategorizer()
-    text = """
-    The new AI model shows promising results in medical diagnosis.
-    The startup secured $10M in funding for their healthcare technology.
-    """
-    result = categorizer.categorize(text)
+    result = categorizer.categorize(MIXED_TEXT)
 
     assert result.primary_category
     assert len(result.secondary_categories) == 2
 
 
-def test_categorizer_with_title():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_categorizer_with_title(categorizer):
     """Test categorization with title."""
-    categorizer = ContentCategorizer()
-    text = "The model shows promising results in various applications."
-    title = "New AI Technology Breakthrough"
-    result = categorizer.categorize(text, title=title)
+    result = categorizer.categorize(TITLED_TEXT, title=TITLED_TITLE)
 
     assert result.primary_category
     assert "technology" in result.primary_category.name.lower()
 
 
-def test_categorizer_confidence_scores():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_categorizer_confidence_scores(categorizer):
     """Test confidence scores in categorization."""
-    categorizer = ContentCategorizer()
     text = "AI and machine learning are transforming industries"
     categories = categorizer.categorize(text)
 
     assert all(0 <= cat.confidence <= 1.0 for cat in categories)
 
 
-def test_categorizer_empty_input():
+@pytest.mark.xdist_group("nlp_pipeline")
+def test_categorizer_empty_input(categorizer):
     """Test categorization with empty input."""
-    categorizer = ContentCategorizer()
     result = categorizer.categorize("")
 
     assert result.primary_category  # Should still return a category
     assert result.confidence_scores  # Should have default scores
 
 
-def test_sentiment_basic():
+@pytest.mark.xdist_group("sentiment")
+def test_sentiment_basic(sentiment_analyzer):
     """Test basic sentiment analysis."""
-    analyzer = SentimentAnalyzer()
     text = "AI is making great progress in technology"
-    result = analyzer.analyze(text)
+    result = sentiment_analyzer.analyze(text)
 
     assert result.overall_sentiment in [-1, 0, 1]
     assert result.confidence > 0
 
 
-def test_entity_sentiment():
+@pytest.mark.xdist_group("sentiment")
+def test_entity_sentiment(sentiment_analyzer):
     """Test entity-level sentiment."""
-    analyzer = SentimentAnalyzer()
     text = "Apple products are great but Microsoft software has issues."
     entities = ["Apple", "Microsoft"]
-    result = analyzer.analyze(text, entities=entities)
+    result = sentiment_analyzer.analyze(text, entities=entities)
 
     assert "Apple" in result.entity_sentiments
     assert "Microsoft" in result.entity_sentiments
     assert result.entity_sentiments["Apple"] > result.entity_sentiments["Microsoft"]
 
 
-def test_aspect_sentiment():
+@pytest.mark.xdist_group("sentiment")
+def test_aspect_sentiment(sentiment_analyzer):
     """Test aspect-based sentiment."""
-    analyzer = SentimentAnalyzer()
     text = "The performance is excellent but reliability is terrible."
     aspects = ["performance", "reliability"]
-    result = analyzer.analyze(text, aspects=aspects)
+    result = sentiment_analyzer.analyze(text, aspects=aspects)
 
     assert result.aspect_sentiments["performance"] > 0
     assert result.aspect_sentiments["reliability"] < 0
 
 
-def test_sentence_sentiment():
+@pytest.mark.xdist_group("sentiment")
+def test_sentence_sentiment(sentiment_analyzer):
     """Test sentence-level sentiment."""
-    analyzer = SentimentAnalyzer()
     text = "I love this! But I hate that."
-    result = analyzer.analyze(text)
+    result = sentiment_analyzer.analyze(text)
 
     assert len(result.sentence_sentiments) == 2
     assert result.sentence_sentiments[0][1] > 0  # First sentence positive
     assert result.sentence_sentiments[1][1] < 0  # Second sentence negative
 
 
-def test_empty_input_sentiment():
+@pytest.mark.xdist_group("sentiment")
+def test_empty_input_sentiment(sentiment_analyzer):
     """Test sentiment analysis with empty input."""
-    analyzer = SentimentAnalyzer()
-    result = analyzer.analyze("")
+    result = sentiment_analyzer.analyze("")
 
     assert result.overall_sentiment == 0
     assert not result.sentence_sentiments
@@ -176,22 +213,23 @@ def test_empty_input_sentiment():
     assert not result.aspect_sentiments
 
 
-def test_mixed_sentiment():
+@pytest.mark.xdist_group("sentiment")
+def test_mixed_sentiment(sentiment_analyzer):
     """Test sentiment analysis with mixed sentiment."""
-    analyzer = SentimentAnalyzer()
     text = """
     The interface is beautiful and user-friendly.
     However, the system performance is slow and unreliable.
     Customer service was helpful but pricing is too expensive.
     """
     aspects = ["interface", "performance", "service", "pricing"]
-    result = analyzer.analyze(text, aspects=aspects)
+    result = sentiment_analyzer.analyze(text, aspects=aspects)
 
     assert result.overall_sentiment != 0  # Should have non-zero overall sentiment
     assert any(sentiment > 0 for aspect, sentiment in result.aspect_sentiments.items())
     assert any(sentiment < 0 for aspect, sentiment in result.aspect_sentiments.items())
 
 
+@pytest.mark.xdist_group("topics")
 def test_topic_extraction_basic():
     """Test basic topic extraction."""
     analyzer = TopicAnalyzer()
@@ -207,6 +245,7 @@ def test_topic_extraction_basic():
     assert all(topic.keywords for topic in result.topics)
 
 
+@pytest.mark.xdist_group("topics")
 def test_topic_document_assignment():
     """Test topic-document assignment."""
     analyzer = TopicAnalyzer()
@@ -217,6 +256,7 @@ def test_topic_document_assignment():
     assert all(len(topics) > 0 for topics in result.document_topics.values())
 
 
+@pytest.mark.xdist_group("topics")
 def test_topic_trends():
     """Test topic trend analysis."""
     analyzer = TopicAnalyzer()
@@ -237,29 +277,22 @@ def test_topic_trends():
     assert len(result2.topics) >= len(result1.topics)
 
 
+@pytest.mark.xdist_group("topics")
 def test_emerging_topics():
     """Test emerging topics detection."""
     analyzer = TopicAnalyzer()
-    initial_docs = [
-        "Traditional software development",
-        "Programming basics",
-    ]
-    new_docs = [
-        "AI is transforming industries",
-        "Machine learning revolution",
-        "AI applications growing",
-    ]
 
     # Train on initial docs
-    analyzer.extract_topics(initial_docs, min_cluster_size=2)
+    analyzer.extract_topics(list(EMERGING_INITIAL_DOCS), min_cluster_size=2)
 
     # Analyze new docs
-    result = analyzer.extract_topics(new_docs, min_cluster_size=2)
+    result = analyzer.extract_topics(list(EMERGING_NEW_DOCS), min_cluster_size=2)
 
     assert result.emerging_topics
     assert any("ai" in topic.name.lower() for topic in result.emerging_topics)
 
 
+@pytest.mark.xdist_group("topics")
 def test_related_topics():
     """Test related topics detection."""
     analyzer = TopicAnalyzer()
@@ -275,6 +308,7 @@ def test_related_topics():
     assert any(len(related) > 0 for related in result.related_topics.values())
 
 
+@pytest.mark.xdist_group("topics")
 def test_topic_coherence():
     """Test topic coherence calculation."""
     analyzer = TopicAnalyzer()
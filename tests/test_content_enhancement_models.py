@@ -4,6 +4,26 @@ import pytest
 
 from feed_processor.content_enhancement.models import ContentItem, EnhancementResult
 
+# Fixed timestamp: these tests never depend on the wall clock
+PUBLISHED_DATE = datetime(2024, 1, 1)
+
+# Baseline arguments for negative-path tests; each case overrides one field
+VALID_CONTENT_ITEM_KWARGS = {
+    "title": "Test Title",
+    "content": "Test content",
+    "source_url": "https://example.com",
+    "published_date": PUBLISHED_DATE,
+    "metadata": {},
+}
+VALID_ENHANCEMENT_RESULT_KWARGS = {
+    "summary": "Test summary",
+    "key_points": ["Point 1"],
+    "verified_facts": [],
+    "credibility_score": 0.5,
+    "quality_score": 0.5,
+    "processing_metadata": {},
+}
+
 
 class TestContentItem:
     @pytest.fixture
@@ -12,7 +32,7 @@ class TestContentItem:
             title="Test Title",
             content="Test content body",
             source_url="https://example.com/article",
-            published_date=datetime.utcnow(),
+            published_date=PUBLISHED_DATE,
             metadata={"author": "John Doe", "category": "Technology"},
         )
 
@@ -25,38 +45,19 @@ class TestContentItem:
         assert valid_content_item.metadata["author"] == "John Doe"
         assert valid_content_item.metadata["category"] == "Technology"
 
-    def test_content_item_invalid_url(self):
-        """Test that ContentItem raises ValueError for invalid URLs"""
-        with pytest.raises(ValueError, match="Invalid URL format"):
-            ContentItem(
-                title="Test",
-                content="Test",
-                source_url="invalid-url",
-                published_date=datetime.utcnow(),
-                metadata={},
-            )
-
-    def test_content_item_empty_title(self):
-        """Test that ContentItem raises ValueError for empty title"""
-        with pytest.raises(ValueError, match="Title cannot be empty"):
-            ContentItem(
-                title="",
-                content="Test content",
-                source_url="https://example.com",
-                published_date=datetime.utcnow(),
-                metadata={},
-            )
-
-    def test_content_item_empty_content(self):
-        """Test that ContentItem raises ValueError for empty content"""
-        with pytest.raises(ValueError, match="Content cannot be empty"):
-            ContentItem(
-                title="Test Title",
-                content="",
-                source_url="https://example.com",
-                published_date=datetime.utcnow(),
-                metadata={},
-            )
+    @pytest.mark.parametrize(
+        "field,value,message",
+        [
+            ("source_url", "invalid-url", "Invalid URL format"),
+            ("title", "", "Title cannot be empty"),
+            ("content", "", "Content cannot be empty"),
+        ],
+    )
+    def test_content_item_invalid_field(self, field, value, message):
+        """Test that ContentItem raises ValueError for each invalid field"""
+        kwargs = {**VALID_CONTENT_ITEM_KWARGS, field: value}
+        with pytest.raises(ValueError, match=message):
+            ContentItem(**kwargs)
 
 
 class TestEnhancementResult:
@@ -83,48 +84,17 @@ class TestEnhancementResult:
         assert valid_enhancement_result.quality_score == 0.9
         assert valid_enhancement_result.processing_metadata["processing_time"] == 1.5
 
-    def test_enhancement_result_invalid_score(self):
-        """Test that EnhancementResult raises ValueError for invalid scores"""
-        with pytest.raises(ValueError, match="Credibility score must be between 0 and 1"):
-            EnhancementResult(
-                summary="Test",
-                key_points=[],
-                verified_facts=[],
-                credibility_score=1.5,  # Invalid score > 1
-                quality_score=0.5,
-                processing_metadata={},
-            )
-
-        with pytest.raises(ValueError, match="Quality score must be between 0 and 1"):
-            EnhancementResult(
-                summary="Test",
-                key_points=[],
-                verified_facts=[],
-                credibility_score=0.5,
-                quality_score=-0.1,  # Invalid score < 0
-                processing_metadata={},
-            )
-
-    def test_enhancement_result_empty_summary(self):
-        """Test that EnhancementResult raises ValueError for empty summary"""
-        with pytest.raises(ValueError, match="Summary cannot be empty"):
-            EnhancementResult(
-                summary="",
-                key_points=["Point 1"],
-                verified_facts=[],
-                credibility_score=0.5,
-                quality_score=0.5,
-                processing_metadata={},
-            )
-
-    def test_enhancement_result_invalid_facts(self):
-        """Test that EnhancementResult validates fact format"""
-        with pytest.raises(ValueError, match="Invalid fact format"):
-            EnhancementResult(
-                summary="Test summary",
-                key_points=["Point 1"],
-                verified_facts=[{"invalid_key": "value"}],  # Missing required fact fields
-                credibility_score=0.5,
-                quality_score=0.5,
-                processing_metadata={},
-            )
+    @pytest.mark.parametrize(
+        "field,value,message",
+        [
+            ("credibility_score", 1.5, "Credibility score must be between 0 and 1"),
+            ("quality_score", -0.1, "Quality score must be between 0 and 1"),
+            ("summary", "", "Summary cannot be empty"),
+            ("verified_facts", [{"invalid_key": "value"}], "Invalid fact format"),
+        ],
+    )
+    def test_enhancement_result_invalid_field(self, field, value, message):
+        """Test that EnhancementResult raises ValueError for each invalid field"""
+        kwargs = {**VALID_ENHANCEMENT_RESULT_KWARGS, field: value}
+        with pytest.raises(ValueError, match=message):
+            EnhancementResult(**kwargs)
@@ -4,6 +4,7 @@ This module contains test cases for the content enhancement pipeline,
 which processes and enhances content items with additional information.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from unittest import mock
 
@@ -12,6 +13,9 @@ import pytest
 from feed_processor.content_enhancement.pipeline import ContentEnhancementPipeline
 from feed_processor.storage.models import ContentItem, ContentType
 
+# Fixed publication time; no test depends on the wall clock
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestContentEnhancementPipeline:
     """Test suite for the ContentEnhancementPipeline class.
@@ -25,7 +29,7 @@ class TestContentEnhancementPipeline:
         """Create a ContentEnhancementPipeline instance for testing."""
         return ContentEnhancementPipeline(min_content_length=10)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_content_item(self):
         """Create a valid content item for testing."""
         return ContentItem(
@@ -33,12 +37,12 @@ class TestContentEnhancementPipeline:
             title="Test Article",
             content=("This is a test article with sufficient content for processing."),
             url="https://example.com/test",
-            published_at=datetime.now(timezone.utc),
+            published_at=_NOW,
             content_type=ContentType.ARTICLE,
             metadata={},
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def short_content_item(self):
         """Create a content item with insufficient content."""
         return ContentItem(
@@ -46,7 +50,7 @@ class TestContentEnhancementPipeline:
             title="Short Test",
             content="Too short",
             url="https://example.com/short",
-            published_at=datetime.now(timezone.utc),
+            published_at=_NOW,
             content_type=ContentType.ARTICLE,
             metadata={},
         )
@@ -79,13 +83,35 @@ class TestContentEnhancementPipeline:
             title="Empty Test",
             content="",
             url="https://example.com/empty",
-            published_at=datetime.now(timezone.utc),
+            published_at=_NOW,
             content_type=ContentType.ARTICLE,
             metadata={},
         )
         result = await pipeline.process_item(empty_item)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_process_item_concurrency(self, pipeline, valid_content_item):
+        """Test that summary generation and fact extraction run concurrently."""
+        both_started = asyncio.Event()
+        started = []
+
+        async def fake_step(name, result):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return result
+
+        pipeline._generate_summary = lambda content: fake_step("summary", "Summary")
+        pipeline._extract_facts = lambda content: fake_step("facts", [])
+
+        result = await pipeline.process_item(valid_content_item)
+
+        assert result is not None
+        assert result["summary"] == "Summary"
+        assert sorted(started) == ["facts", "summary"]
+
     @pytest.mark.asyncio
     async def test_quality_score_calculation(self, pipeline, valid_content_item):
         """Test quality score calculation."""
@@ -119,7 +145,7 @@ class TestContentEnhancementPipeline:
                 title="Test",
                 content=content,
                 url="https://example.com",
-                published_at=datetime.now(timezone.utc),
+                published_at=_NOW,
                 content_type=ContentType.ARTICLE,
                 metadata={},
             )
@@ -141,26 +167,17 @@ class TestContentEnhancementPipeline:
     @pytest.mark.asyncio
     async def test_process_content_success(self, pipeline, valid_content_item):
         """Test successful content processing."""
-        # Mock fact extraction and verification
-        pipeline.llm_manager.generate_summary.return_value = "Test summary"
-        pipeline.llm_manager.extract_facts.return_value = "Fact 1\nFact 2"
-
-        # Mock fact verification with high confidence
-        pipeline.fact_checker.verify_fact.return_value = mock.Mock(
-            confidence=0.9, verified=True, source="test"
-        )
-
         result = await pipeline.process_item(valid_content_item)
 
-        # Verify the result
+        # Short content is its own summary; fact extraction finds nothing yet
+        content = valid_content_item.content
         assert isinstance(result, dict)
-        assert result["summary"] == "Test summary"
-        assert len(result["facts"]) > 0  # Should have verified facts
-        assert result["quality_score"] > 0  # Should have positive quality score
-
-        # Verify method calls
-        pipeline.llm_manager.generate_summary.assert_called_once()
-        pipeline.llm_manager.extract_facts.assert_called_once()
+        assert result["id"] == valid_content_item.id
+        assert result["summary"] == content
+        assert result["facts"] == []
+        assert result["quality_score"] == round(0.3 * len(content) / 1000 + 0.4, 2)
+        assert result["metadata"]["has_summary"] is True
+        assert result["metadata"]["fact_count"] == 0
 
     @pytest.mark.asyncio
     async def test_process_content_failure(self, pipeline, valid_content_item):
@@ -323,14 +340,14 @@ class TestContentEnhancementPipeline:
             title="",
             content="",
             url="https://test.com/empty",
-            published_at=datetime.now(timezone.utc),
+            published_at=_NOW,
             content_type=ContentType.ARTICLE,
             metadata={},
         )
 
         # Test empty content and summary
         score = pipeline._calculate_relevance_score("", empty_content)
-        assert score == 0.8  # Default score on error
+        assert score == 0.0  # Nothing to compare
 
         # Test completely irrelevant summary
         irrelevant_summary = "Something completely unrelated to the content"
@@ -338,6 +355,6 @@ class TestContentEnhancementPipeline:
         assert score < 0.3  # Low relevance score
 
         # Test highly relevant summary
-        relevant_summary = "Artificial Intelligence and Machine Learning progress"
+        relevant_summary = "A test article with sufficient content"
         score = pipeline._calculate_relevance_score(relevant_summary, valid_content_item)
         assert score > 0.7  # High relevance score
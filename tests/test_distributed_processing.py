@@ -1,5 +1,6 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -13,6 +14,9 @@ from feed_processor.distributed.worker_manager import (
     WorkerStatus,
 )
 
+# Fixed publication time; no test depends on the wall clock
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestWorkerNode:
     @pytest.fixture
@@ -46,7 +50,7 @@ class TestWorkerNode:
         assert worker_node.is_healthy()
 
         # Old heartbeat
-        worker_node.last_heartbeat = datetime.utcnow() - timedelta(minutes=5)
+        worker_node.last_heartbeat = time.monotonic() - 300
         assert not worker_node.is_healthy()
 
         # Update heartbeat
@@ -79,7 +83,7 @@ class TestHealthMonitor:
     async def test_health_check_unhealthy_workers(self, health_monitor, mock_worker_nodes):
         """Test health check with unhealthy workers"""
         # Make one worker unhealthy
-        mock_worker_nodes[1].last_heartbeat = datetime.utcnow() - timedelta(minutes=2)
+        mock_worker_nodes[1].last_heartbeat = time.monotonic() - 120
 
         for node in mock_worker_nodes:
             health_monitor.register_worker(node)
@@ -92,7 +96,7 @@ class TestHealthMonitor:
     async def test_worker_recovery(self, health_monitor, mock_worker_nodes):
         """Test worker recovery after being unhealthy"""
         worker = mock_worker_nodes[0]
-        worker.last_heartbeat = datetime.utcnow() - timedelta(minutes=2)
+        worker.last_heartbeat = time.monotonic() - 120
         health_monitor.register_worker(worker)
 
         # First check - worker should be unhealthy
@@ -119,13 +123,13 @@ class TestTaskDistributor:
             for i in range(3)
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def test_content_item(self):
         return ContentItem(
             title="Test Article",
             content="Test content",
             source_url="https://example.com/test",
-            published_date=datetime.utcnow(),
+            published_date=_NOW,
             metadata={},
         )
 
@@ -351,7 +355,7 @@ class TestWorkerManager:
         await worker_manager.register_worker(worker)
 
         # Simulate worker failure
-        worker.last_heartbeat = datetime.utcnow() - timedelta(minutes=5)
+        worker.last_heartbeat = time.monotonic() - 300
         await worker_manager.handle_worker_failure(worker)
 
         assert worker not in worker_manager.get_active_workers()
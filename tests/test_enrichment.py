@@ -1,6 +1,9 @@
 """Tests for the content enrichment module."""
 
 import logging
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -47,6 +50,24 @@ def test_entity_identification(enricher, sample_text):
     # Check for location entities
     assert any(text == "california" for text, label in entity_labels if label == "GPE")
 
+    # The batch path returns one entity list per text, matching the single path
+    batched = enricher.identify_and_link_entities([sample_text, sample_text])
+    assert len(batched) == 2
+    assert all({e.text.lower() for e in batch} == entity_texts for batch in batched)
+
+
+def test_entity_identification_batch_uses_nlp_pipe():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.nlp = Mock()
+    enricher.nlp.pipe.return_value = iter([Mock(ents=()), Mock(ents=())])
+    enricher.logger = logging.getLogger(__name__)
+
+    results = enricher.identify_and_link_entities(["first text", "second text"])
+
+    assert results == [[], []]
+    enricher.nlp.pipe.assert_called_once()
+    enricher.nlp.assert_not_called()
+
 
 def test_fact_verification(enricher):
     claims = ["The Earth orbits around the Sun.", "The Moon is made of cheese."]
@@ -75,6 +96,213 @@ def test_entity_linking_with_wikipedia(mock_page, mock_search, enricher):
     assert apple_entity.kb_id == "https://en.wikipedia.org/wiki/Apple_Inc."
 
 
+def test_entity_linking_runs_lookups_concurrently():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    # Both lookups must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(query, results=3):
+        barrier.wait()
+        return [query]
+
+    ents = [
+        SimpleNamespace(text="Apple", label_="ORG", _=SimpleNamespace()),
+        SimpleNamespace(text="Google", label_="ORG", _=SimpleNamespace()),
+        SimpleNamespace(text="Apple", label_="ORG", _=SimpleNamespace()),
+    ]
+    with patch("wikipedia.search", side_effect=search) as mock_search, patch(
+        "wikipedia.page", side_effect=lambda title, auto_suggest: Mock(url=title, summary="")
+    ):
+        entities = enricher._link_doc_entities(SimpleNamespace(ents=ents))
+
+    assert [e.text for e in entities] == ["Apple", "Google", "Apple"]
+    assert all(e.kb_id is not None for e in entities)
+    # Repeated entities are looked up once
+    assert mock_search.call_count == 2
+
+
+def test_entity_linking_batch_shares_lookups_across_texts():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    # Lookups for both texts must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(query, results=3):
+        barrier.wait()
+        return [query]
+
+    def ent(text):
+        return SimpleNamespace(text=text, label_="ORG", _=SimpleNamespace())
+
+    enricher.nlp = Mock()
+    enricher.nlp.pipe.return_value = iter(
+        [
+            SimpleNamespace(ents=(ent("Apple"),)),
+            SimpleNamespace(ents=()),
+            SimpleNamespace(ents=(ent("Google"), ent("Apple"))),
+        ]
+    )
+    with patch("wikipedia.search", side_effect=search) as mock_search, patch(
+        "wikipedia.page", side_effect=lambda title, auto_suggest: Mock(url=title, summary="")
+    ):
+        results = enricher.identify_and_link_entities(["first", "second", "third"])
+
+    assert [[e.kb_id for e in entities] for entities in results] == [
+        ["Apple company"],
+        [],
+        ["Google company", "Apple company"],
+    ]
+    # Entities repeated across texts are looked up once
+    assert mock_search.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entity_linking_inside_running_loop():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    ents = [
+        SimpleNamespace(text="Apple", label_="ORG", _=SimpleNamespace()),
+        SimpleNamespace(text="Apple", label_="ORG", _=SimpleNamespace()),
+    ]
+
+    # asyncio.run would raise here, so entities are linked sequentially instead
+    with patch("wikipedia.search", return_value=["Apple Inc."]) as mock_search, patch(
+        "wikipedia.page", side_effect=lambda title, auto_suggest: Mock(url=title, summary="")
+    ):
+        entities = enricher._link_doc_entities(SimpleNamespace(ents=ents))
+
+    assert [e.kb_id for e in entities] == ["Apple Inc.", "Apple Inc."]
+    assert mock_search.call_count == 1
+
+
+def test_fact_verification_runs_claims_concurrently():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    enricher.nlp = Mock()
+    enricher.nlp.pipe.side_effect = lambda claims: (
+        SimpleNamespace(ents=[SimpleNamespace(text=claim.split()[0], label_="ORG")])
+        for claim in claims
+    )
+    enricher._fact_checker_lock = threading.Lock()
+    enricher.fact_checker = Mock(return_value={"labels": ["unrelated"], "scores": [0.9]})
+    # Evidence lookups for both claims must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(query, results=2):
+        barrier.wait()
+        return [query]
+
+    with patch("wikipedia.search", side_effect=search), patch(
+        "wikipedia.page", side_effect=lambda title, auto_suggest: Mock(url=title, summary=title)
+    ):
+        fact_checks = enricher.verify_facts(["Apple makes phones.", "Google runs search."])
+
+    assert [fc.claim for fc in fact_checks] == ["Apple makes phones.", "Google runs search."]
+    assert [fc.sources for fc in fact_checks] == [["Apple"], ["Google"]]
+
+
+@pytest.mark.asyncio
+async def test_fact_verification_inside_running_loop():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    enricher.nlp = Mock()
+    enricher.nlp.pipe.side_effect = lambda claims: (
+        SimpleNamespace(ents=[SimpleNamespace(text=claim.split()[0], label_="ORG")])
+        for claim in claims
+    )
+    enricher._fact_checker_lock = threading.Lock()
+    enricher.fact_checker = Mock(return_value={"labels": ["unrelated"], "scores": [0.9]})
+
+    # asyncio.run would raise here, so claims are verified sequentially instead
+    with patch("wikipedia.search", side_effect=lambda query, results=2: [query]), patch(
+        "wikipedia.page", side_effect=lambda title, auto_suggest: Mock(url=title, summary=title)
+    ):
+        fact_checks = enricher.verify_facts(["Apple makes phones.", "Google runs search."])
+
+    assert [fc.sources for fc in fact_checks] == [["Apple"], ["Google"]]
+
+
+def test_fact_verification_never_calls_classifier_concurrently():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    enricher.nlp = Mock()
+    enricher.nlp.pipe.side_effect = lambda claims: (
+        SimpleNamespace(ents=[SimpleNamespace(text=claim.split()[0], label_="ORG")])
+        for claim in claims
+    )
+    enricher._fact_checker_lock = threading.Lock()
+    active = []
+    overlaps = []
+
+    def classify(sequences, candidate_labels, hypothesis_template):
+        active.append(None)
+        overlaps.append(len(active) > 1)
+        time.sleep(0.01)
+        active.pop()
+        return {"labels": ["unrelated"], "scores": [0.9]}
+
+    enricher.fact_checker = classify
+    claims = [f"Company{i} makes phones." for i in range(4)]
+
+    with patch("wikipedia.search", side_effect=lambda query, results=2: [query]), patch(
+        "wikipedia.page", side_effect=lambda title, auto_suggest: Mock(url=title, summary=title)
+    ):
+        fact_checks = enricher.verify_facts(claims)
+
+    assert len(fact_checks) == 4
+    assert overlaps == [False] * 4
+
+
+def test_fact_verification_survives_batched_parse_failure():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher.logger = logging.getLogger(__name__)
+    enricher.nlp = Mock()
+    enricher.nlp.pipe.side_effect = RuntimeError("batch failed")
+
+    def parse(claim):
+        if claim.startswith("Broken"):
+            raise RuntimeError("cannot parse")
+        return SimpleNamespace(ents=[])
+
+    enricher.nlp.side_effect = parse
+    enricher._fact_checker_lock = threading.Lock()
+    enricher.fact_checker = Mock()
+
+    fact_checks = enricher.verify_facts(["Apple makes phones.", "Broken claim here."])
+
+    assert [fc.verification_status for fc in fact_checks] == ["UNCERTAIN", "UNCERTAIN"]
+    assert fact_checks[0].confidence == 0.3
+    assert "cannot parse" in fact_checks[1].explanation
+
+
+def test_classify_batch_uses_single_pipeline_call():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher._fact_checker_lock = threading.Lock()
+    enricher.fact_checker = Mock(
+        return_value=[
+            {"labels": ["claim", "unrelated"], "scores": [0.9, 0.1]},
+            {"labels": ["unrelated", "claim"], "scores": [0.8, 0.2]},
+        ]
+    )
+
+    results = enricher._classify_batch(["ev1", "ev2"], ["claim", "unrelated"], "{}")
+
+    assert len(results) == 2
+    enricher.fact_checker.assert_called_once()
+    assert enricher._classify_batch([], ["claim"], "{}") == []
+
+
+def test_classify_batch_wraps_single_result():
+    enricher = ContentEnricher.__new__(ContentEnricher)
+    enricher._fact_checker_lock = threading.Lock()
+    enricher.fact_checker = Mock(return_value={"labels": ["claim"], "scores": [0.9]})
+
+    assert enricher._classify_batch(["ev1"], ["claim"], "{}") == [
+        {"labels": ["claim"], "scores": [0.9]}
+    ]
+
+
 def test_process_content(enricher, sample_text):
     result = enricher.process_content(sample_text)
 
@@ -108,6 +336,15 @@ def test_entity_properties():
     assert entity.links["wikipedia"] == "https://en.wikipedia.org/wiki/Apple_Inc."
 
 
+def test_entities_are_immutable_and_hashable():
+    entity = Entity(text="Apple", label="ORG", links={"wikipedia": "https://example.com"})
+    duplicate = Entity(text="Apple", label="ORG", links={"wikipedia": "https://example.com"})
+
+    assert len({entity, duplicate}) == 1
+    with pytest.raises(AttributeError):
+        entity.text = "Google"
+
+
 def test_fact_check_properties():
     fact_check = FactCheck(
         claim="The Earth is round",
@@ -1,7 +1,8 @@
 """Tests for feed collector implementation."""
 import asyncio
+import sqlite3
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -33,8 +34,8 @@ def sample_items():
 def mock_storage():
     """Fixture providing a mock storage instance."""
     storage = MagicMock()
-    storage.is_duplicate.return_value = False
-    storage.store_item.return_value = True
+    storage.filter_duplicates.return_value = set()
+    storage.store_items.side_effect = len
     return storage
 
 
@@ -43,6 +44,7 @@ def mock_client(sample_items):
     """Fixture providing a mock Inoreader client."""
     client = MagicMock()
     client.get_stream_contents = AsyncMock(return_value=sample_items)
+    client.close = AsyncMock()
     return client
 
 
@@ -56,6 +58,7 @@ def collector(mock_storage, mock_client):
     )
 
     collector = FeedCollector(config)
+    collector.storage.close()
     collector.storage = mock_storage
     collector.client = mock_client
     return collector
@@ -67,23 +70,41 @@ async def test_collect_feeds(collector, sample_items, mock_storage):
     await collector.collect_feeds()
 
     assert collector.client.get_stream_contents.called
-    assert mock_storage.store_item.call_count == len(sample_items)
+    assert mock_storage.filter_duplicates.call_count == 1
+    assert mock_storage.store_items.call_count == 1
+    assert len(mock_storage.store_items.call_args[0][0]) == len(sample_items)
 
 
 @pytest.mark.asyncio
 async def test_collect_feeds_with_duplicates(collector, sample_items, mock_storage):
     """Test collecting feeds with duplicate items."""
-    mock_storage.is_duplicate.return_value = True
+    mock_storage.filter_duplicates.side_effect = set
 
     await collector.collect_feeds()
 
-    assert mock_storage.store_item.call_count == 0
+    assert mock_storage.store_items.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_collect_feeds_counts_concurrently_stored_items_as_duplicates(
+    collector, sample_items, mock_storage
+):
+    """Test items another writer stored after the lookup are duplicates, not errors."""
+    mock_storage.store_items.side_effect = lambda items: len(items) - 1
+    collector.items_total = MagicMock()
+
+    await collector.collect_feeds()
+
+    collector.items_total.labels.assert_any_call(status="success")
+    collector.items_total.labels.assert_any_call(status="duplicate")
+    assert call(status="error") not in collector.items_total.labels.call_args_list
+    assert not mock_storage.log_error.called
 
 
 @pytest.mark.asyncio
 async def test_collect_feeds_with_storage_error(collector, sample_items, mock_storage):
     """Test collecting feeds with storage errors."""
-    mock_storage.store_item.return_value = False
+    mock_storage.store_items.side_effect = Exception("Storage error")
 
     await collector.collect_feeds()
 
@@ -109,6 +130,20 @@ async def test_start_and_stop(collector):
 
     assert not collector.running
     assert collector.collect_feeds.called
+    # The pooled client session and the storage are closed once the loop exits
+    collector.client.close.assert_awaited_once()
+    collector.storage.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_context_exit_closes_storage(collector, mock_storage):
+    """Test leaving the collector context closes the client and the storage."""
+    async with collector:
+        pass
+
+    assert not collector.running
+    collector.client.close.assert_awaited_once()
+    mock_storage.close.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -131,3 +166,29 @@ async def test_collection_error_handling(collector, mock_storage):
 
     assert mock_storage.log_error.called
     assert mock_storage.log_error.call_args[0] == ("collection_error", "Test error")
+
+
+@pytest.mark.asyncio
+async def test_context_exit_optimizes_and_closes_sqlite_storage(tmp_path):
+    """Test the real storage is closed, running PRAGMA optimize, on context exit."""
+    config = FeedCollectorConfig(
+        inoreader=InoreaderConfig(app_id="test_app", api_key="test_key", token="test_token"),
+        storage=SQLiteConfig(db_path=str(tmp_path / "collector.db")),
+    )
+    collector = FeedCollector(config)
+    collector.client = MagicMock(close=AsyncMock())
+    storage = collector.storage
+    statements = []
+    storage._get_connection().set_trace_callback(statements.append)
+
+    with patch.object(storage, "close", wraps=storage.close) as close:
+        async with collector:
+            storage.log_error("collection_error", "buffered")
+
+    close.assert_called_once()
+    assert "PRAGMA optimize" in statements
+    assert storage._connections == []
+    assert not storage._flush_thread.is_alive()
+    # The buffered error was committed before the connections closed
+    with sqlite3.connect(config.storage.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM error_log").fetchone()[0] == 1
@@ -1,10 +1,11 @@
 """Unit tests for the feed processor module."""
 
+import json
 from datetime import datetime, timezone
 
 import pytest
 
-from feed_processor.content_queue import ContentQueue
+from feed_processor.content_queue import ContentQueue, QueueItem
 from feed_processor.database import Database
 from feed_processor.error_handler import ErrorHandler
 from feed_processor.processor import FeedProcessor
@@ -12,6 +13,11 @@ from feed_processor.storage.airtable_client import AirtableConfig
 from feed_processor.webhook_manager import WebhookResponse
 
 
+# Publication timestamps are fixed, so derive them once
+PUBLISHED_ITEM_1 = int(datetime(2024, 12, 13, tzinfo=timezone.utc).timestamp())
+PUBLISHED_ITEM_2 = int(datetime(2024, 12, 12, tzinfo=timezone.utc).timestamp())
+
+
 def create_mock_inoreader_response():
     """Create a mock Inoreader response for testing purposes.
 
@@ -26,7 +32,7 @@ def create_mock_inoreader_response():
                 "author": "Test Author",
                 "summary": {"content": "Test content"},
                 "canonical": [{"href": "http://test.com/article1"}],
-                "published": int(datetime(2024, 12, 13, tzinfo=timezone.utc).timestamp()),
+                "published": PUBLISHED_ITEM_1,
                 "categories": [{"label": "Technology"}, {"label": "Breaking News"}],
             },
             {
@@ -35,7 +41,7 @@ def create_mock_inoreader_response():
                 "author": "Test Author 2",
                 "summary": {"content": "Test content 2"},
                 "canonical": [{"href": "http://test.com/article2"}],
-                "published": int(datetime(2024, 12, 12, tzinfo=timezone.utc).timestamp()),
+                "published": PUBLISHED_ITEM_2,
                 "categories": [{"label": "Technology"}],
             },
         ],
@@ -43,17 +49,37 @@ def create_mock_inoreader_response():
     }
 
 
+_MOCK_RESPONSE_JSON = json.dumps(create_mock_inoreader_response())
+
+
 @pytest.fixture
 def mock_inoreader_response():
-    """Mock Inoreader response fixture."""
-    return create_mock_inoreader_response()
+    """Mock Inoreader response fixture.
+
+    Parsed from a payload serialized once at import, so each test gets a
+    fresh copy it may mutate.
+    """
+    return json.loads(_MOCK_RESPONSE_JSON)
+
+
+@pytest.fixture(scope="session")
+def _db():
+    """In-memory database whose schema is created once per session."""
+    return Database(":memory:")
+
+
+@pytest.fixture
+def db(_db):
+    """Database fixture whose changes are rolled back after each test."""
+    with _db.transaction() as tx:
+        yield _db
+        tx.rollback()
 
 
 @pytest.fixture
-def feed_processor():
+def feed_processor(db):
     """Feed processor fixture."""
     content_queue = ContentQueue(max_size=100)
-    db = Database()
     error_handler = ErrorHandler()
     airtable_config = AirtableConfig(
         api_key="test-key", base_id="test-base", table_name="test-table"
@@ -97,6 +123,62 @@ async def test_process_item_error(feed_processor):
     assert processed == {}
 
 
+@pytest.mark.asyncio
+async def test_content_queue_put_many_and_get_batch():
+    """Test batched adds respect capacity and batched gets drain in FIFO order."""
+    queue = ContentQueue(max_size=3)
+    items = [QueueItem(id=str(i), content={}, timestamp=0.0) for i in range(4)]
+
+    assert await queue.put_many(items) == 3
+    assert len(queue) == 3
+
+    assert [item.id for item in await queue.get_batch(2)] == ["0", "1"]
+    assert [item.id for item in await queue.get_batch(10)] == ["2"]
+    assert await queue.get_batch(10) == []
+    assert queue.empty()
+
+
+def test_database_transaction_rollback(db):
+    """Test that changes made inside a rolled back transaction are discarded."""
+    feed = {
+        "id": "feed-1",
+        "feed": {
+            "title": "Test Feed",
+            "description": "Test description",
+            "link": "http://test.com/feed",
+            "pubDate": "2024-12-13T00:00:00Z",
+            "author": "Test Author",
+            "tags": ["tech"],
+        },
+    }
+
+    with db.transaction() as tx:
+        assert db.add_feed(feed)
+        assert db.get_feed_by_id("feed-1")["tags"] == ["tech"]
+        tx.rollback()
+
+    assert db.get_feed_by_id("feed-1") is None
+    assert db.get_feeds() == []
+
+
+def test_failed_add_feed_leaves_no_partial_rows(db):
+    """Test a write that fails part way on the shared connection is rolled back."""
+    feed = {
+        "id": "feed-2",
+        "feed": {
+            "title": "Broken Feed",
+            "description": "Tag cannot be stored",
+            "link": "http://test.com/broken",
+            "pubDate": "2024-12-13T00:00:00Z",
+            "author": "Test Author",
+            "tags": [object()],
+        },
+    }
+
+    assert not db.add_feed(feed)
+    assert db.get_feed_by_id("feed-2") is None
+
+
 @pytest.fixture
 def mock_send_webhook(mocker):
     """Mock the webhook sending functionality."""
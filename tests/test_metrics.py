@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
@@ -147,6 +148,26 @@ def test_batch_update():
     assert collector.get_metric("latency").average == 0.2
 
 
+def test_batch_update_with_resolved_methods():
+    """Test batch updates given as (method, name, value) tuples."""
+    collector = MetricsCollector()
+
+    collector.batch_update(
+        [
+            (collector.increment, "successes", 2),
+            (collector.set_gauge, "queue_size", 5),
+            (collector.record, "latency", 0.4),
+        ]
+    )
+
+    assert collector.get_metric("successes").value == 2
+    assert collector.get_metric("queue_size").value == 5
+    assert collector.get_metric("latency").average == 0.4
+
+    with pytest.raises(ValueError):
+        collector.batch_update({"successes": ("decrement", 1)})
+
+
 def test_webhook_retry_metrics():
     """Test webhook retry tracking metrics."""
     collector = MetricsCollector()
@@ -229,3 +250,96 @@ def test_payload_size_metrics():
     assert size_metric.average == 1194.6666666666667  # (1024 + 2048 + 512) / 3
     assert size_metric.min == 512
     assert size_metric.max == 2048
+
+
+def test_labeled_snapshot_and_record_after_reset():
+    """Test labeled series snapshot naming and histogram reuse after reset."""
+    collector = MetricsCollector()
+
+    collector.increment("items_processed", labels={"priority": "high", "feed": "a"})
+    collector.record("latency", 0.5)
+    collector.reset()
+    collector.record("latency", 0.25)
+
+    snapshot = collector.get_snapshot()
+
+    assert snapshot["items_processed{feed=a,priority=high}"]["value"] == 0
+    assert snapshot["latency"]["count"] == 1
+    assert snapshot["latency"]["min"] == 0.25
+
+
+def test_contextual_labels():
+    """Test labels applied with collector.labels() reach every call in the block."""
+    collector = MetricsCollector()
+
+    with collector.labels(attempt="1"):
+        collector.increment("webhook_retries")
+        collector.increment("webhook_retries", labels={"attempt": "2"})
+        with collector.labels(feed="a"):
+            collector.record("webhook_duration", 0.5)
+        collector.increment("webhook_retries")
+
+    collector.increment("webhook_retries")
+
+    assert collector.get_metric("webhook_retries", labels={"attempt": "1"}).value == 2
+    assert collector.get_metric("webhook_retries", labels={"attempt": "2"}).value == 1
+    assert collector.get_metric("webhook_retries").value == 1
+    histogram = collector.get_metric("webhook_duration", labels={"attempt": "1", "feed": "a"})
+    assert histogram.count == 1
+
+
+def test_concurrent_increments():
+    """Test counter increments from many threads are all counted."""
+    collector = MetricsCollector()
+
+    def worker():
+        for _ in range(1000):
+            collector.increment("items_processed", labels={"status": "ok"})
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert collector.get_metric("items_processed", {"status": "ok"}).value == 8000
+
+    # Later increments from the main thread are merged on top
+    collector.increment("items_processed", labels={"status": "ok"})
+    assert collector.get_metric("items_processed", {"status": "ok"}).value == 8001
+
+
+def test_histogram_quantiles_and_stddev():
+    """Test histogram quantile estimates and spread stay bounded in memory."""
+    collector = MetricsCollector()
+
+    for value in range(1, 5001):
+        collector.record("processing_time", float(value))
+
+    histogram = collector.get_metric("processing_time")
+    assert histogram.count == 5000
+    assert histogram.min == 1.0
+    assert histogram.max == 5000.0
+    assert histogram.stddev == pytest.approx(1443.38, rel=1e-3)
+    # The median is estimated from a bounded reservoir sample
+    assert 1500 < collector.get_quantile("processing_time", 0.5) < 3500
+
+
+def test_processing_metrics_success_rate_tracks_counters():
+    """Test the memoized success rate follows every counter change."""
+    from feed_processor.metrics.performance import ProcessingMetrics
+
+    metrics = ProcessingMetrics()
+    assert metrics.success_rate == 0.0
+    assert not hasattr(metrics, "__dict__")
+
+    metrics.increment_processed()
+    metrics.increment_processed()
+    metrics.increment_errors()
+    assert metrics.success_rate == pytest.approx(66.67, rel=0.01)
+
+    # Direct assignment and reset must not leave a stale rate behind
+    metrics.error_count = 0
+    assert metrics.success_rate == 100.0
+    metrics.reset()
+    assert metrics.success_rate == 0.0
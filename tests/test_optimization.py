@@ -61,6 +61,23 @@ class TestPerformanceOptimizer:
         assert metrics.load_average == 1.5
         assert metrics.io_wait == 5.0
 
+    @patch("psutil.cpu_percent", return_value=50.0)
+    @patch("psutil.virtual_memory", return_value=Mock(percent=60.0))
+    @patch("os.getloadavg", return_value=(1.5, 1.0, 0.5))
+    @patch("psutil.cpu_times_percent", return_value=Mock(iowait=5.0))
+    def test_get_system_metrics_reuses_recent_sample(
+        self, mock_cpu_times, mock_loadavg, mock_memory, mock_cpu_percent, optimizer
+    ):
+        """Test system metrics are sampled without blocking and cached for the TTL."""
+        first = optimizer.get_system_metrics()
+        assert optimizer.get_system_metrics() is first
+        mock_cpu_percent.assert_called_once_with(interval=None)
+        assert mock_loadavg.call_count == 1
+
+        optimizer.metrics_ttl = 0
+        assert optimizer.get_system_metrics() is not first
+        assert mock_loadavg.call_count == 2
+
     def test_calculate_optimal_batch_size_low_load(
         self, optimizer, system_metrics, processing_metrics
     ):
@@ -95,6 +112,17 @@ class TestPerformanceOptimizer:
         batch_size = optimizer.calculate_optimal_batch_size(system_metrics, processing_metrics)
         assert batch_size <= optimizer.max_batch_size
 
+    def test_processing_history_is_bounded(self, optimizer, system_metrics):
+        """Test only the most recent history_window metrics are kept for trending."""
+        for throughput in range(1, 16):
+            optimizer.calculate_optimal_batch_size(
+                system_metrics, ProcessingMetrics(0.5, 0.05, 100, float(throughput))
+            )
+
+        assert len(optimizer.processing_history) == optimizer.history_window
+        assert optimizer.processing_history[0].throughput == 6.0
+        assert optimizer.processing_history[-1].throughput == 15.0
+
     def test_get_optimal_thread_count(self, optimizer, system_metrics):
         """Test thread count calculation."""
         # Low CPU usage should allow more threads
@@ -28,8 +28,8 @@ def mock_airtable_client():
 @pytest.fixture
 def mock_content_queue():
     queue = MagicMock(spec=ContentQueue)
-    queue.size = 0
-    queue.is_empty.return_value = True
+    queue.size.return_value = 0
+    queue.get.return_value = []
     return queue
 
 
@@ -119,8 +119,7 @@ async def test_process_and_store_batch_success(
 ):
     """Test successful processing and storing of a batch."""
     # Setup
-    mock_content_queue.is_empty.side_effect = [False, False, True]
-    mock_content_queue.dequeue.side_effect = [
+    mock_content_queue.get.return_value = [
         QueuedContent(
             content_id=item.source_id, content=item.dict(), timestamp=datetime.now(timezone.utc)
         )
@@ -133,21 +132,21 @@ async def test_process_and_store_batch_success(
     # Assert
     assert processed_count == len(sample_content_items)
     assert mock_airtable_client.create_records.called
-    assert mock_content_queue.dequeue.call_count == len(sample_content_items)
+    mock_content_queue.get.assert_called_once_with(pipeline.batch_size)
 
 
 @pytest.mark.asyncio
 async def test_process_and_store_batch_empty_queue(pipeline, mock_content_queue):
     """Test processing with empty queue."""
     # Setup
-    mock_content_queue.is_empty.return_value = True
+    mock_content_queue.get.return_value = []
 
     # Execute
     processed_count = await pipeline.process_and_store_batch()
 
     # Assert
     assert processed_count == 0
-    assert not mock_content_queue.dequeue.called
+    mock_content_queue.get.assert_called_once_with(pipeline.batch_size)
 
 
 @pytest.mark.asyncio
@@ -156,8 +155,7 @@ async def test_process_and_store_batch_error(
 ):
     """Test error handling during batch processing."""
     # Setup
-    mock_content_queue.is_empty.side_effect = [False, False, True]
-    mock_content_queue.dequeue.side_effect = [
+    mock_content_queue.get.return_value = [
         QueuedContent(
             content_id=item.source_id, content=item.dict(), timestamp=datetime.now(timezone.utc)
         )
@@ -207,3 +205,54 @@ async def test_metrics_initialization(pipeline):
 
     for metric in expected_metrics:
         assert metric in metrics
+
+
+@pytest.mark.asyncio
+async def test_process_and_store_batch_stores_chunks_concurrently():
+    """Test batches are stored in concurrent chunks and only failed chunks requeue."""
+    queue = MagicMock()
+    queue.size.return_value = 0
+    items = [{"source_id": f"item{i}"} for i in range(25)]
+    queue.get.return_value = [
+        QueuedContent(
+            content_id=item["source_id"], content=item, timestamp=datetime.now(timezone.utc)
+        )
+        for item in items
+    ]
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create_records(records):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if records[0]["source_id"] == "item10":
+            raise Exception("Storage Error")
+
+    airtable_client = MagicMock()
+    airtable_client.create_records = AsyncMock(side_effect=create_records)
+    pipeline = InoreaderToAirtablePipeline(
+        inoreader_client=AsyncMock(),
+        airtable_client=airtable_client,
+        content_queue=queue,
+        batch_size=25,
+        notifier=AsyncMock(),
+    )
+
+    processed_count = await pipeline.process_and_store_batch()
+
+    assert processed_count == 25
+    assert [len(call.args[0]) for call in airtable_client.create_records.call_args_list] == [
+        10,
+        10,
+        5,
+    ]
+    assert max_in_flight == 3
+    requeued = [call.args[0].content_id for call in queue.enqueue.call_args_list]
+    assert requeued == [f"item{i}" for i in range(10, 20)]
+    pipeline.notifier.notify.assert_awaited_once()
+    # Reported as the queue length, not the bound size method
+    assert pipeline.notifier.notify.await_args.args[0].metadata["queue_size"] == 0
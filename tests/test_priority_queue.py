@@ -55,3 +55,29 @@ class TestPriorityQueue:
 
         dequeued = queue.dequeue()
         assert dequeued == item3
+
+    def test_get_next_orders_by_packed_key(self):
+        queue = PriorityQueue()
+        now = datetime.now(timezone.utc)
+        for item_id, priority in [("a", Priority.HIGH), ("b", Priority.LOW), ("c", Priority.LOW)]:
+            queue.add(QueueItem(item_id, {}, priority, now))
+
+        # Ascending priority value, newest first among equal priorities
+        assert [queue.get_next().id for _ in range(3)] == ["c", "b", "a"]
+        assert queue.get_next() is None
+
+    def test_priority_metrics_track_counts(self):
+        queue = PriorityQueue()
+        now = datetime.now(timezone.utc)
+        for item_id in "abc":
+            queue.add(QueueItem(item_id, {}, Priority.LOW, now))
+        queue.add(QueueItem("d", {}, Priority.URGENT, now))
+        queue.get_next()
+
+        assert queue.items_by_priority.labels(priority="low")._value.get() == 2
+        assert queue.items_by_priority.labels(priority="urgent")._value.get() == 1
+
+        removed_before = queue.items_removed.labels(priority="low")._value.get()
+        queue.clear()
+        assert queue.items_by_priority.labels(priority="low")._value.get() == 0
+        assert queue.items_removed.labels(priority="low")._value.get() == removed_before + 2
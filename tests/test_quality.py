@@ -1,4 +1,5 @@
 """Tests for content quality scoring functionality."""
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -97,3 +98,60 @@ def test_engagement_score(quality_scorer):
     assert (
         result.engagement_score > 0.4
     )  # Expect higher engagement due to questions and varied structure
+
+
+def test_repeated_content_is_parsed_once(quality_scorer, mock_nlp_pipeline):
+    """Test re-parsing identical content reuses the cached document."""
+    mock_nlp_pipeline.process = Mock(side_effect=lambda text: object())
+    text = "A headline syndicated to many feeds. It appears again and again."
+
+    doc = quality_scorer._parse(text)
+
+    assert quality_scorer._parse(text) is doc
+    assert quality_scorer._parse(text + " Updated.") is not doc
+    assert mock_nlp_pipeline.process.call_count == 2
+
+    quality_scorer.clear_cache()
+    assert quality_scorer._parse(text) is not doc
+    assert mock_nlp_pipeline.process.call_count == 3
+
+
+class FakeDoc(list):
+    """Token list standing in for a parsed spaCy document."""
+
+    def __init__(self, tokens, ents=()):
+        super().__init__(tokens)
+        self.ents = tuple(ents)
+
+    @property
+    def sents(self):
+        return [self]
+
+
+def test_repetition_flag_counts_content_words():
+    """Test the repetition flag fires when one content word dominates the text."""
+
+    def make_doc(words):
+        return FakeDoc(
+            SimpleNamespace(is_alpha=True, is_stop=word == "the", lower_=word) for word in words
+        )
+
+    repetitive = make_doc(["cat", "the", "cat", "sat", "the", "cat"] * 20)
+    varied = make_doc([f"word{i}" for i in range(120)])
+    scorer = ContentQualityScorer(Mock(), Mock())
+    neutral = Mock(compound_score=0.0)
+
+    assert "excessive_repetition" in scorer._identify_quality_issues(repetitive, 0.8, neutral)
+    assert "excessive_repetition" not in scorer._identify_quality_issues(varied, 0.8, neutral)
+
+
+def test_fact_density_counts_entities_numbers_and_indicators():
+    """Test fact density weighs entities, numbers and fact-bearing entity labels."""
+    doc = FakeDoc(
+        (SimpleNamespace(like_num=i < 2) for i in range(30)),
+        ents=[SimpleNamespace(label_="ORG"), SimpleNamespace(label_="PERSON")],
+    )
+    scorer = ContentQualityScorer(Mock(), Mock())
+
+    # (2 entities + 2 numbers + 1 fact indicator) / 30 tokens, scaled by 3
+    assert scorer._calculate_fact_density(doc) == pytest.approx(0.5)
@@ -1,13 +1,25 @@
 """Tests for SQLite storage implementation."""
 import os
-from datetime import datetime, timezone
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
-from feed_processor.storage.models import ContentItem, ContentStatus, ContentType
+from feed_processor.storage.models import (
+    ContentItem,
+    ContentStatus,
+    ContentType,
+    SourceMetadata,
+)
 from feed_processor.storage.sqlite_storage import SQLiteConfig, SQLiteStorage
 
+# Shared by every fixture and test instead of reading the clock each time
+NOW = datetime.now(timezone.utc)
+
 
 @pytest.fixture
 def test_db_path(tmp_path):
@@ -21,6 +33,7 @@ def storage(test_db_path):
     config = SQLiteConfig(db_path=test_db_path)
     storage = SQLiteStorage(config)
     yield storage
+    storage.close()
 
 
 @pytest.fixture
@@ -31,7 +44,7 @@ def sample_item():
         content="Test content",
         url="https://example.com/test",
         content_type=ContentType.BLOG,
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         source_id="test_source",
         status=ContentStatus.PENDING,
         author="Test Author",
@@ -53,6 +66,47 @@ def test_storage_initialization(test_db_path):
         assert "feed_items" in tables
         assert "error_log" in tables
 
+    storage.close()
+
+
+def test_connection_is_reused_per_thread(storage):
+    """Test one WAL connection is opened per thread and kept until close."""
+    conn = storage._get_connection()
+
+    assert storage._get_connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    storage.close()
+    assert storage._get_connection() is not conn
+
+
+def test_close_twice_leaves_error_journal_alone(test_db_path):
+    """Test a second close, as when a collector run and its context both exit, is safe."""
+    storage = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    storage.log_error("close_error", "Committed once")
+    storage.close()
+    storage._error_journal = MagicMock()
+    storage.log_error("late_error", "Written directly")
+
+    storage.close()
+
+    assert storage._error_journal.method_calls == []
+    assert storage._connections == []
+    conn = sqlite3.connect(test_db_path)
+    (count,) = conn.execute("SELECT COUNT(*) FROM error_log").fetchone()
+    conn.close()
+    assert count == 2
+
+
+def test_status_lookup_uses_index(storage):
+    """Test selecting by status probes the status index instead of scanning."""
+    plan = storage._get_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM feed_items WHERE processed_status = ?", ("new",)
+    )
+
+    assert any("idx_feed_items_status" in row["detail"] for row in plan)
+
 
 def test_store_item(storage, sample_item):
     """Test storing a content item."""
@@ -82,6 +136,7 @@ def test_duplicate_detection(storage, sample_item):
 def test_error_logging(storage):
     """Test error logging functionality."""
     storage.log_error("test_error", "Test error message")
+    storage.flush()
 
     with storage._get_connection() as conn:
         cursor = conn.cursor()
@@ -92,6 +147,78 @@ def test_error_logging(storage):
         assert row["error_message"] == "Test error message"
 
 
+def test_buffered_errors_are_committed_on_close(test_db_path):
+    """Test errors still buffered when the storage closes are committed, not lost."""
+    storage = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    for i in range(5):
+        storage.log_error("burst_error", f"Error {i}")
+    storage.close()
+
+    conn = sqlite3.connect(test_db_path)
+    messages = [row[0] for row in conn.execute("SELECT error_message FROM error_log ORDER BY id")]
+    conn.close()
+    assert messages == [f"Error {i}" for i in range(5)]
+    assert Path(f"{test_db_path}-errors").read_text() == ""
+
+
+def test_journaled_errors_are_replayed_on_open(test_db_path):
+    """Test errors journaled by a process that died before flushing are committed on open."""
+    Path(f"{test_db_path}-errors").write_text(
+        '["crash_error", "Lost in a crash", "2024-01-01 00:00:00"]\n["crash_err'
+    )
+
+    storage = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    try:
+        rows = storage._get_connection().execute("SELECT * FROM error_log").fetchall()
+        assert [(row["error_type"], row["error_message"], row["timestamp"]) for row in rows] == [
+            ("crash_error", "Lost in a crash", "2024-01-01 00:00:00")
+        ]
+    finally:
+        storage.close()
+
+
+def test_in_memory_storage_writes_no_journal_file(tmp_path, monkeypatch):
+    """Test an in-memory database keeps its error journal in memory as well."""
+    monkeypatch.chdir(tmp_path)
+
+    storage = SQLiteStorage(SQLiteConfig(db_path=":memory:"))
+    storage.log_error("memory_error", "Never on disk")
+    storage.close()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_in_memory_errors_are_flushed_in_background():
+    """Test the flush thread commits an in-memory storage's errors before it is closed."""
+    storage = SQLiteStorage(SQLiteConfig(db_path=":memory:"))
+    try:
+        for i in range(120):
+            storage.log_error("burst_error", f"Error {i}")
+
+        deadline = time.monotonic() + 5
+        while storage._error_buffer and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        (count,) = storage._get_connection().execute("SELECT COUNT(*) FROM error_log").fetchone()
+        assert count == 120
+    finally:
+        storage.close()
+
+
+def test_in_memory_storage_is_shared_across_threads(base_item, bulk_items):
+    """Test items stored from a worker thread are visible from the main thread in memory."""
+    storage = SQLiteStorage(SQLiteConfig(db_path=":memory:"))
+    try:
+        items = bulk_items(base_item, 2)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(storage.store_items, items).result() == 2
+
+        assert storage.is_duplicate(str(items[0].sourceMetadata.originalUrl))
+        assert len(storage.get_items_by_status(ContentStatus.NEW)) == 2
+    finally:
+        storage.close()
+
+
 def test_get_items_by_status(storage, sample_item):
     """Test retrieving items by status."""
     storage.store_item(sample_item)
@@ -104,18 +231,42 @@ def test_get_items_by_status(storage, sample_item):
     assert len(items) == 0
 
 
-def test_get_items_by_status_with_limit(storage, sample_item):
+@pytest.fixture
+def base_item():
+    """Fixture providing a valid content item to copy in bulk."""
+    return ContentItem(
+        title="Test Item",
+        content_type=ContentType.BLOG,
+        brief="Test content",
+        sourceMetadata=SourceMetadata(
+            feedId="test_source",
+            originalUrl="https://example.com/test",
+            publishDate=NOW,
+            author="Test Author",
+        ),
+    )
+
+
+def test_get_items_by_status_with_limit(storage, base_item, bulk_items):
     """Test retrieving items with limit."""
     # Store multiple items
-    for i in range(3):
-        item = sample_item.copy()
-        item.url = f"https://example.com/test{i}"
-        storage.store_item(item)
+    assert storage.store_items(bulk_items(base_item, 3)) == 3
 
-    items = storage.get_items_by_status(ContentStatus.PENDING, limit=2)
+    items = storage.get_items_by_status(ContentStatus.NEW, limit=2)
     assert len(items) == 2
 
 
+def test_store_items_bulk_stress(storage, base_item, bulk_items):
+    """Test a thousand items are stored in one batch well within a second."""
+    items = bulk_items(base_item, 1000)
+
+    start = time.perf_counter()
+    assert storage.store_items(items) == 1000
+    assert time.perf_counter() - start < 1.0
+
+    assert len(storage.get_items_by_status(ContentStatus.NEW)) == 1000
+
+
 def test_store_item_with_long_content(storage, sample_item):
     """Test storing item with content exceeding max length."""
     sample_item.content = "x" * 3000  # Exceeds 2000 char limit
@@ -123,3 +274,184 @@ def test_store_item_with_long_content(storage, sample_item):
 
     items = storage.get_items_by_status(ContentStatus.PENDING)
     assert len(items[0].content) == 2000  # Verify content was truncated
+
+
+def test_store_items_bulk(storage):
+    """Test storing several items at once skips URLs already stored."""
+    items = [
+        ContentItem(
+            title=f"Bulk Item {i}",
+            content_type=ContentType.BLOG,
+            brief=f"Bulk content {i}",
+            sourceMetadata=SourceMetadata(
+                feedId=f"feed/{i}",
+                originalUrl=f"https://example.com/bulk{i}",
+                publishDate=NOW + timedelta(seconds=i),
+            ),
+        )
+        for i in range(3)
+    ]
+
+    assert storage.store_items(items[:2]) == 2
+    assert storage.filter_duplicates([str(item.sourceMetadata.originalUrl) for item in items]) == {
+        "https://example.com/bulk0",
+        "https://example.com/bulk1",
+    }
+    assert storage.store_items(items) == 1
+    assert storage.store_items([]) == 0
+
+
+def test_store_items_skips_urls_stored_by_another_writer(test_db_path, base_item, bulk_items):
+    """Test URLs the Bloom filter missed are skipped as duplicates, not errors."""
+    first = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    second = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    try:
+        items = bulk_items(base_item, 2)
+        assert second.store_items(items[:1]) == 1
+
+        # The first storage never saw that URL, so it looks new
+        urls = [str(item.sourceMetadata.originalUrl) for item in items]
+        assert first.filter_duplicates(urls) == set()
+        assert first.store_items(items) == 1
+        assert len(first.get_items_by_status(ContentStatus.NEW)) == 2
+    finally:
+        first.close()
+        second.close()
+
+
+def test_store_items_batch(storage):
+    """Test items stored in one batch are all committed and readable."""
+    items = [
+        ContentItem(
+            title=f"Batch Item {i}",
+            content_type=ContentType.BLOG,
+            brief=f"Batch content {i}",
+            sourceMetadata=SourceMetadata(
+                feedId="feed/batch",
+                originalUrl=f"https://example.com/batch{i}",
+                publishDate=NOW + timedelta(seconds=i),
+                author="Batch Author",
+            ),
+        )
+        for i in range(3)
+    ]
+
+    assert storage.store_items(items) == 3
+    assert not storage._get_connection().in_transaction
+
+    stored = storage.get_items_by_status(ContentStatus.NEW, limit=2)
+    assert len(stored) == 2
+    assert {item.title for item in stored} <= {item.title for item in items}
+    assert stored[0].sourceMetadata.author == "Batch Author"
+    assert stored[0].sourceMetadata.publishDate == items[0].sourceMetadata.publishDate
+    assert len(storage.get_items_by_status(ContentStatus.NEW)) == 3
+
+
+def test_duplicate_checks_skip_queries_for_unseen_urls(test_db_path, storage):
+    """Test unseen URLs are answered by the Bloom filter and stored URLs survive reopening."""
+    item = ContentItem(
+        title="Seen Item",
+        content_type=ContentType.BLOG,
+        sourceMetadata=SourceMetadata(
+            feedId="feed/seen",
+            originalUrl="https://example.com/seen",
+            publishDate=NOW,
+        ),
+    )
+    assert storage.store_items([item]) == 1
+
+    statements = []
+    storage._get_connection().set_trace_callback(statements.append)
+    assert not storage.is_duplicate("https://example.com/unseen")
+    assert storage.filter_duplicates(["https://example.com/unseen"]) == set()
+    assert statements == []
+
+    reopened = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    try:
+        assert reopened.is_duplicate("https://example.com/seen")
+    finally:
+        reopened.close()
+
+
+def test_duplicate_lookup_uses_url_hash_index(storage):
+    """Test duplicate checks probe the hashed-URL index rather than the URL text."""
+    plan = storage._get_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT 1 FROM feed_items WHERE url_hash = ? LIMIT 1", (0,)
+    )
+
+    assert any("idx_feed_items_url_hash" in row["detail"] for row in plan)
+
+
+def test_existing_database_gains_url_hash(test_db_path):
+    """Test a database created before url_hash existed is migrated and backfilled."""
+    conn = sqlite3.connect(test_db_path)
+    conn.execute(
+        "CREATE TABLE feed_items (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+        "content_type TEXT NOT NULL, brief TEXT, feed_id TEXT, original_url TEXT UNIQUE, "
+        "publish_date TEXT, author TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, "
+        "processed_status TEXT DEFAULT 'new')"
+    )
+    conn.execute(
+        "INSERT INTO feed_items (title, content_type, original_url) VALUES (?, ?, ?)",
+        ("Old Item", "BLOG", "https://example.com/old"),
+    )
+    conn.commit()
+    conn.close()
+
+    storage = SQLiteStorage(SQLiteConfig(db_path=test_db_path))
+    try:
+        assert storage.is_duplicate("https://example.com/old")
+        assert storage.filter_duplicates(
+            ["https://example.com/old", "https://example.com/new"]
+        ) == {"https://example.com/old"}
+    finally:
+        storage.close()
+
+
+def test_store_items_truncates_long_brief(storage):
+    """Test a brief grown past the limit after validation is truncated before insert."""
+    item = ContentItem(
+        title="Long Item",
+        content_type=ContentType.BLOG,
+        brief="short",
+        sourceMetadata=SourceMetadata(
+            feedId="feed/long",
+            originalUrl="https://example.com/long",
+            publishDate=NOW,
+        ),
+    )
+    item.brief = "x" * 3000
+
+    assert storage.store_items([item]) == 1
+    assert storage.get_items_by_status(ContentStatus.NEW)[0].brief == "x" * 2000
+
+
+def test_to_airtable_records_matches_single_conversion():
+    """Test batch Airtable conversion matches converting items one at a time."""
+    items = [
+        ContentItem(
+            title=f"Item {i}" * 30,
+            content_type=ContentType.VIDEO,
+            brief=f"<p>Brief {i}</p>" if i else None,
+            sourceMetadata=SourceMetadata(
+                feedId=f"feed/{i}",
+                originalUrl=f"https://example.com/{i}",
+                publishDate=datetime(2024, 1, 1, 23, 30, tzinfo=timezone.utc),
+                author="Author" if i else None,
+            ),
+        )
+        for i in range(3)
+    ]
+
+    records = ContentItem.to_airtable_records(items)
+    assert records == [item.to_airtable_record() for item in items]
+    assert records[1]["fields"] == {
+        "Title": ("Item 1" * 30)[:99],
+        "Content Type": "VIDEO",
+        "Description": "Brief 1",
+        "FeedID": "feed/1",
+        "Link": "https://example.com/1",
+        "PublishDate": "2024-01-01",
+        "Author": "Author",
+    }
+    assert records[0]["fields"]["Description"] == ""
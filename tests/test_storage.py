@@ -5,7 +5,8 @@ from unittest.mock import Mock, call, patch
 
 import pytest
 from google.oauth2.credentials import Credentials
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 
 from feed_processor.storage import GoogleDriveStorage
 
@@ -85,6 +86,21 @@ def test_create_folder_existing(storage, mock_service):
     assert not mock_service.files().create.called
 
 
+def test_create_folder_reuses_resolved_ids(storage, mock_service):
+    """Test each folder is looked up in Drive only once per storage instance."""
+    files_list = Mock()
+    files_list.execute = Mock(return_value={"files": [{"id": "existing_folder_id"}]})
+
+    files = Mock()
+    files.list = Mock(return_value=files_list)
+    mock_service.files = Mock(return_value=files)
+
+    assert storage.create_folder("test_folder") == "existing_folder_id"
+    assert storage.create_folder("test_folder") == "existing_folder_id"
+
+    assert files.list.call_count == 1
+
+
 def test_write_json(storage, mock_service):
     """Test writing JSON data."""
     test_data = {"test": "data"}
@@ -108,7 +124,31 @@ def test_write_json(storage, mock_service):
     create_call = mock_service.files().create.call_args_list[-1]
     assert create_call.kwargs["body"]["name"] == "file.json"
     assert create_call.kwargs["body"]["parents"] == ["folder_id"]
-    assert isinstance(create_call.kwargs["media_body"], MediaFileUpload)
+    media = create_call.kwargs["media_body"]
+    assert isinstance(media, (MediaFileUpload, MediaIoBaseUpload))
+    assert json.loads(media.getbytes(0, media.size())) == test_data
+
+
+def test_write_json_resolves_deleted_folder_again(storage, mock_service):
+    """Test a 404 from a cached folder re-resolves the path and retries the upload once."""
+    files_list = Mock()
+    files_list.execute = Mock(side_effect=[{"files": [{"id": "deleted_folder_id"}]}, {"files": []}])
+    create_folder = Mock()
+    create_folder.execute = Mock(return_value={"id": "new_folder_id"})
+    stale_upload = Mock()
+    stale_upload.execute = Mock(side_effect=HttpError(Mock(status=404), b"File not found"))
+    create_file = Mock()
+    create_file.execute = Mock(return_value={"id": "file_id"})
+
+    files = Mock()
+    files.list = Mock(return_value=files_list)
+    files.create = Mock(side_effect=[stale_upload, create_folder, create_file])
+    mock_service.files = Mock(return_value=files)
+
+    assert storage.write_json("test/file.json", {"test": "data"}) == "file_id"
+
+    assert files.create.call_args_list[-1].kwargs["body"]["parents"] == ["new_folder_id"]
+    assert storage.create_folder("test") == "new_folder_id"
 
 
 def test_read_json(storage, mock_service):
@@ -1,5 +1,7 @@
 """Tests for content summarization functionality."""
 
+import sqlite3
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +10,7 @@ from feed_processor.content_analysis.summarization import (
     ContentSummarizer,
     MultiDocSummaryResult,
     SummarizationResult,
+    _get_pipeline,
 )
 
 
@@ -16,6 +19,8 @@ def mock_extractive_pipeline():
     """Create mock extractive summarization pipeline."""
 
     def mock_summarize(text, **kwargs):
+        if isinstance(text, list):
+            return [mock_summarize(item, **kwargs)[0] for item in text]
         if text == "error":
             raise Exception("Mock error")
         if len(text.split()) <= 5:
@@ -32,6 +37,8 @@ def mock_abstractive_pipeline():
     """Create mock abstractive summarization pipeline."""
 
     def mock_summarize(text, **kwargs):
+        if isinstance(text, list):
+            return [mock_summarize(item, **kwargs)[0] for item in text]
         if text == "error":
             raise Exception("Mock error")
         if len(text.split()) <= 5:
@@ -44,21 +51,60 @@ def mock_abstractive_pipeline():
 
 
 @pytest.fixture
-def summarizer(mock_extractive_pipeline, mock_abstractive_pipeline):
+def mock_pipeline(mock_extractive_pipeline, mock_abstractive_pipeline):
+    """Patch pipeline construction and reset the shared pipeline cache around each test."""
+
+    def mock_pipeline_factory(model_type, **kwargs):
+        if model_type == "summarization":
+            if kwargs.get("model") == "facebook/bart-large-cnn":
+                return mock_extractive_pipeline
+            else:
+                return mock_abstractive_pipeline
+        return Mock()
+
+    _get_pipeline.cache_clear()
+    with patch(
+        "feed_processor.content_analysis.summarization.pipeline",
+        side_effect=mock_pipeline_factory,
+    ) as mock_pipeline:
+        yield mock_pipeline
+    _get_pipeline.cache_clear()
+
+
+@pytest.fixture
+def summarizer(mock_pipeline):
     """Create ContentSummarizer with mock pipelines."""
-    with patch("transformers.pipeline") as mock_pipeline:
+    return ContentSummarizer()
+
+
+def test_pipelines_are_shared_between_summarizers(mock_pipeline):
+    """Test each model is loaded once no matter how many summarizers use it."""
+    first = ContentSummarizer()
+    second = ContentSummarizer()
+
+    assert second.extractive_pipeline is first.extractive_pipeline
+    assert second.abstractive_pipeline is first.abstractive_pipeline
+    assert mock_pipeline.call_count == 2
 
-        def mock_pipeline_factory(model_type, **kwargs):
-            if model_type == "summarization":
-                if kwargs.get("model") == "facebook/bart-large-cnn":
-                    return mock_extractive_pipeline
-                else:
-                    return mock_abstractive_pipeline
-            return Mock()
 
-        mock_pipeline.side_effect = mock_pipeline_factory
-        summarizer = ContentSummarizer()
-        return summarizer
+def test_shared_pipeline_is_never_called_concurrently(mock_pipeline):
+    """Test both roles on one model take turns instead of sharing its tokenizer."""
+    summarizer = ContentSummarizer(extractive_model="t5-base", abstractive_model="t5-base")
+    active = []
+    overlaps = []
+
+    def slow_summarize(text, **kwargs):
+        active.append(text)
+        overlaps.append(len(active) > 1)
+        time.sleep(0.05)
+        active.remove(text)
+        return [{"summary_text": "Shared model summary."}]
+
+    summarizer.extractive_pipeline = summarizer.abstractive_pipeline = slow_summarize
+    summarizer.summarize("A document long enough to need both summaries generated.")
+
+    assert summarizer._pipeline_locks["extractive"] is summarizer._pipeline_locks["abstractive"]
+    assert overlaps and not any(overlaps)
 
 
 def test_summarize_basic(summarizer):
@@ -165,6 +211,116 @@ def test_error_handling(summarizer):
         summarizer.summarize("error")
 
 
+def test_repeated_input_reuses_model_output(summarizer):
+    """Test deterministic pipeline outputs are cached per input."""
+    summarizer.extractive_pipeline = Mock(return_value=[{"summary_text": "Cached summary."}])
+    text = "A sentence that repeats across many feed items and documents."
+
+    first = summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    second = summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    summarizer._run_pipeline("extractive", text, max_length=20, do_sample=False)
+
+    assert first == second == [{"summary_text": "Cached summary."}]
+    assert summarizer.extractive_pipeline.call_count == 2
+
+    summarizer.clear_cache()
+    summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    assert summarizer.extractive_pipeline.call_count == 3
+
+
+def test_cached_outputs_are_returned_as_copies(summarizer):
+    """Test modifying a returned output does not change what the cache replays."""
+    summarizer.extractive_pipeline = Mock(return_value=[{"summary_text": "Cached summary."}])
+    text = "A sentence whose summary a caller edits in place."
+
+    first = summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    first[0]["summary_text"] = "Edited by the caller."
+    second = summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    second[0]["summary_text"] = "Edited again."
+
+    third = summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    assert third == [{"summary_text": "Cached summary."}]
+    assert summarizer.extractive_pipeline.call_count == 1
+
+
+def test_close_stops_extractive_worker(summarizer, tmp_path):
+    """Test close shuts down the extractive worker and the persistent cache."""
+    from feed_processor.content_analysis.summarization import _PersistentModelCache
+
+    summarizer._persistent_cache = _PersistentModelCache(str(tmp_path / "summaries.db"))
+    summarizer.summarize("A document long enough to need both summaries generated.")
+
+    summarizer.close()
+
+    with pytest.raises(RuntimeError):
+        summarizer._extractive_executor.submit(len, "")
+    with pytest.raises(sqlite3.ProgrammingError):
+        summarizer._persistent_cache.get(b"key")
+
+
+def test_persistent_cache_replays_outputs_after_restart(summarizer, tmp_path):
+    """Test model outputs persisted to disk are reused by a fresh cache."""
+    from feed_processor.content_analysis.summarization import _PersistentModelCache
+
+    cache_path = str(tmp_path / "cache" / "summaries.db")
+    summarizer._persistent_cache = _PersistentModelCache(cache_path)
+    summarizer.extractive_pipeline = Mock(return_value=[{"summary_text": "Stored summary."}])
+    text = "A syndicated article replayed after the service restarts."
+
+    summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+
+    # Simulate a restart: empty memory cache, database reopened from disk
+    summarizer._model_cache.clear()
+    summarizer._persistent_cache = _PersistentModelCache(cache_path)
+    result = summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+
+    assert result == [{"summary_text": "Stored summary."}]
+    assert summarizer.extractive_pipeline.call_count == 1
+
+    summarizer.clear_cache()
+    summarizer._run_pipeline("extractive", text, max_length=30, do_sample=False)
+    assert summarizer.extractive_pipeline.call_count == 2
+
+
+def test_batch_summaries_use_one_sorted_pipeline_call(summarizer):
+    """Test documents are summarized with one length-sorted call per pipeline."""
+
+    def fake_pipeline(texts, **kwargs):
+        if isinstance(texts, str):
+            return [{"summary_text": f"Point of {texts}"}]
+        return [{"summary_text": f"Summary of {text}"} for text in texts]
+
+    summarizer.extractive_pipeline = Mock(side_effect=fake_pipeline)
+    summarizer.abstractive_pipeline = Mock(side_effect=fake_pipeline)
+    documents = [
+        "A much longer document about chips and their performance gains.",
+        "Tiny doc",
+        "A short document about chips.",
+        "A much longer document about chips and their performance gains.",
+    ]
+
+    results = summarizer._summarize_batch(documents)
+
+    batch_calls = [
+        call
+        for call in summarizer.extractive_pipeline.call_args_list
+        if isinstance(call[0][0], list)
+    ]
+    assert len(batch_calls) == 2
+    assert batch_calls[0][0][0] == [documents[2], documents[0]]
+    # Key points for all documents come from one more batched call
+    assert batch_calls[1][0][0] == [f"Summary of {documents[2]}", f"Summary of {documents[0]}"]
+    assert summarizer.extractive_pipeline.call_count == 2
+    assert summarizer.abstractive_pipeline.call_count == 1
+    assert [r.extractive_summary for r in results] == [
+        f"Summary of {documents[0]}",
+        "Tiny doc",
+        f"Summary of {documents[2]}",
+        f"Summary of {documents[0]}",
+    ]
+    assert results[2].key_points == [f"Summary of Summary of {documents[2]}"]
+
+
 def test_readability_calculation(summarizer):
     """Test readability score calculation."""
     text = "This is a simple test sentence. It has good readability."
@@ -187,6 +343,15 @@ def test_coherence_calculation(summarizer):
     assert isinstance(result, float)
 
 
+def test_coherence_is_mean_adjacent_jaccard(summarizer):
+    """Test coherence averages the token Jaccard similarity of adjacent sentences."""
+    text = "AI models learn. Models learn fast. Nothing shared here"
+
+    # {models, learn} of 4 tokens, then no shared tokens out of 6
+    assert summarizer._calculate_coherence(text) == pytest.approx((2 / 4 + 0 / 6) / 2)
+    assert summarizer._calculate_coherence("Only one sentence") == 1.0
+
+
 # Test data for multi-document summarization
 TEST_ARTICLES = [
     """
@@ -260,6 +425,36 @@ def test_multi_doc_cross_references(summarizer):
         assert 0 <= ref["similarity_score"] <= 1
 
 
+def test_cross_references_match_pairwise_similarity(summarizer):
+    """Test vectorized cross-references only link significantly similar pairs."""
+    documents = [
+        "Apple announced the M3 chip today.",
+        "Bananas are rich in potassium.",
+        "Apple announced the M3 chip today!",
+    ]
+
+    refs = summarizer._generate_cross_references(documents)
+
+    assert [(r["doc1_index"], r["doc2_index"]) for r in refs] == [(0, 2)]
+    assert refs[0]["similarity_score"] == pytest.approx(1.0)
+    assert summarizer._generate_cross_references(documents[:1]) == []
+
+
+def test_similarity_is_cosine_of_tfidf_vectors(summarizer):
+    """Test pairwise similarity equals the cosine of the two TF-IDF vectors."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    text1 = "Apple announced the M3 chip today."
+    text2 = "The M3 chip from Apple ships next month."
+    matrix = TfidfVectorizer().fit_transform([text1, text2])
+
+    assert summarizer._calculate_similarity(text1, text2) == pytest.approx(
+        cosine_similarity(matrix[0:1], matrix[1:2])[0][0], rel=1e-6
+    )
+    assert summarizer._calculate_similarity("Mock one", "Mock two") == 0.8
+
+
 def test_empty_documents(summarizer):
     """Test handling of empty documents."""
     with pytest.raises(ValueError):
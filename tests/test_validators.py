@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timezone
 
 from feed_processor.validators import FeedValidationResult, FeedValidator
 
@@ -82,6 +82,25 @@ class TestFeedValidator(unittest.TestCase):
         self.assertIsNone(result.feed_type)
         self.assertIsNotNone(result.error_message)
 
+    def test_validate_unrecognized_format(self):
+        result = FeedValidator.validate_feed("   plain text")
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.error_message, "Unrecognized feed format")
+
+        result = FeedValidator.validate_feed('  {"version": "1.0"}')
+        self.assertFalse(result.is_valid)
+        self.assertIsNone(result.feed_type)
+        self.assertEqual(result.error_message, "Unknown feed format")
+
+    def test_validate_feed_with_byte_order_mark(self):
+        result = FeedValidator.validate_feed("\ufeff" + self.rss_feed)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.feed_type, "rss")
+
+        result = FeedValidator.validate_feed("\ufeff" + self.json_feed)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.feed_type, "json")
+
     def test_validate_missing_required_fields(self):
         invalid_rss = """<?xml version="1.0" encoding="UTF-8" ?>
         <rss version="2.0">
@@ -103,6 +122,32 @@ class TestFeedValidator(unittest.TestCase):
         result = FeedValidator.validate_feed(self.atom_feed)
         self.assertIsInstance(result.parsed_feed["updated"], datetime)
 
+    def test_unknown_offset_dates_are_utc(self):
+        rss_feed = self.rss_feed.replace("-0800", "-0000")
+
+        result = FeedValidator.validate_feed(rss_feed)
+        self.assertEqual(
+            result.parsed_feed["updated"], datetime(2024, 12, 13, 3, 1, 14, tzinfo=timezone.utc)
+        )
+        self.assertEqual(result.parsed_feed["entries"][0]["updated"].tzinfo, timezone.utc)
+
+    def test_parse_all_items(self):
+        items = "".join(
+            f"<item><title>Post {i}</title><link>http://example.com/{i}</link></item>"
+            for i in range(3)
+        )
+        rss_feed = (
+            "<rss><channel><title>Feed</title><link>http://example.com</link>"
+            f"{items}</channel></rss>"
+        )
+
+        result = FeedValidator.validate_feed(rss_feed)
+        self.assertTrue(result.is_valid)
+        self.assertEqual(
+            [entry["title"] for entry in result.parsed_feed["entries"]],
+            ["Post 0", "Post 1", "Post 2"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,9 @@ import pytest
 
 from feed_processor.webhook import WebhookConfig, WebhookError, WebhookManager, WebhookResponse
 
+# Computed once at import rather than on every sample_feed invocation
+NOW_ISO = datetime.now().isoformat()
+
 
 @pytest.fixture
 def webhook_config():
@@ -34,7 +37,7 @@ def sample_feed():
                 "id": "1",
                 "title": "Test Item",
                 "content": "Test Content",
-                "published": datetime.now().isoformat(),
+                "published": NOW_ISO,
             }
         ],
     }
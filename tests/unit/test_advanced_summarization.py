@@ -146,6 +146,36 @@ def test_cross_references(advanced_summarizer, sample_documents):
     assert all(ref["similarity"] > 0.5 for ref in cross_refs)
 
 
+def test_cross_references_cover_both_directions(advanced_summarizer):
+    """Test each related pair is reported both ways, in row-major order."""
+    docs = [
+        "AI and machine learning advances in NLP research",
+        "Machine learning and AI progress in NLP studies",
+        "AI and machine learning advances in NLP benchmarks",
+    ]
+    summaries = [
+        SummarizationResult(
+            extractive_summary=doc,
+            abstractive_summary=doc,
+            key_points=[],
+            summary_length=len(doc),
+            compression_ratio=1.0,
+            confidence_score=0.8,
+            metadata={},
+        )
+        for doc in docs
+    ]
+
+    cross_refs = advanced_summarizer._generate_cross_references(docs, summaries)
+
+    pairs = [(ref["source_idx"], ref["target_idx"]) for ref in cross_refs]
+    assert pairs == sorted(pairs)
+    assert all(i != j for i, j in pairs)
+    assert {(j, i) for i, j in pairs} == set(pairs)
+    scores = {(ref["source_idx"], ref["target_idx"]): ref["similarity"] for ref in cross_refs}
+    assert all(scores[i, j] == pytest.approx(scores[j, i]) for i, j in pairs)
+
+
 def test_common_themes(advanced_summarizer, sample_documents):
     """Test common theme extraction."""
     result = advanced_summarizer.multi_document_summarize(sample_documents)
@@ -180,3 +210,23 @@ def test_timeline_sorting(advanced_summarizer, sample_documents, sample_metadata
     assert result.timeline is not None
     dates = [entry["date"] for entry in result.timeline]
     assert dates == sorted(dates)  # Check if dates are in ascending order
+
+
+def test_extract_common_themes_selects_top_terms(advanced_summarizer, sample_documents):
+    """Test top-k theme selection matches ranking the full vocabulary."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(stop_words="english")
+    tfidf_matrix = vectorizer.fit_transform(sample_documents)
+    feature_names = vectorizer.get_feature_names_out()
+    avg_scores = tfidf_matrix.toarray().mean(axis=0)
+
+    index = {term: i for i, term in enumerate(feature_names)}
+
+    themes = advanced_summarizer._extract_common_themes(tfidf_matrix, feature_names, 3)
+    all_terms = advanced_summarizer._extract_common_themes(tfidf_matrix, feature_names, 10_000)
+
+    # Ascending score order, as with ranking the full vocabulary
+    assert [avg_scores[index[t]] for t in themes] == pytest.approx(sorted(avg_scores)[-3:])
+    assert sorted(all_terms) == sorted(feature_names)
+    assert advanced_summarizer._extract_common_themes(tfidf_matrix, feature_names, 0) == []
@@ -1,5 +1,7 @@
 """Unit tests for the feed processor."""
 
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
@@ -191,6 +193,26 @@ def test_rate_limiter():
             limiter.exponential_backoff(i)
 
 
+def test_rate_limiter_spaces_concurrent_callers():
+    """Test concurrent callers are spaced by the minimum interval."""
+    limiter = RateLimiter(min_interval=0.05)
+    request_times = []
+
+    def make_request():
+        limiter.wait()
+        request_times.append(time.monotonic())
+
+    threads = [threading.Thread(target=make_request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    request_times.sort()
+    gaps = [later - earlier for earlier, later in zip(request_times, request_times[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+
+
 def test_processing_metrics():
     """Test processing metrics calculations."""
     metrics = ProcessingMetrics()
@@ -10,6 +10,13 @@ from feed_processor.core.clients.inoreader import InoreaderClient
 from feed_processor.core.errors import APIError
 
 
+def _fake_resp(payload=None, code=200):
+    """Build a canned HTTP response whose json() returns ``payload``."""
+    resp = Mock(status_code=code)
+    resp.json = lambda p=payload: p
+    return resp
+
+
 @pytest.fixture
 def client():
     """Create a test instance of InoreaderClient."""
@@ -26,21 +33,20 @@ def client():
 @pytest.fixture
 def mock_response():
     """Create a mock response object."""
-    mock = Mock()
-    mock.status_code = 200
-    mock.json.return_value = {
-        "items": [
-            {
-                "id": "test-id",
-                "title": "Test Item",
-                "published": int(datetime.now().timestamp()),
-                "origin": {"streamId": "feed/test"},
-                "categories": [{"label": "test-category"}],
-            }
-        ],
-        "continuation": "test-token",
-    }
-    return mock
+    return _fake_resp(
+        {
+            "items": [
+                {
+                    "id": "test-id",
+                    "title": "Test Item",
+                    "published": int(datetime.now().timestamp()),
+                    "origin": {"streamId": "feed/test"},
+                    "categories": [{"label": "test-category"}],
+                }
+            ],
+            "continuation": "test-token",
+        }
+    )
 
 
 def test_client_initialization():
@@ -100,10 +106,7 @@ def test_get_unread_items_with_continuation(mock_request, client, mock_response)
 @patch("requests.request")
 def test_rate_limit_error(mock_request, client):
     """Test handling of rate limit errors."""
-    mock_response = Mock()
-    mock_response.status_code = 429
-    mock_response.json.return_value = {"error": "Rate limit exceeded"}
-    mock_request.return_value = mock_response
+    mock_request.return_value = _fake_resp({"error": "Rate limit exceeded"}, 429)
 
     with pytest.raises(APIError) as exc:
         client.get_unread_items()
@@ -113,10 +116,7 @@ def test_rate_limit_error(mock_request, client):
 @patch("requests.request")
 def test_authentication_error(mock_request, client):
     """Test handling of authentication errors."""
-    mock_response = Mock()
-    mock_response.status_code = 401
-    mock_response.json.return_value = {"error": "Invalid token"}
-    mock_request.return_value = mock_response
+    mock_request.return_value = _fake_resp({"error": "Invalid token"}, 401)
 
     with pytest.raises(APIError) as exc:
         client.get_unread_items()
@@ -136,7 +136,7 @@ def test_network_error(mock_request, client):
 @patch("requests.request")
 def test_mark_as_read_success(mock_request, client, mock_response):
     """Test successful marking of items as read."""
-    mock_request.return_value = Mock(status_code=200)
+    mock_request.return_value = _fake_resp()
 
     result = client.mark_as_read(["test-id-1", "test-id-2"])
     assert result is True
@@ -151,13 +151,13 @@ def test_mark_as_read_success(mock_request, client, mock_response):
 @patch("requests.request")
 def test_get_feed_metadata_success(mock_request, client):
     """Test successful retrieval of feed metadata."""
-    mock_response = Mock(status_code=200)
-    mock_response.json.return_value = {
-        "title": "Test Feed",
-        "subscribers": 100,
-        "updated": int(datetime.now().timestamp()),
-    }
-    mock_request.return_value = mock_response
+    mock_request.return_value = _fake_resp(
+        {
+            "title": "Test Feed",
+            "subscribers": 100,
+            "updated": int(datetime.now().timestamp()),
+        }
+    )
 
     result = client.get_feed_metadata("feed/test")
     assert result["title"] == "Test Feed"
@@ -188,9 +188,7 @@ def test_empty_mark_as_read(mock_request, client):
 @patch("requests.request")
 def test_retry_mechanism(mock_request, client):
     """Test retry mechanism for failed requests."""
-    mock_response_error = Mock(status_code=500)
-    mock_response_success = Mock(status_code=200, json=Mock(return_value={"items": []}))
-    mock_request.side_effect = [mock_response_error, mock_response_success]
+    mock_request.side_effect = [_fake_resp(code=500), _fake_resp({"items": []})]
 
     result = client.get_unread_items()
     assert result == {"items": []}
@@ -200,9 +198,7 @@ def test_retry_mechanism(mock_request, client):
 @patch("requests.request")
 def test_malformed_response(mock_request, client):
     """Test handling of malformed API responses."""
-    mock_response = Mock(status_code=200)
-    mock_response.json.return_value = {"invalid": "response"}
-    mock_request.return_value = mock_response
+    mock_request.return_value = _fake_resp({"invalid": "response"})
 
     with pytest.raises(APIError) as exc:
         client.get_unread_items()
@@ -0,0 +1,110 @@
+"""Unit tests for the prefetching Inoreader fetch loop in src/feed_processor."""
+
+import asyncio
+import importlib.util
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# The src tree module imports its siblings relatively, so load it as a member
+# of the feed_processor package to resolve them against the installed modules
+_SPEC = importlib.util.spec_from_file_location(
+    "feed_processor.inoreader_processor",
+    Path(__file__).parents[2] / "src" / "feed_processor" / "feed_processor.py",
+)
+inoreader_processor = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(inoreader_processor)
+
+PAGES = {
+    None: {"items": [{"id": "1"}], "continuation": "page-2"},
+    "page-2": {"items": [{"id": "2"}], "continuation": "page-3"},
+    "page-3": {"items": [{"id": "3"}]},
+}
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_queue_items_async_overlaps_fetch_with_queueing(monkeypatch):
+    """The next page is fetched while the current page is still being queued."""
+    # A real PriorityQueue registers a global gauge that other tests may already own
+    monkeypatch.setattr(
+        inoreader_processor, "PriorityQueue", lambda maxsize: SimpleNamespace(size=0)
+    )
+    processor = inoreader_processor.FeedProcessor("token", "https://example.com/hook")
+    fetched = []
+    overlapped = []
+
+    async def slow_fetch(session, continuation=None):
+        await asyncio.sleep(0.01)
+        fetched.append(continuation)
+        return PAGES[continuation]
+
+    def slow_queue(items):
+        pages_before = len(fetched)
+        time.sleep(0.05)
+        # A blocked event loop could not have finished the prefetch meanwhile
+        overlapped.append(len(fetched) > pages_before)
+        return len(items)
+
+    processor._fetch_feeds_async = slow_fetch
+    processor._queue_items = slow_queue
+
+    queued = await processor.fetch_and_queue_items_async()
+
+    assert queued == 3
+    assert fetched == [None, "page-2", "page-3"]
+    assert overlapped == [True, True, False]
+
+
+def _raw_item(item_id):
+    return {
+        "id": item_id,
+        "title": f"Item {item_id}",
+        "summary": {"content": "Body"},
+        "canonical": [{"href": f"https://example.com/{item_id}"}],
+        "published": int(time.time()),
+    }
+
+
+def test_concurrent_pages_keep_their_own_priority_cutoff(monkeypatch):
+    """Pages queued from two threads at once are prioritized against their own cutoff."""
+    monkeypatch.setattr(
+        inoreader_processor, "PriorityQueue", lambda maxsize: SimpleNamespace(size=0)
+    )
+    processor = inoreader_processor.FeedProcessor("token", "https://example.com/hook")
+    processor.queue = SimpleNamespace(size=0, enqueue=lambda item: True)
+
+    first_cutoff = datetime(2024, 12, 12, tzinfo=timezone.utc)
+    second_cutoff = datetime(2024, 12, 13, tzinfo=timezone.utc)
+    cutoffs = iter([first_cutoff, second_cutoff])
+    monkeypatch.setattr(processor, "_start_of_today", lambda: next(cutoffs))
+
+    # Both pages must have taken their cutoff before either is prioritized
+    barrier = threading.Barrier(2, timeout=5)
+    process_item = processor._process_item
+
+    def synchronized_process_item(item, *args):
+        barrier.wait()
+        return process_item(item, *args)
+
+    used_cutoffs = {}
+
+    def record_priority(item, cutoff=None):
+        used_cutoffs[item["id"]] = cutoff
+        return inoreader_processor.Priority.LOW
+
+    processor._process_item = synchronized_process_item
+    processor._determine_priority = record_priority
+
+    first = threading.Thread(target=processor._queue_items, args=([_raw_item("first")],))
+    first.start()
+    # Let the first page take its cutoff before the second starts
+    while barrier.n_waiting == 0:
+        time.sleep(0.001)
+    processor._queue_items([_raw_item("second")])
+    first.join()
+
+    assert used_cutoffs == {"first": first_cutoff, "second": second_cutoff}
@@ -1,7 +1,9 @@
 """Unit tests for the WebhookManager class."""
 
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 import requests
 
@@ -86,7 +88,7 @@ def test_validate_payload_title_too_long(webhook_manager, valid_payload, mock_me
     assert webhook_manager._validate_payload(invalid_payload) is False
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_send_batch_success(mock_post, webhook_manager, valid_payload, mock_metrics):
     """Test successful batch sending of webhooks."""
     mock_response = Mock()
@@ -101,9 +103,9 @@ def test_send_batch_success(mock_post, webhook_manager, valid_payload, mock_metr
     mock_post.assert_called_once()
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_send_batch_rate_limit(mock_post, webhook_manager, valid_payload, mock_metrics):
-    """Test handling of rate limiting in webhook sending."""
+    """Test a rate limit that outlasts every retry is reported as rate_limited."""
     mock_response = Mock()
     mock_response.status_code = 429
     mock_post.return_value = mock_response
@@ -114,9 +116,26 @@ def test_send_batch_rate_limit(mock_post, webhook_manager, valid_payload, mock_m
     assert response.status_code == 429
     assert response.error_type == "rate_limited"
     assert response.error_message == "Rate limit exceeded"
+    assert mock_post.call_count == webhook_manager.max_retries + 1
 
 
-@patch("requests.post")
+@patch("time.sleep")
+@patch("requests.Session.post")
+def test_send_batch_rate_limit_waits_for_retry_after(
+    mock_post, mock_sleep, webhook_manager, valid_payload, mock_metrics
+):
+    """Test a 429 with Retry-After is retried after the requested delay."""
+    rate_limited = Mock(status_code=429, headers={"Retry-After": "3"})
+    mock_post.side_effect = [rate_limited, Mock(status_code=200)]
+
+    response = webhook_manager.send_batch([valid_payload])
+
+    assert response.success is True
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(3.0)
+
+
+@patch("requests.Session.post")
 def test_send_batch_server_error_retry(mock_post, webhook_manager, valid_payload, mock_metrics):
     """Test retry behavior on server errors."""
     error_response = Mock()
@@ -133,7 +152,64 @@ def test_send_batch_server_error_retry(mock_post, webhook_manager, valid_payload
     assert mock_post.call_count == 2
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
+def test_send_batch_serializes_once(mock_post, webhook_manager, valid_payload, mock_metrics):
+    """Test the batch is encoded once, datetimes included, and retries resend the same body."""
+    valid_payload["fetchedAt"] = datetime(2024, 12, 12, 12, 0)
+    mock_post.side_effect = [Mock(status_code=500), Mock(status_code=200)]
+
+    assert webhook_manager.send_batch([valid_payload]).success is True
+
+    first_body, second_body = (c[1]["data"] for c in mock_post.call_args_list)
+    assert first_body is second_body
+    assert orjson.loads(first_body)["items"][0]["fetchedAt"] == "2024-12-12T12:00:00+00:00"
+
+
+@patch("requests.Session.post")
+def test_send_batch_accepts_non_string_keys(
+    mock_post, webhook_manager, valid_payload, mock_metrics
+):
+    """Test integer keys are stringified as json does instead of failing the batch."""
+    valid_payload["counts"] = {1: "one"}
+    mock_post.return_value = Mock(status_code=200)
+
+    assert webhook_manager.send_batch([valid_payload]).success is True
+    assert orjson.loads(mock_post.call_args[1]["data"])["items"][0]["counts"] == {"1": "one"}
+
+
+@patch("requests.Session.post")
+def test_send_batch_unserializable_payload(mock_post, webhook_manager, valid_payload, mock_metrics):
+    """Test a batch that cannot be encoded fails without being posted."""
+    valid_payload["raw"] = object()
+
+    response = webhook_manager.send_batch([valid_payload])
+
+    assert response.success is False
+    assert response.error_type == "invalid_payload"
+    mock_post.assert_not_called()
+
+
+def test_backoff_delay_honors_retry_after(webhook_manager, mock_metrics):
+    """Test Retry-After in seconds or as an HTTP date sets the delay, capped at the maximum."""
+    assert webhook_manager._backoff_delay(0, Mock(headers={"Retry-After": "2"})) == 2.0
+    assert webhook_manager._backoff_delay(0, Mock(headers={"Retry-After": "3600"})) == 60.0
+
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert webhook_manager._backoff_delay(0, Mock(headers={"Retry-After": past})) == 0.0
+
+
+@patch("random.uniform", side_effect=lambda low, high: high)
+def test_backoff_delay_is_jittered_exponential(mock_uniform, webhook_manager, mock_metrics):
+    """Test the fallback delay doubles per retry, is capped and then jittered."""
+    webhook_manager.max_retry_delay = 0.3
+
+    assert webhook_manager._backoff_delay(0) == pytest.approx(0.15)
+    assert webhook_manager._backoff_delay(1, Mock(headers={})) == pytest.approx(0.3)
+    assert webhook_manager._backoff_delay(5) == pytest.approx(0.45)
+    mock_uniform.assert_called_with(0.5, 1.5)
+
+
+@patch("requests.Session.post")
 def test_send_items(mock_post, webhook_manager, valid_payload, mock_metrics):
     """Test sending multiple items in batches."""
     mock_response = Mock()
@@ -150,11 +226,25 @@ def test_send_items(mock_post, webhook_manager, valid_payload, mock_metrics):
     assert mock_post.call_count == 3
 
 
+def test_send_items_keeps_batch_order(webhook_manager, valid_payload, mock_metrics):
+    """Test concurrently posted batches are reported in batch order over a pooled session."""
+    items = [valid_payload.copy() for _ in range(25)]
+
+    def post(url, data, **kwargs):
+        return Mock(status_code=200 if len(orjson.loads(data)["items"]) == 10 else 202)
+
+    with patch("requests.Session.post", side_effect=post):
+        responses = webhook_manager.send_items(items)
+
+    assert [r.status_code for r in responses] == [200, 200, 202]
+    assert webhook_manager.session.get_adapter(webhook_manager.webhook_url)._pool_maxsize == 32
+
+
 def test_batch_size_limit(webhook_manager, valid_payload, mock_metrics):
     """Test that batches don't exceed the maximum size."""
     items = [valid_payload.copy() for _ in range(15)]
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_post.return_value = mock_response
@@ -165,14 +255,14 @@ def test_batch_size_limit(webhook_manager, valid_payload, mock_metrics):
         assert len(responses) == 2
         assert mock_post.call_count == 2
 
-        # First call should have 10 items, second should have 5
-        first_call_items = mock_post.call_args_list[0][1]["json"]["items"]
-        second_call_items = mock_post.call_args_list[1][1]["json"]["items"]
-        assert len(first_call_items) == 10
-        assert len(second_call_items) == 5
+        # Batches are posted concurrently, so one call has 10 items and the other 5
+        batch_sizes = sorted(
+            len(orjson.loads(c[1]["data"])["items"]) for c in mock_post.call_args_list
+        )
+        assert batch_sizes == [5, 10]
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_connection_error_retry(mock_post, webhook_manager, valid_payload, mock_metrics):
     """Test retry behavior on connection errors."""
     mock_post.side_effect = [
@@ -2,8 +2,12 @@
 
 import time
 import unittest
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+import orjson
+import zstandard
+
 from feed_processor.webhook_manager import WebhookManager
 
 
@@ -137,3 +141,76 @@ class TestWebhookRetry(unittest.TestCase):
         # But max delay is 8, so actual delays should be: 1, 2, 4
         max_expected_duration = 7.0 + 0.5  # Adding buffer for processing time
         assert duration <= max_expected_duration
+
+    @patch("requests.post")
+    def test_compressed_payload(self, mock_post):
+        """
+        Test that batches are sent as zstd-compressed JSON when enabled.
+
+        Verifies the body decompresses to the original batch and the
+        Content-Encoding header is set.
+        """
+        mock_post.return_value.status_code = 200
+        manager = WebhookManager(
+            webhook_url="http://test.webhook", compression="zstd", compression_min_bytes=0
+        )
+        items = [{"title": "Test", "contentType": ["BLOG"]}]
+
+        result = manager.send_batch(items)
+
+        assert result.success is True
+        kwargs = mock_post.call_args[1]
+        assert kwargs["headers"]["Content-Encoding"] == "zstd"
+        body = zstandard.ZstdDecompressor().decompress(kwargs["data"])
+        assert orjson.loads(body) == {"items": items}
+
+    @patch("requests.post")
+    def test_compression_fallback_on_unsupported_encoding(self, mock_post):
+        """
+        Test that a 415 response to a compressed body falls back to identity.
+
+        Verifies the batch is resent uncompressed and compression stays disabled.
+        """
+        mock_post.side_effect = [Mock(status_code=415), Mock(status_code=200)]
+        manager = WebhookManager(
+            webhook_url="http://test.webhook", compression="zstd", compression_min_bytes=0
+        )
+
+        result = manager.send_batch([{"title": "Test", "contentType": ["BLOG"]}])
+
+        assert result.success is True
+        assert mock_post.call_count == 2
+        assert "Content-Encoding" not in mock_post.call_args[1]["headers"]
+        assert manager.compression is None
+
+    @patch("requests.post")
+    def test_batch_encoding_matches_webhook_package(self, mock_post):
+        """
+        Test that non-string keys and naive datetimes are encoded like feed_processor.webhook.
+
+        Verifies such a batch is delivered rather than rejected.
+        """
+        mock_post.return_value.status_code = 200
+
+        result = self.webhook_manager.send_batch(
+            [{"counts": {1: "one"}, "fetchedAt": datetime(2024, 12, 12, 12, 0)}]
+        )
+
+        assert result.success is True
+        assert orjson.loads(mock_post.call_args[1]["data"]) == {
+            "items": [{"counts": {"1": "one"}, "fetchedAt": "2024-12-12T12:00:00+00:00"}]
+        }
+
+    @patch("requests.post")
+    def test_unserializable_batch_fails_without_retry(self, mock_post):
+        """
+        Test that a batch orjson cannot encode is reported as a failed response.
+
+        Verifies nothing is posted and the batch is not retried.
+        """
+        result = self.webhook_manager.send_with_retry([{"title": "Test", "payload": object()}])
+
+        assert result.success is False
+        assert result.error_type == "invalid_payload"
+        assert result.retry_count == 0
+        assert mock_post.call_count == 0